@@ -0,0 +1,50 @@
+"""feat: Added keyset (type rank, magnitude, uid) index to Body model
+
+Revision ID: 3c8f1a7b5d20
+Revises: 7a3d9e2c41f6
+Create Date: 2026-10-18 16:42:10.118734
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3c8f1a7b5d20'
+down_revision = '7a3d9e2c41f6'
+branch_labels = None
+depends_on = None
+
+
+# The sort key of the bodies list, exactly as CRUDBody orders by it (MySQL only
+# uses a functional key part for an identical expression), as of this revision:
+TYPE_RANK = (
+    "coalesce(CASE body.type "
+    "WHEN 'Other' THEN 4 "
+    "WHEN '*' THEN 3 WHEN '**' THEN 3 WHEN '*Ass' THEN 3 "
+    "WHEN 'OCl' THEN 2 WHEN 'GCl' THEN 2 "
+    "WHEN 'G' THEN 1 "
+    "WHEN 'Cl+N' THEN 0 WHEN 'PN' THEN 0 WHEN 'HII' THEN 0 WHEN 'DrkN' THEN 0 "
+    "WHEN 'EmN' THEN 0 WHEN 'Neb' THEN 0 WHEN 'RfN' THEN 0 WHEN 'SNR' THEN 0 "
+    "END, -1)"
+)
+
+MAGNITUDE = "coalesce(body.apparent_magnitude, 99999)"
+
+
+def upgrade():
+    # Functional key parts require MySQL 8.0.13 or later:
+    if op.get_bind().dialect.name != 'mysql':
+        return
+
+    op.execute(
+        "CREATE INDEX ix_body_keyset ON body (({0}), ({1}), uid)".format(
+            TYPE_RANK, MAGNITUDE
+        )
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'mysql':
+        return
+
+    op.drop_index('ix_body_keyset', table_name='body')
@@ -0,0 +1,127 @@
+"""feat: Added HEALPix pixel index to Body model
+
+Revision ID: 5b1e0c7d2a94
+Revises: c125a7a551d3
+Create Date: 2026-10-18 09:12:44.381204
+
+"""
+from alembic import op
+import math
+
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1e0c7d2a94'
+down_revision = 'c125a7a551d3'
+branch_labels = None
+depends_on = None
+
+
+# The HEALPix order of the stored pixel index, as of this revision (the pixel
+# functions are frozen here, rather than imported from the app):
+HEALPIX_ORDER = 12
+
+
+def spread_bits(v):
+    result = 0
+
+    bit = 0
+
+    while v:
+        result |= (v & 1) << (2 * bit)
+        v >>= 1
+        bit += 1
+
+    return result
+
+
+def ang2pix(ra, dec, order=HEALPIX_ORDER):
+    nside = 1 << order
+
+    z = math.sin(math.radians(dec))
+
+    za = abs(z)
+
+    tt = (ra % 360.0) / 90.0
+
+    if tt >= 4.0:
+        tt = 0.0
+
+    # Equatorial Region:
+    if za <= 2.0 / 3.0:
+        temp1 = nside * (0.5 + tt)
+        temp2 = nside * (z * 0.75)
+
+        jp = int(temp1 - temp2)
+        jm = int(temp1 + temp2)
+
+        ifp = jp >> order
+        ifm = jm >> order
+
+        if ifp == ifm:
+            face = ifp | 4
+        elif ifp < ifm:
+            face = ifp
+        else:
+            face = ifm + 8
+
+        ix = jm & (nside - 1)
+        iy = nside - (jp & (nside - 1)) - 1
+    # Polar Caps:
+    else:
+        ntt = min(3, int(tt))
+
+        tp = tt - ntt
+
+        tmp = nside * math.sqrt(3.0 * (1.0 - za))
+
+        jp = min(int(tp * tmp), nside - 1)
+        jm = min(int((1.0 - tp) * tmp), nside - 1)
+
+        if z >= 0:
+            face = ntt
+            ix = nside - jm - 1
+            iy = nside - jp - 1
+        else:
+            face = ntt + 8
+            ix = jp
+            iy = jm
+
+    return (face << (2 * order)) + spread_bits(ix) + (spread_bits(iy) << 1)
+
+
+def upgrade():
+    op.add_column('body', sa.Column('healpix', sa.BigInteger(), nullable=True, comment='NESTED HEALPix Pixel Index'))
+    op.create_index(op.f('ix_body_healpix'), 'body', ['healpix'], unique=False)
+
+    # Populate the HEALPix pixel index for all existing bodies:
+    body = sa.table(
+        'body',
+        sa.column('uid', sa.String),
+        sa.column('ra', sa.Float),
+        sa.column('dec', sa.Float),
+        sa.column('healpix', sa.BigInteger),
+    )
+
+    connection = op.get_bind()
+
+    rows = connection.execute(
+        sa.select(body.c.uid, body.c.ra, body.c.dec).where(
+            body.c.ra.isnot(None), body.c.dec.isnot(None)
+        )
+    ).fetchall()
+
+    if rows:
+        connection.execute(
+            body.update().where(body.c.uid == sa.bindparam('_uid')),
+            [
+                {'_uid': uid, 'healpix': ang2pix(float(ra), float(dec))}
+                for uid, ra, dec in rows
+            ],
+        )
+
+
+def downgrade():
+    op.drop_index(op.f('ix_body_healpix'), table_name='body')
+    op.drop_column('body', 'healpix')
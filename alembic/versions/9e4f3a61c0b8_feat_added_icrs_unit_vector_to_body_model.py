@@ -0,0 +1,74 @@
+"""feat: Added ICRS unit vector to Body model
+
+Revision ID: 9e4f3a61c0b8
+Revises: 5b1e0c7d2a94
+Create Date: 2026-10-18 10:03:17.902655
+
+"""
+from alembic import op
+import math
+
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4f3a61c0b8'
+down_revision = '5b1e0c7d2a94'
+branch_labels = None
+depends_on = None
+
+
+# The ICRS unit vector of { ra, dec } (in degrees), as of this revision:
+def radec_to_vector(ra, dec):
+    ra, dec = math.radians(ra), math.radians(dec)
+
+    return (
+        math.cos(dec) * math.cos(ra),
+        math.cos(dec) * math.sin(ra),
+        math.sin(dec),
+    )
+
+
+def upgrade():
+    op.add_column('body', sa.Column('ux', sa.Float(precision=53), nullable=True, comment='ICRS Unit Vector (x) i.e., cos(dec)cos(ra)'))
+    op.add_column('body', sa.Column('uy', sa.Float(precision=53), nullable=True, comment='ICRS Unit Vector (y) i.e., cos(dec)sin(ra)'))
+    op.add_column('body', sa.Column('uz', sa.Float(precision=53), nullable=True, comment='ICRS Unit Vector (z) i.e., sin(dec)'))
+    op.create_index(op.f('ix_body_uz'), 'body', ['uz'], unique=False)
+
+    # Populate the ICRS unit vector for all existing bodies:
+    body = sa.table(
+        'body',
+        sa.column('uid', sa.String),
+        sa.column('ra', sa.Float),
+        sa.column('dec', sa.Float),
+        sa.column('ux', sa.Float),
+        sa.column('uy', sa.Float),
+        sa.column('uz', sa.Float),
+    )
+
+    connection = op.get_bind()
+
+    rows = connection.execute(
+        sa.select(body.c.uid, body.c.ra, body.c.dec).where(
+            body.c.ra.isnot(None), body.c.dec.isnot(None)
+        )
+    ).fetchall()
+
+    if rows:
+        connection.execute(
+            body.update().where(body.c.uid == sa.bindparam('_uid')),
+            [
+                dict(
+                    zip(('ux', 'uy', 'uz'), radec_to_vector(float(ra), float(dec))),
+                    _uid=uid,
+                )
+                for uid, ra, dec in rows
+            ],
+        )
+
+
+def downgrade():
+    op.drop_index(op.f('ix_body_uz'), table_name='body')
+    op.drop_column('body', 'uz')
+    op.drop_column('body', 'uy')
+    op.drop_column('body', 'ux')
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 
-from app.api.api_v1.endpoints import bodies
+from app.api.api_v1.endpoints import bodies, exports
 
 api_router = APIRouter()
 
 api_router.include_router(bodies.router, prefix="/bodies", tags=["bodies"])
+
+api_router.include_router(exports.router, prefix="/export", tags=["export"])
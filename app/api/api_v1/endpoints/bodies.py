@@ -1,47 +1,194 @@
-from typing import Any, Optional
+from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Depends, Request, Response
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import crud, schemas
 from app.api import deps
 from app.api.api_v1.params.bodies import BodyQueryParams
+from app.api.cache import response_cache
 from app.api.paginator import PaginatedResponse
+from app.core.config import settings
 
 router = APIRouter()
 
 
-@router.get("/", name="bodies:list", response_model=PaginatedResponse[schemas.Body])
-async def list_bodies(
+async def get_bodies_response(
     req: Request,
-    response: Response,
-    *,
-    db: Session = Depends(deps.get_db),
-    query: BodyQueryParams = Depends(),
-) -> Any:
+    db: Union[AsyncSession, Session],
+    page: int,
+    query: BodyQueryParams,
+) -> Response:
     """
-    returns the first page of list of bodies of any type based off of the
-    search paramaters provided
+    returns the page of bodies matching the search paramaters provided, served
+    from the response cache where possible
     """
-    page = 1
+    if settings.USE_RESPONSE_CACHE:
+        version = await crud.catalogue_version.get_async(db)
+
+        key = response_cache.get_key(req, query, version, page=page)
+
+        content = await response_cache.get(key)
+
+        if content is not None:
+            return Response(
+                content=content,
+                media_type="application/json",
+                headers={"X-Perseus-Cache": "HIT"},
+            )
+
+    fields = query.get_fields()
+
+    date = query.get_transits_datetime()
+
+    # The rise, transit and set times are computed from the ra and dec:
+    columns = (
+        tuple(dict.fromkeys(fields + ("ra", "dec"))) if fields and date else fields
+    )
 
     start = (page - 1) * query.limit
 
-    bodies, count = crud.body.get_multi(
-        db, query_params=query, skip=start, limit=query.limit
+    # Fetch one more row than the limit to determine whether there is a next page:
+    bodies, count = await crud.body.get_multi_async(
+        db,
+        query_params=query,
+        skip=start,
+        limit=query.limit + 1,
+        cursor=PaginatedResponse.decode_cursor(query.cursor),
+        count=query.count or "exact",
+        fields=columns,
+    )
+
+    has_next = len(bodies) > query.limit
+
+    bodies = bodies[: query.limit]
+
+    next_cursor = (
+        PaginatedResponse.encode_cursor(crud.body.get_cursor(bodies[-1]))
+        if has_next
+        else None
     )
 
-    return PaginatedResponse.paginate(
+    # Serialize only the requested fields, if given:
+    model = schemas.get_body_fields_model(fields) if fields else schemas.Body
+
+    items = bodies
+
+    if date:
+        transits = crud.body.get_transits(
+            bodies, date=date, latitude=query.latitude, longitude=query.longitude
+        )
+
+        items = [
+            {**model.from_orm(body).dict(), **times}
+            for body, times in zip(bodies, transits)
+        ]
+
+        model = schemas.get_body_transits_model(model)
+
+    paginated = PaginatedResponse[model].paginate(
         request=req,
         name="bodies:list-paginated",
-        items=bodies,
+        items=items,
         count=count,
         current_page=page,
         limit=query.limit,
         query=query,
+        has_next=has_next,
+        next_cursor=next_cursor,
+    )
+
+    response = ORJSONResponse(
+        content=jsonable_encoder(paginated), headers={"X-Perseus-Cache": "MISS"}
+    )
+
+    if settings.USE_RESPONSE_CACHE:
+        await response_cache.set(key, response.body.decode())
+
+    return response
+
+
+@router.post("/resolve", name="bodies:resolve", response_model=schemas.BodyResolved)
+async def resolve_bodies(
+    *,
+    db: Union[AsyncSession, Session] = Depends(deps.get_db),
+    body: schemas.BodyResolve,
+) -> Any:
+    """
+    resolves many catalogue designations (e.g., M31, NGC 224, IC434, HD358, HR15
+    or HIP 677) at once, returning the bodies identified by each designation
+    """
+    resolved = await crud.body.resolve_designations_async(db, body.designations)
+
+    return schemas.BodyResolved(
+        results=resolved,
+        unresolved=[
+            designation for designation, bodies in resolved.items() if not bodies
+        ],
     )
 
 
+@router.get(
+    "/autocomplete",
+    name="bodies:autocomplete",
+    response_model=List[schemas.BodySuggestion],
+)
+async def autocomplete_bodies(
+    *,
+    db: Union[AsyncSession, Session] = Depends(deps.get_db),
+    prefix: str = Query(
+        ..., min_length=1, title="The prefix of the body object's name typed so far"
+    ),
+    limit: int = Query(
+        default=10, ge=1, le=50, title="The number of suggestions to return"
+    ),
+) -> Any:
+    """
+    returns typeahead suggestions of the bodies with a name, IAU name, Bayer or
+    Flamsteed designation, or catalogue designation starting with the prefix
+    provided, the brightest first
+    """
+    suggestions = await crud.body.suggest_async(db, prefix=prefix, limit=limit)
+
+    return [suggestion._asdict() for suggestion in suggestions]
+
+
+@router.get("/search", name="bodies:search", response_model=List[schemas.Body])
+async def search_bodies(
+    *,
+    db: Union[AsyncSession, Session] = Depends(deps.get_db),
+    name: str = Query(
+        ..., min_length=1, title="The (partial) name of the body object to search"
+    ),
+    limit: int = Query(
+        default=20, ge=1, le=100, title="The number of records to return"
+    ),
+) -> Any:
+    """
+    returns the bodies whose name, IAU name or catalogue designation contains
+    the name provided, ranked by exact, then prefix, then substring matches
+    """
+    return await crud.body.search_async(db, name=name, limit=limit)
+
+
+@router.get("/", name="bodies:list", response_model=PaginatedResponse[schemas.Body])
+async def list_bodies(
+    req: Request,
+    response: Response,
+    *,
+    db: Union[AsyncSession, Session] = Depends(deps.get_db),
+    query: BodyQueryParams = Depends(),
+) -> Any:
+    """
+    returns the first page of list of bodies of any type based off of the
+    search paramaters provided
+    """
+    return await get_bodies_response(req, db, 1, query)
+
+
 @router.get(
     "/{page}",
     name="bodies:list-paginated",
@@ -51,7 +198,7 @@ async def list_bodies_paginated(
     req: Request,
     response: Response,
     *,
-    db: Session = Depends(deps.get_db),
+    db: Union[AsyncSession, Session] = Depends(deps.get_db),
     page: Optional[int] = 1,
     query: BodyQueryParams = Depends(),
 ) -> Any:
@@ -59,18 +206,4 @@ async def list_bodies_paginated(
     returns a paginated list of bodies of any type based off of the
     search paramaters provided
     """
-    start = (page - 1) * query.limit
-
-    bodies, count = crud.body.get_multi(
-        db, query_params=query, skip=start, limit=query.limit
-    )
-
-    return PaginatedResponse.paginate(
-        request=req,
-        name="bodies:list-paginated",
-        items=bodies,
-        count=count,
-        current_page=page,
-        limit=query.limit,
-        query=query,
-    )
+    return await get_bodies_response(req, db, page, query)
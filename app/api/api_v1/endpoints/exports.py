@@ -0,0 +1,56 @@
+from typing import Any, Literal, Union
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import crud, schemas
+from app.api import deps
+from app.api.api_v1.params.bodies import BodyQueryParams
+from app.api.exports import EXPORT_FORMATS, iterate_arrow, iterate_csv, iterate_ndjson
+from app.core.config import settings
+
+router = APIRouter()
+
+
+@router.get("/bodies", name="export:bodies")
+async def export_bodies(
+    *,
+    db: Union[AsyncSession, Session] = Depends(deps.get_db),
+    format: Literal["ndjson", "csv", "arrow", "parquet"] = Query(
+        default="ndjson",
+        title="The export format: ndjson (default), csv, arrow (IPC file) or parquet",
+    ),
+    query: BodyQueryParams = Depends(),
+) -> Any:
+    """
+    streams every body matching the search paramaters provided (regardless of
+    the limit, cursor or page) from a server-side cursor, as NDJSON, CSV, an
+    Arrow IPC file or Parquet
+    """
+    fields = query.get_fields() or tuple(schemas.Body.__fields__)
+
+    partitions = crud.body.stream_async(
+        db,
+        query_params=query,
+        fields=fields,
+        batch_size=settings.EXPORT_BATCH_SIZE,
+    )
+
+    if format == "csv":
+        content = iterate_csv(partitions, fields)
+    elif format in ("arrow", "parquet"):
+        content = iterate_arrow(partitions, fields, format)
+    else:
+        content = iterate_ndjson(partitions)
+
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_FORMATS[format]["media_type"],
+        headers={
+            "Content-Disposition": "attachment; filename=bodies.{}".format(
+                EXPORT_FORMATS[format]["extension"]
+            )
+        },
+    )
@@ -1,8 +1,11 @@
-from typing import Optional
+import datetime
+from typing import Literal, Optional, Tuple
 
-from fastapi import Query
+from fastapi import HTTPException, Query
 from pydantic import BaseModel
 
+from app import schemas
+
 
 class BodyQueryParams(BaseModel):
     limit: Optional[int] = Query(
@@ -80,3 +83,77 @@ class BodyQueryParams(BaseModel):
         title="The catalogue of the body object to search",
         deprecated=True,
     )
+
+    cursor: Optional[str] = Query(
+        default=None,
+        title="The opaque cursor of the next page, as returned by a previous page",
+        deprecated=True,
+    )
+
+    count: Optional[Literal["exact", "estimate", "none"]] = Query(
+        default=None,
+        title="The total count mode: exact (default), estimate or none",
+        deprecated=True,
+    )
+
+    fields: Optional[str] = Query(
+        default=None,
+        title="The comma-separated fields to return, e.g., uid,name,ra,dec,m,type",
+        deprecated=True,
+    )
+
+    transits: Optional[bool] = Query(
+        default=None,
+        title=(
+            "Whether to return the rise, transit and set times of each body for "
+            "the observer's latitude, longitude and datetime (or start)"
+        ),
+        deprecated=True,
+    )
+
+    def get_fields(self) -> Optional[Tuple[str, ...]]:
+        """
+        Get the requested fields in their schema order, raising a 400 for any
+        field that is not on the Body schema.
+        """
+        if not self.fields:
+            return None
+
+        fields = {field.strip() for field in self.fields.split(",") if field.strip()}
+
+        invalid = fields - set(schemas.Body.__fields__)
+
+        if invalid:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid fields: {}".format(", ".join(sorted(invalid))),
+            )
+
+        return tuple(field for field in schemas.Body.__fields__ if field in fields)
+
+    def get_transits_datetime(self) -> "Optional[datetime.datetime]":
+        """
+        Get the datetime (or start) about which the rise, transit and set times
+        are requested, if at all, raising a 400 if the observer's location or
+        datetime is missing.
+        """
+        if not self.transits:
+            return None
+
+        try:
+            date = datetime.datetime.strptime(
+                self.datetime or self.start or "", "%Y-%m-%dT%H:%M:%S.%f%z"
+            )
+        except ValueError:
+            date = None
+
+        if date is None or self.latitude is None or self.longitude is None:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    "The latitude, longitude and datetime (or start) are "
+                    "required for the rise, transit and set times"
+                ),
+            )
+
+        return date
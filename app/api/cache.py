@@ -0,0 +1,133 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional, TypeVar
+
+from fastapi import Request
+from fastapi_cache import FastAPICache
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import observe_cache
+
+QueryParams = TypeVar("QueryParams", bound=BaseModel)
+
+# The query parameters that are coordinates (in degrees), which are rounded:
+COORDINATE_PARAMS = {"ra", "dec", "radius", "latitude", "longitude"}
+
+# The string query parameters that are case-sensitive, e.g., the opaque cursor,
+# or the fields (where "m" and "M" are distinct), which are not case-folded:
+CASE_SENSITIVE_PARAMS = {"cursor", "fields"}
+
+
+def get_normalized_params(query_params: QueryParams) -> Dict[str, Any]:
+    """
+    Get the normalized, non-empty query parameters sorted by name, with strings
+    stripped and case-folded (as every string filter is matched
+    case-insensitively), and coordinates rounded.
+    """
+    params = {}
+
+    for name, value in sorted(dict(query_params).items()):
+        if value is None or value == "":
+            continue
+
+        if isinstance(value, str):
+            value = value.strip()
+
+            if name not in CASE_SENSITIVE_PARAMS:
+                value = value.casefold()
+
+        if name in COORDINATE_PARAMS:
+            value = round(float(value), settings.RESPONSE_CACHE_COORDINATE_PRECISION)
+
+        params[name] = value
+
+    return params
+
+
+class ResponseCache:
+    def __init__(self, maxsize: int = 256, expire: int = 3600) -> None:
+        """
+        A cache of serialized JSON responses, stored in Redis (when FastAPICache
+        has been initialized), with an in-process least-recently-used cache of
+        maxsize entries in front of it for the hottest keys.
+
+        Keys are tagged with the body catalogue version, so that every entry is
+        invalidated at once when the catalogue changes, and entries expire from
+        Redis after expire seconds, rather than outliving their version.
+        """
+        self.maxsize = maxsize
+
+        self.expire = expire
+
+        self._responses: OrderedDict[str, str] = OrderedDict()
+
+    def get_key(
+        self, request: Request, query_params: QueryParams, version: int, **kwargs: Any
+    ) -> str:
+        params = {**get_normalized_params(query_params), **kwargs}
+
+        # The responses include absolute URLs, so are keyed by the base URL too:
+        digest = hashlib.sha1(
+            json.dumps(
+                [str(request.base_url), request.url.path, params], sort_keys=True
+            ).encode()
+        ).hexdigest()
+
+        return "{}:v{}:{}".format(FastAPICache.get_prefix() or "", version, digest)
+
+    async def get(self, key: str) -> Optional[str]:
+        response = await self._get(key)
+
+        observe_cache("response", response is not None)
+
+        return response
+
+    async def _get(self, key: str) -> Optional[str]:
+        response = self._responses.get(key)
+
+        if response is not None:
+            self._responses.move_to_end(key)
+            return response
+
+        if not FastAPICache._init:
+            return None
+
+        try:
+            response = await FastAPICache.get_backend().get(key)
+        except RedisError:
+            return None
+
+        if response is not None:
+            self._set_local(key, response)
+
+        return response
+
+    async def set(self, key: str, response: str) -> None:
+        self._set_local(key, response)
+
+        if not FastAPICache._init:
+            return
+
+        try:
+            await FastAPICache.get_backend().set(key, response, expire=self.expire)
+        except RedisError:
+            pass
+
+    def _set_local(self, key: str, response: str) -> None:
+        if self.maxsize <= 0:
+            return
+
+        self._responses[key] = response
+
+        self._responses.move_to_end(key)
+
+        while len(self._responses) > self.maxsize:
+            self._responses.popitem(last=False)
+
+
+response_cache = ResponseCache(
+    maxsize=settings.RESPONSE_CACHE_SIZE, expire=settings.RESPONSE_CACHE_EXPIRE
+)
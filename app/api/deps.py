@@ -1,11 +1,20 @@
-from typing import Generator
+from typing import AsyncGenerator, Union
 
-from app.db.session import SessionLocal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.db.session import AsyncSessionLocal, SessionLocal
 
-def get_db() -> Generator:
-    try:
+
+async def get_db() -> AsyncGenerator[Union[AsyncSession, Session], None]:
+    # Fall back to the sync session where there is no async engine (Cloud SQL):
+    if AsyncSessionLocal is None:
         db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+        return
+
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,179 @@
+import csv
+import io
+from typing import Any, AsyncIterator, Dict, Iterator, List, Sequence
+
+import orjson
+from sqlalchemy import BigInteger, Float, Integer
+from sqlalchemy.engine import Row
+
+from app.models.body import Body
+
+# The media type and file extension of each streamed export format:
+EXPORT_FORMATS: Dict[str, Dict[str, str]] = {
+    "ndjson": {"media_type": "application/x-ndjson", "extension": "ndjson"},
+    "csv": {"media_type": "text/csv", "extension": "csv"},
+    "arrow": {"media_type": "application/vnd.apache.arrow.file", "extension": "arrow"},
+    "parquet": {"media_type": "application/vnd.apache.parquet", "extension": "parquet"},
+}
+
+
+async def iterate_ndjson(
+    partitions: AsyncIterator[Sequence[Row]],
+) -> AsyncIterator[bytes]:
+    """
+    Encode every row as one JSON object per line, one chunk per partition.
+    """
+    async for partition in partitions:
+        yield b"".join(orjson.dumps(dict(row._mapping)) + b"\n" for row in partition)
+
+
+async def iterate_csv(
+    partitions: AsyncIterator[Sequence[Row]], fields: Sequence[str]
+) -> AsyncIterator[bytes]:
+    """
+    Encode every row as a CSV record, after a header of the fields, one chunk
+    per partition.
+    """
+    buffer = io.StringIO()
+
+    writer = csv.writer(buffer)
+
+    writer.writerow(fields)
+
+    yield buffer.getvalue().encode()
+
+    async for partition in partitions:
+        buffer.seek(0)
+
+        buffer.truncate()
+
+        writer.writerows(partition)
+
+        yield buffer.getvalue().encode()
+
+
+class ChunkedSink(io.RawIOBase):
+    def __init__(self) -> None:
+        """
+        A write-only sink, which buffers everything written since it was last
+        drained, while reporting the total position to the writer.
+        """
+        self.position = 0
+
+        self.chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        data = bytes(b)
+
+        self.chunks.append(data)
+
+        self.position += len(data)
+
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data, self.chunks = b"".join(self.chunks), []
+
+        return data
+
+
+def get_arrow_schema(fields: Sequence[str]) -> Any:
+    """
+    Get the Arrow schema of the given Body fields, from their column types.
+    """
+    import pyarrow as pa
+
+    def get_type(field: str) -> Any:
+        column_type = getattr(Body, field).property.columns[0].type
+
+        if isinstance(column_type, Float):
+            return pa.float64()
+
+        if isinstance(column_type, (BigInteger, Integer)):
+            return pa.int64()
+
+        return pa.string()
+
+    return pa.schema([pa.field(field, get_type(field)) for field in fields])
+
+
+def get_record_batch(partition: Sequence[Row], schema: Any) -> Any:
+    """
+    Transpose a partition of rows into the column arrays of a record batch.
+    """
+    import pyarrow as pa
+
+    columns = zip(*partition) if partition else [[] for _ in schema]
+
+    return pa.record_batch(
+        [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+        schema=schema,
+    )
+
+
+def get_arrow_writer(sink: Any, schema: Any, format: str) -> Any:
+    """
+    Get the writer of the Arrow IPC file format (which can be memory-mapped for
+    zero-copy reads) or of Parquet, writing one record batch (or row group) per
+    partition.
+    """
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(sink, schema)
+
+    import pyarrow as pa
+
+    return pa.ipc.new_file(sink, schema)
+
+
+async def iterate_arrow(
+    partitions: AsyncIterator[Sequence[Row]], fields: Sequence[str], format: str
+) -> AsyncIterator[bytes]:
+    """
+    Encode the rows as an Arrow IPC file or as Parquet, one chunk per partition.
+    """
+    schema = get_arrow_schema(fields)
+
+    sink = ChunkedSink()
+
+    writer = get_arrow_writer(sink, schema, format)
+
+    async for partition in partitions:
+        writer.write_batch(get_record_batch(partition, schema))
+
+        yield sink.drain()
+
+    writer.close()
+
+    yield sink.drain()
+
+
+def write_arrow(
+    partitions: Iterator[Sequence[Row]], fields: Sequence[str], format: str, path: str
+) -> int:
+    """
+    Write the rows to the file at path as an Arrow IPC file or as Parquet,
+    returning the number of rows written.
+    """
+    schema = get_arrow_schema(fields)
+
+    count = 0
+
+    with open(path, "wb") as sink:
+        writer = get_arrow_writer(sink, schema, format)
+
+        for partition in partitions:
+            writer.write_batch(get_record_batch(partition, schema))
+
+            count += len(partition)
+
+        writer.close()
+
+    return count
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import binascii
+import json
 import math
-from typing import Generic, Optional, Sequence, TypeVar
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, Generic, Optional, Sequence, Tuple, TypeVar
 
-from fastapi import Request
+from fastapi import HTTPException, Request
 from furl import furl
 from pydantic import BaseModel
 from pydantic.generics import GenericModel
@@ -12,14 +15,20 @@ T = TypeVar("T")
 
 Q = TypeVar("Q")
 
+# The types of each value of a (type rank, magnitude, uid) cursor, where bool is
+# excluded from the numbers:
+CURSOR_TYPES: Tuple[Tuple[type, ...], ...] = ((int,), (float, int, type(None)), (str,))
+
 
 class PaginatedResponse(GenericModel, Generic[T]):
-    count: int
+    count: Optional[int] = None
 
     next_page: Optional[str] = None
 
     previous_page: Optional[str] = None
 
+    next_cursor: Optional[str] = None
+
     results: Sequence[T]
 
     class Config:
@@ -43,32 +52,86 @@ class PaginatedResponse(GenericModel, Generic[T]):
 
     @classmethod
     def get_previous_page(
-        cls, current_page: int, count: int, limit: int
+        cls, current_page: int, count: Optional[int], limit: int
     ) -> Optional[str]:
+        if current_page == 1:
+            return None
+
+        # Without a total count, any page but the first has a previous page:
+        if count is None:
+            return current_page - 1
+
         total_pages = cls.get_total_pages(count, limit)
 
-        if current_page == 1 or current_page > total_pages + 1:
+        if current_page > total_pages + 1:
             return None
         return current_page - 1
 
     @classmethod
     def get_next_page_url(
-        cls, request: Request, name: str, current_page: int, count: int, limit: int
+        cls,
+        request: Request,
+        name: str,
+        current_page: int,
+        count: Optional[int],
+        limit: int,
+        has_next: Optional[bool] = None,
     ) -> Optional[str]:
-        next_page = cls.get_next_page(current_page, count, limit)
+        # Whether there is a next page is known directly when one more row than
+        # the limit has been fetched:
+        if has_next is not None:
+            next_page = current_page + 1 if has_next else None
+        else:
+            next_page = cls.get_next_page(current_page, count, limit)
         if next_page:
             return request.url_for(name, page=next_page)
         return None
 
     @classmethod
     def get_previous_page_url(
-        cls, request: Request, name: str, current_page: int, count: int, limit: int
+        cls,
+        request: Request,
+        name: str,
+        current_page: int,
+        count: Optional[int],
+        limit: int,
     ) -> Optional[str]:
         previous_page = cls.get_previous_page(current_page, count, limit)
         if previous_page:
             return request.url_for(name, page=previous_page)
         return None
 
+    @classmethod
+    def encode_cursor(cls, values: Sequence[Any]) -> str:
+        return urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode_cursor(
+        cls,
+        cursor: Optional[str],
+        types: Sequence[Tuple[type, ...]] = CURSOR_TYPES,
+    ) -> Optional[Tuple[Any, ...]]:
+        if not cursor:
+            return None
+
+        try:
+            values = json.loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        except (binascii.Error, ValueError, TypeError):
+            values = None
+
+        if not isinstance(values, list) or len(values) != len(types):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        for value, allowed in zip(values, types):
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, allowed)
+                or (isinstance(value, float) and not math.isfinite(value))
+            ):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        return tuple(values)
+
     @classmethod
     def get_query_params_dict(cls, query: BaseModel[Q]) -> dict[Q]:
         return {k: v for k, v in dict(query).items() if v is not None}
@@ -79,14 +142,35 @@ class PaginatedResponse(GenericModel, Generic[T]):
         request: Request,
         name: str,
         items: Sequence[T],
-        count: int,
+        count: Optional[int],
         current_page: int,
         query: BaseModel[Q],
         limit: int,
+        has_next: Optional[bool] = None,
+        next_cursor: Optional[str] = None,
     ) -> PaginatedResponse[T]:
         query_params = cls.get_query_params_dict(query)
 
-        next_page_url = cls.get_next_page_url(request, name, current_page, count, limit)
+        # When paginating by cursor, the next page is sought from the next cursor,
+        # and there is no previous page:
+        if query_params.get("cursor"):
+            next_page = (
+                furl(str(request.url)).set({**query_params, "cursor": next_cursor}).url
+                if next_cursor
+                else None
+            )
+
+            return cls(
+                count=count,
+                next_page=next_page,
+                previous_page=None,
+                next_cursor=next_cursor,
+                results=items,
+            )
+
+        next_page_url = cls.get_next_page_url(
+            request, name, current_page, count, limit, has_next
+        )
 
         previous_page_url = cls.get_previous_page_url(
             request, name, current_page, count, limit
@@ -99,5 +183,9 @@ class PaginatedResponse(GenericModel, Generic[T]):
         )
 
         return cls(
-            count=count, next_page=next_page, previous_page=previous_page, results=items
+            count=count,
+            next_page=next_page,
+            previous_page=previous_page,
+            next_cursor=next_cursor if next_page else None,
+            results=items,
         )
@@ -0,0 +1,193 @@
+import math
+import os
+from functools import lru_cache
+from typing import Dict, NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# The Julian date of the Besselian epoch B1875.0, the equinox of the Roman (1987)
+# constellation boundaries:
+B1875 = 2405889.258550475
+
+# The Julian date of the J2000.0 epoch:
+J2000 = 2451545.0
+
+# The barycentric velocity of the Earth at J2000.0 (in units of c), which shifts
+# the apparent (geocentric) positions by up to ~20 arcseconds of annual aberration:
+EARTH_VELOCITY_J2000 = np.array([-9.93518889e-05, -1.67774530e-05, -7.27384679e-06])
+
+# Corrections to the constellation names tabulated by astropy:
+NAME_CORRECTIONS = {"Oph": "Ophiuchus"}
+
+
+class ConstellationGrid(NamedTuple):
+    # The sorted right ascension (in hours) and declination (in degrees) cell edges:
+    ra_edges: np.ndarray
+    dec_edges: np.ndarray
+    # The index into names of the constellation of every (ra, dec) cell:
+    cells: np.ndarray
+    # The full IAU names of the constellations:
+    names: np.ndarray
+
+
+def get_precession_matrix(jd: float) -> np.ndarray:
+    """
+    Get the IAU 1976 (Lieske) precession matrix from the J2000 equinox to the
+    equinox of the given Julian date.
+
+    :param jd: The Julian date of the equinox to precess to
+    :return: The 3x3 rotation matrix
+    """
+    T = (jd - J2000) / 36525
+
+    arcsec = math.pi / 648000
+
+    zeta = (2306.2181 * T + 0.30188 * T**2 + 0.017998 * T**3) * arcsec
+
+    z = (2306.2181 * T + 1.09468 * T**2 + 0.018203 * T**3) * arcsec
+
+    theta = (2004.3109 * T - 0.42665 * T**2 - 0.041833 * T**3) * arcsec
+
+    def Rz(a: float) -> np.ndarray:
+        return np.array(
+            [[math.cos(a), math.sin(a), 0], [-math.sin(a), math.cos(a), 0], [0, 0, 1]]
+        )
+
+    def Ry(a: float) -> np.ndarray:
+        return np.array(
+            [[math.cos(a), 0, -math.sin(a)], [0, 1, 0], [math.sin(a), 0, math.cos(a)]]
+        )
+
+    return Rz(-z) @ Ry(theta) @ Rz(-zeta)
+
+
+def get_constellation_data_path(filename: str) -> str:
+    from astropy import coordinates
+
+    return os.path.join(os.path.dirname(coordinates.__file__), "data", filename)
+
+
+@lru_cache(maxsize=1)
+def get_constellation_names() -> Dict[str, str]:
+    """
+    Get the full IAU name of every constellation, keyed by its three letter
+    abbreviation, e.g., "Ori" for Orion.
+    """
+    with open(
+        get_constellation_data_path("constellation_names.dat"), encoding="UTF8"
+    ) as f:
+        names = dict(
+            line.rstrip("\n").split(" ", 1)
+            for line in f
+            if line.strip() and not line.startswith("#")
+        )
+
+    names.update(NAME_CORRECTIONS)
+
+    return names
+
+
+@lru_cache(maxsize=1)
+def get_constellation_abbreviations() -> Dict[str, str]:
+    """
+    Get the three letter abbreviation of every constellation, keyed by its full
+    IAU name, e.g., "Orion" for Ori.
+    """
+    return {
+        name: abbreviation for abbreviation, name in get_constellation_names().items()
+    }
+
+
+@lru_cache(maxsize=1)
+def get_constellation_grid() -> ConstellationGrid:
+    """
+    Build the lookup grid of the Roman (1987) constellation boundaries, i.e., the
+    constellation of every cell between consecutive boundary right ascensions
+    and declinations, within which the constellation is constant.
+
+    The boundary tables are those shipped with astropy, and the first matching
+    row of the table (ordered from north to south) is the constellation, as in
+    SkyCoord.get_constellation.
+    """
+    table = np.genfromtxt(
+        get_constellation_data_path("constellation_data_roman87.dat"),
+        dtype=[("ral", "f8"), ("rau", "f8"), ("decl", "f8"), ("name", "U3")],
+        comments="#",
+    )
+
+    names = get_constellation_names()
+
+    ra_edges = np.unique(np.concatenate([table["ral"], table["rau"]]))
+
+    dec_edges = np.unique(np.concatenate([[-90.0, 90.0], table["decl"]]))
+
+    # Evaluate the boundary table once at the midpoint of every cell:
+    ra = (ra_edges[:-1] + ra_edges[1:])[:, np.newaxis] / 2
+
+    dec = (dec_edges[:-1] + dec_edges[1:])[np.newaxis, :] / 2
+
+    cells = np.full((len(ra_edges) - 1, len(dec_edges) - 1), -1, dtype=np.int16)
+
+    for i, row in enumerate(table):
+        mask = (row["ral"] < ra) & (ra < row["rau"]) & (dec > row["decl"])
+
+        cells[mask & (cells == -1)] = i
+
+    return ConstellationGrid(
+        ra_edges=ra_edges,
+        dec_edges=dec_edges,
+        cells=cells,
+        names=np.array([names[name] for name in table["name"]]),
+    )
+
+
+def get_constellations(ra: ArrayLike, dec: ArrayLike) -> np.ndarray:
+    """
+    Get the constellation of every ICRS { ra, dec } by applying the annual
+    aberration at J2000.0, precessing to the B1875 equinox, and looking up the
+    precomputed boundary grid, as in SkyCoord.get_constellation.
+
+    :param ra: Right Ascensions (in degrees)
+    :param dec: Declinations (in degrees)
+    :return: The full IAU constellation names
+    """
+    ra, dec = np.radians(np.asarray(ra, dtype=float)), np.radians(
+        np.asarray(dec, dtype=float)
+    )
+
+    vectors = np.stack(
+        [np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)]
+    )
+
+    # First-order annual aberration:
+    vectors = vectors + EARTH_VELOCITY_J2000[:, np.newaxis]
+
+    vectors /= np.linalg.norm(vectors, axis=0)
+
+    x, y, z = np.tensordot(get_precession_matrix(B1875), vectors, axes=1)
+
+    ra = np.degrees(np.arctan2(y, x)) % 360 / 15
+
+    dec = np.degrees(np.arcsin(np.clip(z, -1, 1)))
+
+    grid = get_constellation_grid()
+
+    rows, columns = grid.cells.shape
+
+    i = np.clip(np.searchsorted(grid.ra_edges, ra, side="right") - 1, 0, rows - 1)
+
+    j = np.clip(np.searchsorted(grid.dec_edges, dec, side="right") - 1, 0, columns - 1)
+
+    return grid.names[grid.cells[i, j]]
+
+
+def get_constellation(ra: float, dec: float) -> str:
+    """
+    Get the constellation of the ICRS { ra, dec }.
+
+    :param ra: Right Ascension (in degrees)
+    :param dec: Declination (in degrees)
+    :return: The full IAU constellation name
+    """
+    return str(get_constellations([ra], [dec])[0])
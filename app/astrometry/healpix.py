@@ -0,0 +1,262 @@
+import math
+from typing import List, Tuple
+
+# The HEALPix order (depth) at which body pixels are stored, i.e., NSIDE = 2**12,
+# giving 201,326,592 pixels of roughly 0.86 arcminutes across the celestial sphere:
+HEALPIX_ORDER = 12
+
+# The ring index of the southern vertex of each of the 12 base pixels (faces):
+JRLL = (2, 2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4)
+
+# The longitude index of the southern vertex of each of the 12 base pixels (faces):
+JPLL = (1, 3, 5, 7, 0, 2, 4, 6, 1, 3, 5, 7)
+
+
+def spread_bits(v: int) -> int:
+    """
+    Interleave the bits of v with zeros, e.g., 0b111 -> 0b10101
+    """
+    result = 0
+
+    bit = 0
+
+    while v:
+        result |= (v & 1) << (2 * bit)
+        v >>= 1
+        bit += 1
+
+    return result
+
+
+def compress_bits(v: int) -> int:
+    """
+    Extract every other bit of v, the inverse operation of spread_bits
+    """
+    result = 0
+
+    bit = 0
+
+    while v:
+        result |= (v & 1) << bit
+        v >>= 2
+        bit += 1
+
+    return result
+
+
+def ang2pix(ra: float, dec: float, order: int = HEALPIX_ORDER) -> int:
+    """
+    Get the NESTED HEALPix pixel index containing the point { ra, dec }.
+
+    :param ra: Right Ascension (in degrees)
+    :param dec: Declination (in degrees)
+    :param order: The HEALPix order (depth), where NSIDE = 2**order
+    :return: The NESTED pixel index
+    """
+    nside = 1 << order
+
+    z = math.sin(math.radians(dec))
+
+    za = abs(z)
+
+    # The longitude in units of quarter turns, in the range [0, 4):
+    tt = (ra % 360.0) / 90.0
+
+    if tt >= 4.0:
+        tt = 0.0
+
+    # Equatorial Region:
+    if za <= 2.0 / 3.0:
+        temp1 = nside * (0.5 + tt)
+        temp2 = nside * (z * 0.75)
+
+        # Index of the ascending and descending edge lines:
+        jp = int(temp1 - temp2)
+        jm = int(temp1 + temp2)
+
+        ifp = jp >> order
+        ifm = jm >> order
+
+        if ifp == ifm:
+            face = ifp | 4
+        elif ifp < ifm:
+            face = ifp
+        else:
+            face = ifm + 8
+
+        ix = jm & (nside - 1)
+        iy = nside - (jp & (nside - 1)) - 1
+    # Polar Caps:
+    else:
+        ntt = min(3, int(tt))
+
+        tp = tt - ntt
+
+        tmp = nside * math.sqrt(3.0 * (1.0 - za))
+
+        jp = min(int(tp * tmp), nside - 1)
+        jm = min(int((1.0 - tp) * tmp), nside - 1)
+
+        if z >= 0:
+            face = ntt
+            ix = nside - jm - 1
+            iy = nside - jp - 1
+        else:
+            face = ntt + 8
+            ix = jp
+            iy = jm
+
+    return (face << (2 * order)) + spread_bits(ix) + (spread_bits(iy) << 1)
+
+
+def pix2ang(pix: int, order: int = HEALPIX_ORDER) -> Tuple[float, float]:
+    """
+    Get the { ra, dec } of the center of the given NESTED HEALPix pixel.
+
+    :param pix: The NESTED pixel index
+    :param order: The HEALPix order (depth), where NSIDE = 2**order
+    :return: The Right Ascension and Declination (in degrees)
+    """
+    nside = 1 << order
+
+    npface = nside * nside
+
+    face = pix >> (2 * order)
+
+    ipf = pix & (npface - 1)
+
+    ix = compress_bits(ipf)
+    iy = compress_bits(ipf >> 1)
+
+    nl4 = 4 * nside
+
+    fact2 = 4.0 / (12 * npface)
+
+    # The ring number counted from the north pole:
+    jr = (JRLL[face] << order) - ix - iy - 1
+
+    if jr < nside:
+        nr = jr
+        z = 1.0 - nr * nr * fact2
+        kshift = 0
+    elif jr > 3 * nside:
+        nr = nl4 - jr
+        z = nr * nr * fact2 - 1.0
+        kshift = 0
+    else:
+        nr = nside
+        z = (2 * nside - jr) * (2 * nside * fact2)
+        kshift = (jr - nside) & 1
+
+    jp = (JPLL[face] * nr + ix - iy + 1 + kshift) // 2
+
+    if jp > nl4:
+        jp -= nl4
+
+    if jp < 1:
+        jp += nl4
+
+    ra = (jp - (kshift + 1) * 0.5) * (90.0 / nr)
+
+    return ra % 360.0, math.degrees(math.asin(max(-1.0, min(1.0, z))))
+
+
+def max_pixrad(order: int) -> float:
+    """
+    Get the maximum angular distance (in degrees) between any pixel center and its
+    corners at the given HEALPix order.
+    """
+    nside = 1 << order
+
+    t1 = (1.0 - 1.0 / nside) ** 2
+
+    return separation(
+        0.0,
+        math.degrees(math.asin(1.0 - t1 / 3.0)),
+        45.0 / nside,
+        math.degrees(math.asin(2.0 / 3.0)),
+    )
+
+
+def separation(ra1: float, dec1: float, ra2: float, dec2: float) -> float:
+    """
+    Get the great-circle distance (in degrees) between two points on the sphere.
+    """
+    ra1, dec1, ra2, dec2 = map(math.radians, (ra1, dec1, ra2, dec2))
+
+    # Haversine formula, which is well-conditioned for small separations:
+    h = (
+        math.sin((dec2 - dec1) / 2) ** 2
+        + math.cos(dec1) * math.cos(dec2) * math.sin((ra2 - ra1) / 2) ** 2
+    )
+
+    return math.degrees(2 * math.asin(min(1.0, math.sqrt(h))))
+
+
+def query_disc(
+    ra: float, dec: float, radius: float, order: int = HEALPIX_ORDER
+) -> List[Tuple[int, int]]:
+    """
+    Get the (inclusive) ranges of NESTED pixel indices at the given order that
+    (conservatively) cover the cone of the given radius around { ra, dec }.
+
+    The sphere is descended hierarchically from the 12 base pixels, so the cost
+    scales with the circumference of the cone, rather than with its area.
+
+    :param ra: Right Ascension (in degrees)
+    :param dec: Declination (in degrees)
+    :param radius: The cone radius (in degrees)
+    :param order: The HEALPix order (depth) of the returned ranges
+    :return: A sorted list of non-overlapping (start, end) pixel ranges
+    """
+    npix = 12 << (2 * order)
+
+    if radius >= 180:
+        return [(0, npix - 1)]
+
+    # Descend until the pixels are small relative to the cone, beyond which the
+    # ranges are emitted at the storage order directly:
+    depth = 0
+
+    while depth < order and max_pixrad(depth) > radius / 4:
+        depth += 1
+
+    pixels: List[Tuple[int, int]] = []
+
+    candidates = list(range(12))
+
+    for k in range(depth + 1):
+        pixrad = max_pixrad(k)
+
+        children = []
+
+        for pix in candidates:
+            d = separation(ra, dec, *pix2ang(pix, k))
+
+            # The pixel lies entirely outside of the cone:
+            if d > radius + pixrad:
+                continue
+
+            # The pixel lies entirely inside of the cone (or we are at max depth):
+            if d + pixrad <= radius or k == depth:
+                pixels.append((pix, k))
+                continue
+
+            children.extend(range(pix << 2, (pix << 2) + 4))
+
+        candidates = children
+
+    ranges = sorted(
+        (pix << (2 * (order - k)), ((pix + 1) << (2 * (order - k))) - 1)
+        for pix, k in pixels
+    )
+
+    merged: List[Tuple[int, int]] = []
+
+    for start, end in ranges:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
@@ -0,0 +1,107 @@
+import datetime
+import math
+from functools import lru_cache
+from typing import Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# The J2000.0 epoch, from which time is measured in (UT1) days:
+J2000 = datetime.datetime(2000, 1, 1, 12, tzinfo=datetime.timezone.utc)
+
+J2000_DATETIME64 = np.datetime64("2000-01-01T12:00:00", "us")
+
+# The rate at which the mean sidereal time advances (in degrees per solar day),
+# i.e., the rate of the Earth Rotation Angle:
+SIDEREAL_RATE = 360.98564736628603
+
+# The IAU 2006 polynomial of the precession in right ascension (in arcseconds)
+# in Julian centuries, from the highest order coefficient to the lowest:
+GMST_POLYNOMIAL = [
+    -0.0000000368,
+    -0.000029956,
+    -0.00000044,
+    1.3915817,
+    4612.156534,
+    0.014506,
+]
+
+DatetimeLike = Union[datetime.datetime, np.datetime64, ArrayLike]
+
+
+def get_days_since_J2000(date: DatetimeLike) -> Union[float, np.ndarray]:
+    """
+    Get the number of days since the J2000.0 epoch of a datetime (where naive
+    datetimes are in local time, as for datetime.astimezone), or of an array of
+    (UTC) numpy datetime64s.
+    """
+    if isinstance(date, datetime.datetime):
+        return (date.astimezone(datetime.timezone.utc) - J2000).total_seconds() / 86400
+
+    delta = np.asarray(date, dtype="datetime64[us]") - J2000_DATETIME64
+
+    return delta / np.timedelta64(86400, "s")
+
+
+def get_greenwich_sidereal_time(days: ArrayLike) -> Union[float, np.ndarray]:
+    """
+    Get the Greenwich Mean Sidereal Time (IAU 2006), in closed form from the
+    Earth Rotation Angle, for scalars or arrays.
+
+    UTC is taken as UT1 (within 0.9 seconds), and as TT for the (slowly varying)
+    precession polynomial, where the error is below 0.0001 arcseconds.
+
+    :param days: Days since the J2000.0 epoch
+    :return: Greenwich Mean Sidereal Time (in degrees, within [0, 360))
+    """
+    days = np.asarray(days, dtype=np.float64)
+
+    # The Earth Rotation Angle, with the whole days (i.e., whole turns) removed
+    # first to preserve precision:
+    turns = np.mod(days, 1.0) + 0.7790572732640 + 0.00273781191135448 * days
+
+    precession = np.polyval(GMST_POLYNOMIAL, days / 36525) / 3600
+
+    gmst = np.mod(np.mod(turns, 1.0) * 360 + precession, 360)
+
+    return float(gmst) if gmst.ndim == 0 else gmst
+
+
+@lru_cache(maxsize=4096)
+def get_greenwich_sidereal_time_at_minute(minute: int) -> float:
+    """
+    Get the Greenwich Mean Sidereal Time (in degrees) at the start of the given
+    minute since the J2000.0 epoch, memoized for the many requests at (or within)
+    the same minute.
+    """
+    return get_greenwich_sidereal_time(minute / 1440)
+
+
+def get_local_sidereal_time(
+    date: DatetimeLike, longitude: ArrayLike
+) -> Union[float, np.ndarray]:
+    """
+    Get the Local Mean Sidereal Time of a datetime, or an array of datetimes, at
+    the given longitude (or longitudes).
+
+    A single datetime is evaluated from the memoized sidereal time at the start
+    of its minute, advanced at the sidereal rate for the seconds since.
+
+    :param date: The datetime, or an array of (UTC) numpy datetime64s
+    :param longitude: The observer's longitude (in degrees, east positive)
+    :return: Local Mean Sidereal Time (in degrees, within [0, 360))
+    """
+    if isinstance(date, datetime.datetime):
+        minutes = get_days_since_J2000(date) * 1440
+
+        minute = math.floor(minutes)
+
+        gmst = get_greenwich_sidereal_time_at_minute(minute) + (
+            (minutes - minute) * SIDEREAL_RATE / 1440
+        )
+    else:
+        gmst = get_greenwich_sidereal_time(get_days_since_J2000(date))
+
+    lst = np.mod(gmst + np.asarray(longitude, dtype=np.float64), 360)
+
+    return float(lst) if lst.ndim == 0 else lst
@@ -0,0 +1,91 @@
+import datetime
+from typing import List, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from app.astrometry.sidereal import SIDEREAL_RATE
+
+# The altitude (in degrees) of the centre of a point source at its (refracted)
+# rise or set on the geometric horizon:
+RISE_SET_ALTITUDE = -0.5667
+
+
+def get_transit_offsets(
+    ra: ArrayLike,
+    dec: ArrayLike,
+    LST: float,
+    latitude: float,
+    altitude: float = RISE_SET_ALTITUDE,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the rise, transit and set times of every { ra, dec } as offsets (in days)
+    from the instant of the given local sidereal time, in closed form from the
+    hour angle, for the transit nearest to that instant.
+
+    The rise and set offsets are NaN for bodies that never rise, or never set
+    (i.e., are circumpolar), at the given latitude.
+
+    :param ra: Right Ascensions (in degrees)
+    :param dec: Declinations (in degrees)
+    :param LST: Local Sidereal Time (in degrees)
+    :param latitude: The observer's latitude (in degrees)
+    :param altitude: The altitude (in degrees) of the rise and set
+    :return: The (rise, transit, set) offsets (in days)
+    """
+    ra = np.asarray(ra, dtype=float)
+
+    dec = np.radians(np.asarray(dec, dtype=float))
+
+    lat = np.radians(latitude)
+
+    # The hour angle at the instant, wrapped to [-180, 180) degrees, such that
+    # the nearest transit (at an hour angle of zero) is within half a day:
+    ha = (LST - ra + 180) % 360 - 180
+
+    transit = -ha / SIDEREAL_RATE
+
+    # The hour angle of the rise and set, where |cos H| > 1 if the body never
+    # reaches (or never leaves) the given altitude:
+    cos_h = (np.sin(np.radians(altitude)) - np.sin(lat) * np.sin(dec)) / (
+        np.cos(lat) * np.cos(dec)
+    )
+
+    with np.errstate(invalid="ignore"):
+        h = np.degrees(np.arccos(np.where(np.abs(cos_h) <= 1, cos_h, np.nan)))
+
+    return transit - h / SIDEREAL_RATE, transit, transit + h / SIDEREAL_RATE
+
+
+def get_sidereal_span(start: datetime.datetime, end: datetime.datetime) -> float:
+    """
+    Get the advance of the local sidereal time (in degrees) between the start
+    and end datetimes, which may exceed a full turn of 360 degrees.
+    """
+    return (end - start).total_seconds() / 86400 * SIDEREAL_RATE
+
+
+def get_transiting_ra_ranges(LST: float, span: float) -> List[Tuple[float, float]]:
+    """
+    Get the ranges of right ascension of the bodies that transit within the
+    interval of local sidereal time starting at LST and advancing by span, i.e.,
+    the right ascensions within [LST, LST + span] modulo 360 degrees.
+
+    :param LST: Local Sidereal Time at the start of the interval (in degrees)
+    :param span: The advance of the Local Sidereal Time (in degrees)
+    :return: The (lower, upper) ranges of right ascension (in degrees)
+    """
+    if span < 0:
+        return []
+
+    if span >= 360:
+        return [(0, 360)]
+
+    start = LST % 360
+
+    end = start + span
+
+    if end <= 360:
+        return [(start, end)]
+
+    return [(start, 360), (0, end - 360)]
@@ -0,0 +1,55 @@
+import math
+from typing import Tuple
+
+Vector = Tuple[float, float, float]
+
+
+def radec_to_vector(ra: float, dec: float) -> Vector:
+    """
+    Get the ICRS unit vector (direction cosines) of the point { ra, dec }.
+
+    :param ra: Right Ascension (in degrees)
+    :param dec: Declination (in degrees)
+    :return: The (x, y, z) unit vector
+    """
+    ra, dec = math.radians(ra), math.radians(dec)
+
+    return (
+        math.cos(dec) * math.cos(ra),
+        math.cos(dec) * math.sin(ra),
+        math.sin(dec),
+    )
+
+
+def zenith_vector(LST: float, latitude: float) -> Vector:
+    """
+    Get the ICRS unit vector of the observer's zenith, i.e., the point with a
+    right ascension of the local sidereal time and a declination of the latitude.
+
+    The sine of the altitude of any body is then the dot product of its unit
+    vector with the zenith vector.
+
+    :param LST: Local Sidereal Time (in degrees)
+    :param latitude: The observer's latitude (in degrees)
+    :return: The (x, y, z) unit vector
+    """
+    return radec_to_vector(LST, latitude)
+
+
+def get_declination_band(latitude: float, altitude: float) -> Tuple[float, float]:
+    """
+    Get the range of sin(dec), i.e., the unit vector z component, of all bodies
+    that can ever reach the given altitude from the given latitude.
+
+    A body transits at an altitude of 90 - |dec - latitude|, so it can only
+    reach the altitude when |dec - latitude| < 90 - altitude.
+
+    :param latitude: The observer's latitude (in degrees)
+    :param altitude: The minimum altitude (in degrees)
+    :return: The (lower, upper) bounds of the z component
+    """
+    lower = max(-90.0, latitude - 90.0 + altitude)
+
+    upper = min(90.0, latitude + 90.0 - altitude)
+
+    return math.sin(math.radians(lower)), math.sin(math.radians(upper))
@@ -0,0 +1,110 @@
+import argparse
+import json
+import logging
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import crud
+from app.benchmarks import get_cases, measure_import_time, run_benchmarks
+from app.core.config import settings
+from app.db.base import Base
+from app.models.body import Body
+from app.seed.messier import seed_messier
+from app.seed.stars import seed_stars
+
+logging.basicConfig(level=logging.INFO)
+
+logger = logging.getLogger(__name__)
+
+
+def get_session(database: str, *, seeded: bool) -> Session:
+    connect_args = {"check_same_thread": False} if database.startswith("sqlite") else {}
+
+    engine = create_engine(database, connect_args=connect_args)
+
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = factory()
+
+    # Seed an empty (e.g., SQLite stand-in) database from the data directory:
+    if seeded:
+        Base.metadata.create_all(engine)
+
+        if db.query(Body).count() == 0:
+            seed_messier(db, logger)
+            seed_stars(db, logger)
+
+    # Any (re)build of the name index reads the benchmarked database, rather than
+    # that of the app:
+    crud.body.session_factory = factory
+
+    return db
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the CRUDBody filter, pagination and serialization "
+        "paths, reporting the p50/p95/p99 latencies and throughput as JSON."
+    )
+
+    parser.add_argument(
+        "--database",
+        default=settings.SQLALCHEMY_DATABASE_URI,
+        help="The database URI, e.g., sqlite:///benchmark.db",
+    )
+
+    parser.add_argument(
+        "--seed",
+        action="store_true",
+        help="Create the schema and seed the database from data/ if it is empty",
+    )
+
+    parser.add_argument("--iterations", type=int, default=50)
+
+    parser.add_argument("--warmup", type=int, default=5)
+
+    parser.add_argument(
+        "--case", default="", help="Only run the cases whose name contains this"
+    )
+
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Serve get_multi from the in-memory columnar catalogue",
+    )
+
+    parser.add_argument("--output", default="benchmarks.json")
+
+    args = parser.parse_args()
+
+    db = get_session(args.database, seeded=args.seed)
+
+    settings.USE_COLUMNAR_CATALOGUE = args.columnar
+
+    # Build the name index before timing, so that the name cases measure the
+    # index, rather than the LIKE fallback while it is built in the background:
+    if settings.USE_NAME_INDEX:
+        crud.body.build_name_index(db)
+
+    cases = [case for case in get_cases() if args.case in case.name]
+
+    logger.info("Benchmarking {} Cases Started".format(len(cases)))
+
+    report = run_benchmarks(
+        db, cases, iterations=args.iterations, warmup=args.warmup, logger=logger
+    )
+
+    report["columnar"] = args.columnar
+
+    # The cold start cost of a worker, i.e., the wall time of importing the app:
+    report["startup"] = {"module": "app.main", "seconds": measure_import_time().seconds}
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    logger.info("Benchmarking Success, Written to {}".format(args.output))
+
+
+if __name__ == "__main__":
+    main()
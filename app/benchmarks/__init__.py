@@ -0,0 +1,3 @@
+from .cases import get_cases
+from .runner import run_benchmarks
+from .startup import measure_import_time
@@ -0,0 +1,308 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Float, inspect, select, type_coerce
+from sqlalchemy.orm import Session
+from starlette.datastructures import URL
+
+from app import crud, schemas
+from app.api.api_v1.params.bodies import BodyQueryParams
+from app.api.paginator import PaginatedResponse
+from app.benchmarks.runner import BenchmarkCase
+from app.models.body import Body
+
+# The query parameters of each perform_*_search_filter in isolation:
+FILTERS: Dict[str, Dict[str, Any]] = {
+    "none": {},
+    "radial": {"ra": 88.7929583, "dec": 7.4070639, "radius": 10},
+    "name": {"name": "nebula"},
+    "catalogue-designation": {"name": "M31"},
+    "constellation": {"constellation": "orion"},
+    "type": {"type": "G"},
+    "catalogue": {"catalogue": "messier"},
+    "altitude": {
+        "datetime": "2021-05-14T00:00:00.000+00:00",
+        "latitude": 19.8207,
+        "longitude": -155.468094,
+    },
+    "altitude-interval": {
+        "start": "2021-05-14T00:00:00.000+00:00",
+        "end": "2021-05-14T06:00:00.000+00:00",
+        "latitude": 19.8207,
+        "longitude": -155.468094,
+    },
+}
+
+# The common combinations of filters:
+COMBINATIONS: Dict[str, List[str]] = {
+    "radial+type": ["radial", "type"],
+    "constellation+type": ["constellation", "type"],
+    "altitude+catalogue": ["altitude", "catalogue"],
+    "altitude+radial": ["altitude", "radial"],
+    "name+constellation": ["name", "constellation"],
+}
+
+# The pages at which offset and cursor pagination are measured:
+PAGES = [1, 10, 50]
+
+# The page sizes at which serialization is measured:
+LIMITS = [20, 100]
+
+# The sparse fieldset most clients need, compared to every field:
+FIELDSETS = [None, ("uid", "name", "ra", "dec", "type", "m")]
+
+# The number of rows hydrated per iteration of the hydration cases:
+HYDRATION_LIMIT = 1000
+
+
+def get_query_params(**kwargs: Any) -> BodyQueryParams:
+    return BodyQueryParams(**{"limit": 20, **kwargs})
+
+
+def get_multi_case(
+    query_params: BodyQueryParams, *, page: int = 1, count: str = "exact"
+) -> Callable[[Session], Callable[[], int]]:
+    def setup(db: Session) -> Callable[[], int]:
+        def run() -> int:
+            bodies, _ = crud.body.get_multi(
+                db,
+                query_params=query_params,
+                skip=(page - 1) * query_params.limit,
+                limit=query_params.limit + 1,
+                count=count,
+            )
+
+            return len(bodies)
+
+        return run
+
+    return setup
+
+
+def get_cursor_case(
+    query_params: BodyQueryParams, *, page: int
+) -> Callable[[Session], Callable[[], int]]:
+    def setup(db: Session) -> Callable[[], int]:
+        cursor: Optional[tuple] = None
+
+        # Walk to the cursor of the page (untimed):
+        for _ in range(page - 1):
+            bodies, _ = crud.body.get_multi(
+                db,
+                query_params=query_params,
+                limit=query_params.limit,
+                cursor=cursor,
+                count="none",
+            )
+
+            if not bodies:
+                break
+
+            cursor = crud.body.get_cursor(bodies[-1])
+
+        def run() -> int:
+            bodies, _ = crud.body.get_multi(
+                db,
+                query_params=query_params,
+                limit=query_params.limit + 1,
+                cursor=cursor,
+                count="none",
+            )
+
+            return len(bodies)
+
+        return run
+
+    return setup
+
+
+def get_serialization_case(limit: int) -> Callable[[Session], Callable[[], int]]:
+    def setup(db: Session) -> Callable[[], int]:
+        query_params = get_query_params(limit=limit)
+
+        bodies, count = crud.body.get_multi(db, query_params=query_params, limit=limit)
+
+        # Keep the bodies readable across iterations:
+        db.expunge_all()
+
+        request = BenchmarkRequest("https://perseus.docker.localhost/api/v1/bodies/")
+
+        def run() -> int:
+            paginated = PaginatedResponse[schemas.Body].paginate(
+                request=request,
+                name="bodies:list-paginated",
+                items=bodies,
+                count=count,
+                current_page=1,
+                limit=limit,
+                query=query_params,
+            )
+
+            ORJSONResponse(content=jsonable_encoder(paginated))
+
+            return len(bodies)
+
+        return run
+
+    return setup
+
+
+def get_fieldset_case(
+    limit: int, fields: Optional[Tuple[str, ...]]
+) -> Callable[[Session], Callable[[], int]]:
+    """
+    Fetch and serialize a page end-to-end, with either every field or only a
+    sparse fieldset selected and serialized.
+    """
+    model = schemas.get_body_fields_model(fields) if fields else schemas.Body
+
+    def setup(db: Session) -> Callable[[], int]:
+        query_params = get_query_params(limit=limit)
+
+        request = BenchmarkRequest("https://perseus.docker.localhost/api/v1/bodies/")
+
+        def run() -> int:
+            bodies, count = crud.body.get_multi(
+                db, query_params=query_params, limit=limit, fields=fields
+            )
+
+            paginated = PaginatedResponse[model].paginate(
+                request=request,
+                name="bodies:list-paginated",
+                items=bodies,
+                count=count,
+                current_page=1,
+                limit=limit,
+                query=query_params,
+            )
+
+            ORJSONResponse(content=jsonable_encoder(paginated))
+
+            return len(bodies)
+
+        return run
+
+    return setup
+
+
+def get_hydration_case(
+    limit: int, *, asdecimal: bool
+) -> Callable[[Session], Callable[[], int]]:
+    """
+    Fetch and hydrate limit rows into the Body schema as the list endpoint does,
+    with the float columns returned either as native floats, or (as they once
+    were) as Decimals, to measure the cost of Decimal hydration in rows/s.
+
+    Serialization is excluded, as it is measured by the serialization cases.
+    """
+    columns = []
+
+    for attr in inspect(Body).column_attrs:
+        column = attr.columns[0]
+
+        if asdecimal and isinstance(column.type, Float):
+            column = type_coerce(column, Float(asdecimal=True, decimal_return_scale=10))
+
+        columns.append(column.label(attr.key))
+
+    def setup(db: Session) -> Callable[[], int]:
+        def run() -> int:
+            rows = db.execute(select(*columns).limit(limit)).all()
+
+            for row in rows:
+                schemas.Body.parse_obj(row._mapping)
+
+            return len(rows)
+
+        return run
+
+    return setup
+
+
+class BenchmarkRequest:
+    def __init__(self, url: str) -> None:
+        """
+        A stand-in for the Request, with only what PaginatedResponse needs to
+        build the next and previous page URLs.
+        """
+        self.url = URL(url)
+
+    def url_for(self, name: str, **path_params: Any) -> str:
+        return str(self.url.replace(path="/api/v1/bodies/{page}".format(**path_params)))
+
+
+def get_cases() -> List[BenchmarkCase]:
+    """
+    Get every benchmark case: each filter in isolation (with an exact, estimated
+    and no total count), their common combinations, offset and cursor
+    pagination depth, response serialization (of every field, or a sparse
+    fieldset), and row hydration.
+    """
+    cases = []
+
+    for name, params in FILTERS.items():
+        query_params = get_query_params(**params)
+
+        for count in ("exact", "estimate", "none"):
+            cases.append(
+                BenchmarkCase(
+                    name="filter:{}:count={}".format(name, count),
+                    setup=get_multi_case(query_params, count=count),
+                )
+            )
+
+    for name, filters in COMBINATIONS.items():
+        params = {k: v for f in filters for k, v in FILTERS[f].items()}
+
+        cases.append(
+            BenchmarkCase(
+                name="combination:{}".format(name),
+                setup=get_multi_case(get_query_params(**params)),
+            )
+        )
+
+    for page in PAGES:
+        cases.append(
+            BenchmarkCase(
+                name="pagination:offset:page={}".format(page),
+                setup=get_multi_case(get_query_params(), page=page),
+            )
+        )
+
+        cases.append(
+            BenchmarkCase(
+                name="pagination:cursor:page={}".format(page),
+                setup=get_cursor_case(get_query_params(), page=page),
+            )
+        )
+
+    for limit in LIMITS:
+        cases.append(
+            BenchmarkCase(
+                name="serialization:limit={}".format(limit),
+                setup=get_serialization_case(limit),
+            )
+        )
+
+    for fields in FIELDSETS:
+        cases.append(
+            BenchmarkCase(
+                name="fieldset:{}:limit={}".format(
+                    ",".join(fields) if fields else "all", max(LIMITS)
+                ),
+                setup=get_fieldset_case(max(LIMITS), fields),
+            )
+        )
+
+    for asdecimal in (False, True):
+        cases.append(
+            BenchmarkCase(
+                name="hydration:{}:limit={}".format(
+                    "decimal" if asdecimal else "float", HYDRATION_LIMIT
+                ),
+                setup=get_hydration_case(HYDRATION_LIMIT, asdecimal=asdecimal),
+            )
+        )
+
+    return cases
@@ -0,0 +1,117 @@
+import datetime
+import subprocess
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.catalogue.counts import count_cache
+
+
+class BenchmarkCase(NamedTuple):
+    # The unique name of the case, e.g., "filter:radial":
+    name: str
+    # Prepares the case against the session, returning the timed callable, which
+    # returns the number of rows it produced:
+    setup: Callable[[Session], Callable[[], int]]
+
+
+def get_commit() -> Optional[str]:
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_statistics(timings: List[float], rows: int) -> Dict[str, Any]:
+    """
+    Get the latency percentiles (in milliseconds) and throughput of the timings
+    (in seconds) of every iteration of a case.
+    """
+    milliseconds = np.array(timings) * 1000
+
+    total = float(np.sum(timings))
+
+    return {
+        "iterations": len(timings),
+        "rows": rows,
+        "mean": float(np.mean(milliseconds)),
+        "min": float(np.min(milliseconds)),
+        "max": float(np.max(milliseconds)),
+        "p50": float(np.percentile(milliseconds, 50)),
+        "p95": float(np.percentile(milliseconds, 95)),
+        "p99": float(np.percentile(milliseconds, 99)),
+        # Operations (and rows) per second:
+        "throughput": len(timings) / total if total else 0,
+        "rows_per_second": rows * len(timings) / total if total else 0,
+    }
+
+
+def run_case(
+    db: Session, case: BenchmarkCase, *, iterations: int, warmup: int
+) -> Dict[str, Any]:
+    run = case.setup(db)
+
+    for _ in range(warmup):
+        count_cache.clear()
+        run()
+
+    timings = []
+
+    rows = 0
+
+    for _ in range(iterations):
+        # Measure the uncached path, as the count cache would otherwise serve
+        # every iteration after the first:
+        count_cache.clear()
+
+        started = time.perf_counter()
+
+        rows = run()
+
+        timings.append(time.perf_counter() - started)
+
+        # Release the identity map, so that every iteration loads afresh:
+        db.expunge_all()
+
+    return get_statistics(timings, rows)
+
+
+def run_benchmarks(
+    db: Session,
+    cases: List[BenchmarkCase],
+    *,
+    iterations: int = 50,
+    warmup: int = 5,
+    logger: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Run every benchmark case against the session, returning the report of the
+    latency percentiles and throughput of each.
+    """
+    results = {}
+
+    for case in cases:
+        results[case.name] = run_case(db, case, iterations=iterations, warmup=warmup)
+
+        if logger:
+            logger.info(
+                "{}: p50={p50:.2f}ms p95={p95:.2f}ms p99={p99:.2f}ms "
+                "({throughput:.1f} ops/s)".format(case.name, **results[case.name])
+            )
+
+    return {
+        "commit": get_commit(),
+        "database": db.get_bind().dialect.name,
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "iterations": iterations,
+        "warmup": warmup,
+        "results": results,
+    }
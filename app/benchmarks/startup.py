@@ -0,0 +1,41 @@
+import subprocess
+import sys
+from typing import FrozenSet, NamedTuple
+
+# Times the import of the module in a fresh interpreter, then lists every module
+# it imported:
+IMPORT_TIME_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+print(",".join(sys.modules))
+"""
+
+
+class ImportTime(NamedTuple):
+    # The (best) wall time of the cold import (in seconds):
+    seconds: float
+    # The modules loaded by the import:
+    modules: FrozenSet[str]
+
+
+def measure_import_time(module: str = "app.main", *, iterations: int = 3) -> ImportTime:
+    """
+    Measure the wall time of a cold import of the module, i.e., the start up cost
+    of every worker before it can serve a request, as the best of the iterations
+    (each in a fresh interpreter) to discount noise from the rest of the system.
+    """
+    timings = []
+
+    for _ in range(iterations):
+        output = subprocess.check_output(
+            [sys.executable, "-c", IMPORT_TIME_SCRIPT.format(module=module)],
+            text=True,
+        )
+
+        seconds, modules = output.strip().split("\n")[-2:]
+
+        timings.append(ImportTime(float(seconds), frozenset(modules.split(","))))
+
+    return min(timings, key=lambda timing: timing.seconds)
@@ -0,0 +1,3 @@
+from .columnar import catalogue
+from .names import name_index
+from .suggestions import suggestion_index
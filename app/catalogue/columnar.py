@@ -0,0 +1,458 @@
+import datetime
+import re
+import time
+from collections import namedtuple
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.astrometry.transits import get_sidereal_span, get_transiting_ra_ranges
+from app.catalogue.counts import CountMode
+from app.catalogue.designations import (
+    CATALOGUES,
+    Designation,
+    get_designations,
+    parse_designation,
+)
+from app.catalogue.names import LIKE_WILDCARDS, fold, name_index
+from app.core.config import settings
+from app.models.body import BODY_TYPE_ORDER, HORIZON_ALTITUDE, MAGNITUDE_FALLBACK, Body
+
+QueryParams = TypeVar("QueryParams", bound=BaseModel)
+
+# The (type rank, magnitude, uid) sort key of the last row of a page:
+Cursor = Tuple[int, float, str]
+
+
+def get_like_pattern(pattern: str) -> "re.Pattern[str]":
+    """
+    Get the (case-insensitive) regular expression equivalent of a SQL LIKE
+    pattern, where % matches any run of characters, _ matches any single
+    character, and a backslash escapes the next character.
+    """
+    expression = ""
+
+    escaped = False
+
+    for character in pattern:
+        if escaped:
+            expression += re.escape(character)
+            escaped = False
+        elif character == "\\":
+            escaped = True
+        elif character == "%":
+            expression += ".*"
+        elif character == "_":
+            expression += "."
+        else:
+            expression += re.escape(character)
+
+    return re.compile(expression, re.IGNORECASE | re.DOTALL)
+
+
+@lru_cache(maxsize=256)
+def get_row_type(fields: Tuple[str, ...]) -> Any:
+    """
+    Get the (named tuple) row type of the given fields, the in-memory equivalent
+    of the rows selected by CRUDBody for sparse fieldsets.
+    """
+    return namedtuple("Row", fields)
+
+
+class ColumnarSnapshot:
+    def __init__(self, bodies: List[Body], version: Optional[int] = None) -> None:
+        """
+        The NumPy column arrays of one load of the body table. A snapshot is never
+        modified once built, so that filtering reads it without a lock, while a
+        reload swaps in a new snapshot.
+        """
+
+        def floats(attr: str) -> np.ndarray:
+            values = [getattr(b, attr) for b in bodies]
+
+            return np.array(
+                [np.nan if v is None else float(v) for v in values], dtype=np.float64
+            )
+
+        def strings(attr: str) -> np.ndarray:
+            return np.array(
+                [(getattr(b, attr) or "").lower() for b in bodies], dtype=np.str_
+            )
+
+        def folded(attr: str) -> np.ndarray:
+            return np.array(
+                [fold(getattr(b, attr) or "") for b in bodies], dtype=np.str_
+            )
+
+        def exists(attr: str) -> np.ndarray:
+            return np.array([getattr(b, attr) is not None for b in bodies], dtype=bool)
+
+        ra = floats("ra")
+
+        dec = floats("dec")
+
+        m = floats("m")
+
+        types = [b.type for b in bodies]
+
+        # Categorical codes for the body type and constellation columns:
+        type_values, type_codes = np.unique(
+            np.array([(t or "").lower() for t in types], dtype=np.str_),
+            return_inverse=True,
+        )
+
+        constellation_values, constellation_codes = np.unique(
+            strings("constellation"), return_inverse=True
+        )
+
+        # Unranked types are sorted first, in keeping with the NULL ordering of
+        # the CASE expression in MySQL:
+        rank = np.array([BODY_TYPE_ORDER.get(t, -1) for t in types], dtype=np.float64)
+
+        # The composite sort key: type rank first, then apparent magnitude:
+        order = rank * 1e6 + np.where(np.isnan(m), MAGNITUDE_FALLBACK, m)
+
+        # The indices of the bodies of every (catalogue, number) designation:
+        designations: Dict[Designation, List[int]] = {}
+
+        for i, b in enumerate(bodies):
+            for designation in get_designations({c: getattr(b, c) for c in CATALOGUES}):
+                designations.setdefault(designation, []).append(i)
+
+        self.bodies = bodies
+        self.uid = np.array([str(b.uid) for b in bodies], dtype=np.str_)
+        self.ra = np.radians(ra)
+        self.dec = np.radians(dec)
+        self.m = m
+        self.type_values = type_values
+        self.type_codes = type_codes
+        self.constellation_values = constellation_values
+        self.constellation_codes = constellation_codes
+        self.order = order
+        self.name = folded("name")
+        self.iau = folded("iau")
+        self.designations = designations
+        self.has_messier = exists("messier")
+        self.has_ngc = exists("ngc")
+        self.has_ic = exists("ic")
+        self.version = version
+
+    def get_filter_mask(self, query_params: QueryParams) -> np.ndarray:
+        mask = np.ones(len(self.bodies), dtype=bool)
+
+        mask &= self.perform_equatorial_radial_search_mask(query_params)
+
+        mask &= self.perform_name_search_mask(query_params)
+
+        mask &= self.perform_constellation_search_mask(query_params)
+
+        mask &= self.perform_type_search_mask(query_params)
+
+        mask &= self.perform_catalogue_search_mask(query_params)
+
+        mask &= self.perform_horizontal_altitude_search_mask(query_params)
+
+        return mask
+
+    def perform_equatorial_radial_search_mask(
+        self, query_params: QueryParams
+    ) -> np.ndarray:
+        ra = getattr(query_params, "ra", None)
+
+        dec = getattr(query_params, "dec", None)
+
+        # Radius should be quoted in degrees:
+        radius = getattr(query_params, "radius", None) or 10
+
+        if ra is None or dec is None:
+            return True
+
+        ra, dec = np.radians(ra), np.radians(dec)
+
+        # Great-circle separation, compared by its cosine:
+        cos_separation = np.sin(self.dec) * np.sin(dec) + (
+            np.cos(self.dec) * np.cos(dec) * np.cos(self.ra - ra)
+        )
+
+        return cos_separation > np.cos(np.radians(radius))
+
+    def perform_name_search_mask(self, query_params: QueryParams) -> np.ndarray:
+        name = getattr(query_params, "name", None)
+
+        if not name:
+            return True
+
+        designation = parse_designation(name)
+
+        # Messier, New General & Index (and star) catalogue designations:
+        if designation:
+            mask = np.zeros(len(self.bodies), dtype=bool)
+
+            mask[self.designations.get(designation, [])] = True
+
+            return mask
+
+        # The LIKE semantics of the name filter, i.e., the (accent-insensitive)
+        # name or IAU name contains the name, or matches it as a pattern:
+        if any(c in name for c in LIKE_WILDCARDS):
+            pattern = get_like_pattern("%{0}%".format(fold(name)))
+
+            return np.array(
+                [
+                    bool(pattern.fullmatch(n) or pattern.fullmatch(i))
+                    for n, i in zip(self.name, self.iau)
+                ],
+                dtype=bool,
+            )
+
+        if settings.USE_NAME_INDEX and name_index.is_current(self.version):
+            return np.isin(self.uid, name_index.filter(name))
+
+        return (np.char.find(self.name, fold(name)) >= 0) | (
+            np.char.find(self.iau, fold(name)) >= 0
+        )
+
+    def perform_constellation_search_mask(
+        self, query_params: QueryParams
+    ) -> np.ndarray:
+        constellation = getattr(query_params, "constellation", None)
+
+        if not constellation:
+            return True
+
+        # Evaluate the substring match once per distinct constellation:
+        matches = np.char.find(self.constellation_values, constellation.lower()) >= 0
+
+        return matches[self.constellation_codes]
+
+    def perform_type_search_mask(self, query_params: QueryParams) -> np.ndarray:
+        type = getattr(query_params, "type", None)
+
+        if not type:
+            return True
+
+        # Evaluate the LIKE pattern once per distinct type, as CRUDBody does:
+        pattern = get_like_pattern(type)
+
+        matches = np.array(
+            [pattern.fullmatch(value) is not None for value in self.type_values],
+            dtype=bool,
+        )
+
+        return matches[self.type_codes]
+
+    def perform_catalogue_search_mask(self, query_params: QueryParams) -> np.ndarray:
+        catalogue = getattr(query_params, "catalogue", None)
+
+        # If no catalogue is specified, return all:
+        if not catalogue or catalogue == "all":
+            return True
+
+        catalogue = catalogue.strip().lower()
+
+        if catalogue == "messier":
+            return self.has_messier
+
+        if catalogue == "ngc":
+            return self.has_ngc
+
+        if catalogue == "ic":
+            return self.has_ic
+
+        return True
+
+    def get_altitude(self, LST: float, latitude: float) -> np.ndarray:
+        lat = np.radians(latitude)
+
+        return np.degrees(
+            np.arcsin(
+                np.sin(self.dec) * np.sin(lat)
+                + np.cos(self.dec) * np.cos(lat) * np.cos(np.radians(LST) - self.ra)
+            )
+        )
+
+    def perform_horizontal_altitude_search_mask(
+        self, query_params: QueryParams
+    ) -> np.ndarray:
+        mask = np.ones(len(self.bodies), dtype=bool)
+
+        d = self.parse_datetime(getattr(query_params, "datetime", None))
+
+        start = self.parse_datetime(getattr(query_params, "start", None))
+
+        end = self.parse_datetime(getattr(query_params, "end", None))
+
+        if not start or not end:
+            start, end = None, None
+
+        latitude = getattr(query_params, "latitude", None)
+
+        longitude = getattr(query_params, "longitude", None)
+
+        if latitude:
+            mask &= self.dec > np.radians(latitude - 90)
+
+        if d and latitude and longitude:
+            LST = Body.get_LST(d, latitude, longitude)
+
+            mask &= self.get_altitude(LST, latitude) > HORIZON_ALTITUDE
+
+        if start and end and latitude and longitude:
+            LSTr = Body.get_LST(start, latitude, longitude)
+
+            span = get_sidereal_span(start, end)
+
+            LSTs = (LSTr + span) % 360
+
+            # The bodies that transit above the altitude within the interval, or
+            # are otherwise above the altitude at the start or end of it:
+            ra = np.degrees(self.ra)
+
+            transits = np.zeros(len(self.bodies), dtype=bool)
+
+            for lower, upper in get_transiting_ra_ranges(LSTr, span):
+                transits |= (ra >= lower) & (ra <= upper)
+
+            transits &= np.abs(self.dec - np.radians(latitude)) < np.radians(
+                90 - HORIZON_ALTITUDE
+            )
+
+            mask &= (
+                transits
+                | (self.get_altitude(LSTr, latitude) > HORIZON_ALTITUDE)
+                | (self.get_altitude(LSTs, latitude) > HORIZON_ALTITUDE)
+            )
+
+        return mask
+
+    def parse_datetime(self, value: Optional[str]) -> Optional[datetime.datetime]:
+        try:
+            return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+        except (ValueError, TypeError):
+            return None
+
+
+class ColumnarCatalogue:
+    def __init__(self) -> None:
+        """
+        An in-memory, read-only columnar copy of the body table, which evaluates
+        every BodyQueryParams filter as a vectorized NumPy mask. The database
+        remains the source of truth, and the catalogue is refreshed from it.
+
+        The copy is tagged with the catalogue version it was loaded from, and is
+        reloaded whenever the catalogue version changes.
+        """
+        self.snapshot = ColumnarSnapshot([])
+
+        self.loaded_at: Optional[float] = None
+
+        self._lock = Lock()
+
+    @property
+    def version(self) -> Optional[int]:
+        return self.snapshot.version
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def is_stale(self, ttl: float, version: Optional[int] = None) -> bool:
+        return (
+            not self.is_loaded
+            or (version is not None and version != self.version)
+            or time.monotonic() - self.loaded_at > ttl
+        )
+
+    def refresh(self, db: Session, version: Optional[int] = None) -> None:
+        """
+        (Re)load the body table into NumPy column arrays, tagged with the given
+        catalogue version (read before the table, so that a concurrent write
+        leaves the copy tagged as behind, rather than ahead).
+        """
+        bodies = db.query(Body).all()
+
+        # Detach the bodies from the session so they remain readable once the
+        # session has been closed:
+        db.expunge_all()
+
+        snapshot = ColumnarSnapshot(bodies, version)
+
+        with self._lock:
+            self.snapshot = snapshot
+            self.loaded_at = time.monotonic()
+
+    def get_multi(
+        self,
+        *,
+        query_params: QueryParams,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        count: CountMode = "exact",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Any], Optional[int]]:
+        """
+        Filter and order the catalogue in exactly the same way as CRUDBody, i.e.,
+        by type rank, then by apparent magnitude in ascending order, then by uid.
+
+        The total is None for a count mode of "none", and is otherwise exact (as
+        the exact count of the mask is the best, and a free, estimate). Given
+        fields, the bodies are returned as rows of only those fields.
+        """
+        # Only the (immutable) snapshot is read under the lock, so that requests
+        # filter concurrently, and never see a partially reloaded catalogue:
+        with self._lock:
+            snapshot = self.snapshot
+
+        bodies, order, uid = snapshot.bodies, snapshot.order, snapshot.uid
+
+        mask = snapshot.get_filter_mask(query_params)
+
+        indices = np.flatnonzero(mask)
+
+        total = None if count == "none" else len(indices)
+
+        keys, uids = order[indices], uid[indices]
+
+        # Seek past the (type rank, magnitude, uid) of the last row of the
+        # previous page:
+        if cursor:
+            rank, magnitude, last = cursor
+
+            key = rank * 1e6 + magnitude
+
+            seek = (keys > key) | ((keys == key) & (uids > last))
+
+            indices, keys, uids, skip = indices[seek], keys[seek], uids[seek], 0
+
+        end = min(skip + limit, len(indices))
+
+        if skip >= end:
+            return [], total
+
+        # Only the first skip + limit rows (and any rows tied with the last of
+        # them) need to be fully ordered:
+        if end < len(indices):
+            kth = np.argpartition(keys, end - 1)[end - 1]
+
+            candidates = np.flatnonzero(keys <= keys[kth])
+        else:
+            candidates = np.arange(len(indices))
+
+        page = candidates[np.lexsort((uids[candidates], keys[candidates]))][skip:end]
+
+        results = [bodies[i] for i in indices[page]]
+
+        if fields:
+            Row = get_row_type(tuple(fields))
+
+            results = [Row(*(getattr(b, f) for f in fields)) for b in results]
+
+        return results, total
+
+
+catalogue = ColumnarCatalogue()
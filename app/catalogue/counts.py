@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Literal, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.metrics import observe_cache
+
+QueryParams = TypeVar("QueryParams", bound=BaseModel)
+
+CountMode = Literal["exact", "estimate", "none"]
+
+# The query parameters that control pagination and presentation, rather than
+# which bodies match, and so are excluded from the filter key:
+NON_FILTER_PARAMS = {"limit", "cursor", "count", "fields", "transits"}
+
+
+def get_filter_key(query_params: QueryParams) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Get a normalized, hashable key of the filters in the given query parameters,
+    i.e., their non-empty values sorted by name. String filters are stripped and
+    case-folded, as every string filter is matched case-insensitively.
+    """
+    params = {}
+
+    for name, value in dict(query_params).items():
+        if name in NON_FILTER_PARAMS or value is None or value == "":
+            continue
+
+        params[name] = value.strip().casefold() if isinstance(value, str) else value
+
+    return tuple(sorted(params.items()))
+
+
+class CountCache:
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        A least-recently-used cache of total counts keyed by the normalized
+        filter set, which is cleared whenever the catalogue version changes.
+        """
+        self.maxsize = maxsize
+
+        self.version: Optional[int] = None
+
+        self._counts: OrderedDict[Hashable, int] = OrderedDict()
+
+        self._lock = Lock()
+
+    def _check_version(self, version: int) -> None:
+        if version != self.version:
+            self._counts.clear()
+            self.version = version
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def get(self, version: int, key: Hashable) -> Optional[int]:
+        with self._lock:
+            self._check_version(version)
+
+            count = self._counts.get(key)
+
+            if count is not None:
+                self._counts.move_to_end(key)
+
+        observe_cache("count", count is not None)
+
+        return count
+
+    def set(self, version: int, key: Hashable, count: int) -> None:
+        with self._lock:
+            self._check_version(version)
+
+            self._counts[key] = count
+
+            self._counts.move_to_end(key)
+
+            while len(self._counts) > self.maxsize:
+                self._counts.popitem(last=False)
+
+
+count_cache = CountCache(maxsize=settings.COUNT_CACHE_SIZE)
@@ -0,0 +1,179 @@
+import re
+from typing import Any, List, Mapping, NamedTuple, Optional
+
+from app.astrometry.constellations import get_constellation_abbreviations
+
+# The catalogue (i.e., Body column) of each designation prefix:
+CATALOGUE_PREFIXES = {
+    "m": "messier",
+    "messier": "messier",
+    "ngc": "ngc",
+    "ic": "ic",
+    "hd": "hd",
+    "hr": "hr",
+    "hip": "hip",
+}
+
+# The catalogues (i.e., Body columns) that are indexed by catalogue number:
+CATALOGUES = ("messier", "ngc", "ic", "hd", "hr", "hip")
+
+DESIGNATION_PATTERN = re.compile(
+    r"^\s*(?P<prefix>{})\s*0*(?P<number>\d+)\s*$".format(
+        "|".join(sorted(CATALOGUE_PREFIXES, key=len, reverse=True))
+    ),
+    re.IGNORECASE,
+)
+
+# A stored catalogue number, e.g., "224", "0224" or "4715.0":
+NUMBER_PATTERN = re.compile(r"^0*(?P<number>\d+)(?:\.0*)?$")
+
+# The separators of a list of catalogue numbers, e.g., "6523, 6530":
+NUMBER_SEPARATOR_PATTERN = re.compile(r"[,;/\s]+")
+
+# The spelled-out name of each Greek letter of a Bayer designation:
+GREEK_LETTERS = {
+    "α": "Alpha",
+    "β": "Beta",
+    "γ": "Gamma",
+    "δ": "Delta",
+    "ε": "Epsilon",
+    "ζ": "Zeta",
+    "η": "Eta",
+    "θ": "Theta",
+    "ι": "Iota",
+    "κ": "Kappa",
+    "λ": "Lambda",
+    "μ": "Mu",
+    "ν": "Nu",
+    "ξ": "Xi",
+    "ο": "Omicron",
+    "π": "Pi",
+    "ρ": "Rho",
+    "σ": "Sigma",
+    "τ": "Tau",
+    "υ": "Upsilon",
+    "φ": "Phi",
+    "χ": "Chi",
+    "ψ": "Psi",
+    "ω": "Omega",
+}
+
+# The superscript digits distinguishing the stars of a Bayer designation, e.g.,
+# "υ² Cassiopeiae":
+SUPERSCRIPT_DIGITS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹", "0123456789")
+
+# A Bayer (Greek or Latin letter) or Flamsteed (number) designator, e.g., "α",
+# "υ²", "c" or "61":
+STELLAR_DESIGNATOR_PATTERN = re.compile(
+    r"^(?:[{}]|[A-Za-z]|\d+)[⁰¹²³⁴⁵⁶⁷⁸⁹]*$".format("".join(GREEK_LETTERS))
+)
+
+
+class Designation(NamedTuple):
+    # The catalogue, i.e., one of messier, ngc, ic, hd, hr or hip:
+    catalogue: str
+    # The catalogue number:
+    number: int
+
+
+def parse_designation(value: str) -> Optional[Designation]:
+    """
+    Parse a catalogue designation in any of its common forms, e.g., "M31",
+    "M 31", "Messier 31", "NGC 0224", "ic434", "HD358" or "HIP 677".
+
+    :param value: The designation
+    :return: The (catalogue, number) designation, or None if not recognised
+    """
+    match = DESIGNATION_PATTERN.match(value)
+
+    if not match:
+        return None
+
+    return Designation(
+        catalogue=CATALOGUE_PREFIXES[match.group("prefix").lower()],
+        number=int(match.group("number")),
+    )
+
+
+def parse_catalogue_numbers(value: Any) -> List[int]:
+    """
+    Parse the catalogue numbers of a stored catalogue column value, which may be
+    a single number, e.g., "224" or "4715.0", or a list of numbers, e.g.,
+    "6523, 6530". Placeholders, e.g., "_" or "", have no numbers.
+
+    :param value: The stored catalogue column value
+    :return: The catalogue numbers
+    """
+    if value is None:
+        return []
+
+    numbers = []
+
+    for token in NUMBER_SEPARATOR_PATTERN.split(str(value).strip()):
+        match = NUMBER_PATTERN.match(token)
+
+        if match:
+            numbers.append(int(match.group("number")))
+
+    return numbers
+
+
+def get_designations(values: Mapping[str, Any]) -> List[Designation]:
+    """
+    Get the distinct catalogue designations of a body, from its catalogue
+    column values.
+
+    :param values: The catalogue column values, keyed by column name
+    :return: The (catalogue, number) designations
+    """
+    designations: List[Designation] = []
+
+    for catalogue in CATALOGUES:
+        for number in parse_catalogue_numbers(values.get(catalogue)):
+            designation = Designation(catalogue=catalogue, number=number)
+
+            if designation not in designations:
+                designations.append(designation)
+
+    return designations
+
+
+def get_stellar_designations(
+    name: Optional[str], constellation: Optional[str]
+) -> List[str]:
+    """
+    Get the alternative forms of a Bayer, e.g., "α Orionis", or Flamsteed, e.g.,
+    "61 Cygni", designation, i.e., with the constellation abbreviated, e.g.,
+    "α Ori", and with any Greek letter spelled out, e.g., "Alpha Orionis".
+
+    :param name: The name of the star, i.e., designator and constellation genitive
+    :param constellation: The full IAU name of the constellation of the star
+    :return: The alternative forms of the designation, if any
+    """
+    if not name or not constellation:
+        return []
+
+    parts = name.split(" ", 1)
+
+    abbreviation = get_constellation_abbreviations().get(constellation)
+
+    if len(parts) != 2 or not abbreviation:
+        return []
+
+    designator, genitive = parts
+
+    if not STELLAR_DESIGNATOR_PATTERN.match(designator):
+        return []
+
+    digits = designator.translate(SUPERSCRIPT_DIGITS)
+
+    designators = [designator, digits]
+
+    if designator[0] in GREEK_LETTERS:
+        designators.append(GREEK_LETTERS[designator[0]] + digits[1:])
+
+    forms = [
+        "{} {}".format(d, c) for d in designators for c in (genitive, abbreviation)
+    ]
+
+    return [form for form in dict.fromkeys(forms) if form != name]
@@ -0,0 +1,261 @@
+import logging
+import unicodedata
+from threading import Lock, Thread
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.catalogue.designations import CATALOGUES, get_designations
+from app.models.body import MAGNITUDE_FALLBACK, Body
+
+# The longest n-grams indexed, i.e., trigrams (shorter queries are looked up
+# directly by their own unigram or bigram):
+NGRAM_SIZE = 3
+
+# The display prefix of each catalogue designation, e.g., "NGC224":
+CATALOGUE_DISPLAY_PREFIXES = {
+    "messier": "M",
+    "ngc": "NGC",
+    "ic": "IC",
+    "hd": "HD",
+    "hr": "HR",
+    "hip": "HIP",
+}
+
+# The rank of an exact, prefix and substring match, respectively:
+EXACT, PREFIX, SUBSTRING = 0, 1, 2
+
+# The characters of a LIKE pattern that the index cannot match literally:
+LIKE_WILDCARDS = ("%", "_", "\\")
+
+logger = logging.getLogger(__name__)
+
+
+def fold(value: str) -> str:
+    """
+    Fold the value for case- and accent-insensitive matching, in the manner of
+    the (accent- and case-insensitive) MySQL collation, e.g., "Mérope" to
+    "merope".
+    """
+    return "".join(
+        c for c in unicodedata.normalize("NFKD", value) if not unicodedata.combining(c)
+    ).casefold()
+
+
+def get_ngrams(value: str, size: int) -> Set[str]:
+    """
+    Get the distinct n-grams of the given size of the (case-folded) value.
+    """
+    return {value[i:][:size] for i in range(len(value) - size + 1)}
+
+
+class NameIndex:
+    def __init__(self) -> None:
+        """
+        An in-memory n-gram inverted index of the names, IAU names and catalogue
+        designations of every body, for case- and accent-insensitive substring
+        name search whose cost depends on the size of the (rarest) posting lists,
+        rather than on the size of the catalogue.
+
+        The index is tagged with the catalogue version it was built from, and is
+        rebuilt (in the background) whenever the catalogue version changes.
+        """
+        self.version: Optional[int] = None
+
+        self.uid = np.array([], dtype=np.str_)
+
+        self.m = np.array([], dtype=np.float64)
+
+        self.keys: List[Tuple[str, ...]] = []
+
+        self.names: List[Tuple[str, ...]] = []
+
+        self.postings: Dict[str, np.ndarray] = {}
+
+        self._lock = Lock()
+
+        self._builder: Optional[Thread] = None
+
+        self._builder_lock = Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.version is not None
+
+    def is_current(self, version: Optional[int]) -> bool:
+        return self.is_loaded and self.version == version
+
+    def schedule_refresh(
+        self, session_factory: Callable[[], Session], version: int
+    ) -> Thread:
+        """
+        (Re)build the index in a background thread, with its own session, unless
+        a build is already in progress, so that building never blocks a request.
+
+        :return: The thread of the (new or in progress) build
+        """
+        with self._builder_lock:
+            if self._builder is None or not self._builder.is_alive():
+                self._builder = Thread(
+                    target=self._build, args=(session_factory, version), daemon=True
+                )
+
+                self._builder.start()
+
+            return self._builder
+
+    def _build(self, session_factory: Callable[[], Session], version: int) -> None:
+        db = session_factory()
+        try:
+            self.refresh(db, version)
+        except SQLAlchemyError as e:
+            logger.warning("Building the name index failed: {}".format(e))
+        finally:
+            db.close()
+
+    def refresh(self, db: Session, version: int) -> None:
+        """
+        (Re)build the index from the body table.
+        """
+        columns = [getattr(Body, c) for c in CATALOGUES]
+
+        rows = db.query(Body.uid, Body.name, Body.iau, Body.m, *columns).all()
+
+        keys: List[Tuple[str, ...]] = []
+
+        names: List[Tuple[str, ...]] = []
+
+        postings: Dict[str, List[int]] = {}
+
+        for i, row in enumerate(rows):
+            values = [row.name, row.iau] + [
+                "{}{}".format(CATALOGUE_DISPLAY_PREFIXES[catalogue], number)
+                for catalogue, number in get_designations(row._mapping)
+            ]
+
+            key = tuple(dict.fromkeys(fold(v.strip()) for v in values if v))
+
+            keys.append(key)
+
+            # The (unstripped) names matched by the bodies list name filter:
+            names.append(tuple(fold(v) for v in (row.name, row.iau) if v))
+
+            grams = set()
+
+            for value in key:
+                for size in range(1, NGRAM_SIZE + 1):
+                    grams |= get_ngrams(value, size)
+
+            for gram in grams:
+                postings.setdefault(gram, []).append(i)
+
+        m = np.array(
+            [MAGNITUDE_FALLBACK if row.m is None else float(row.m) for row in rows],
+            dtype=np.float64,
+        )
+
+        with self._lock:
+            self.uid = np.array([str(row.uid) for row in rows], dtype=np.str_)
+            self.m = m
+            self.keys = keys
+            self.names = names
+            self.postings = {
+                gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()
+            }
+            self.version = version
+
+    def get_candidates(self, query: str) -> np.ndarray:
+        """
+        Get the (sorted) ids of the bodies containing every n-gram of the query,
+        i.e., a superset of the bodies containing the query as a substring.
+        """
+        if len(query) <= NGRAM_SIZE:
+            return self.postings.get(query, np.array([], dtype=np.int32))
+
+        # Intersect the posting lists from the rarest trigram upwards:
+        lists = sorted(
+            (
+                self.postings.get(gram, np.array([], dtype=np.int32))
+                for gram in get_ngrams(query, NGRAM_SIZE)
+            ),
+            key=len,
+        )
+
+        candidates = lists[0]
+
+        for ids in lists[1:]:
+            if not len(candidates):
+                break
+
+            candidates = np.intersect1d(candidates, ids, assume_unique=True)
+
+        return candidates
+
+    def search(self, name: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Search for the bodies whose name, IAU name or catalogue designation
+        contains the given name (case- and accent-insensitively), ranked by
+        exact, then prefix, then substring matches, then by apparent magnitude.
+
+        :param name: The (partial) name to search for
+        :param limit: The maximum number of uids to return, or None for all
+        :return: The uids of the matching bodies
+        """
+        query = fold(name.strip())
+
+        if not query:
+            return []
+
+        with self._lock:
+            uid, m, keys = self.uid, self.m, self.keys
+            candidates = self.get_candidates(query)
+
+        ids, ranks = [], []
+
+        for i in candidates:
+            rank = min(
+                (
+                    EXACT
+                    if value == query
+                    else PREFIX
+                    if value.startswith(query)
+                    else SUBSTRING
+                    for value in keys[i]
+                    if query in value
+                ),
+                default=None,
+            )
+
+            if rank is not None:
+                ids.append(i)
+                ranks.append(rank)
+
+        if not ids:
+            return []
+
+        ids = np.array(ids, dtype=np.int64)
+
+        order = np.lexsort((uid[ids], m[ids], np.array(ranks)))
+
+        return uid[ids[order][:limit]].tolist()
+
+    def filter(self, name: str) -> List[str]:
+        """
+        Get the uids of the bodies whose name or IAU name contains the given name
+        (case- and accent-insensitively), i.e., the matches of the bodies list
+        name filter, in no particular order.
+        """
+        query = fold(name)
+
+        with self._lock:
+            uid, names = self.uid, self.names
+            candidates = self.get_candidates(query) if query else np.arange(len(names))
+
+        ids = [i for i in candidates if any(query in value for value in names[i])]
+
+        return uid[np.array(ids, dtype=np.int64)].tolist()
+
+
+name_index = NameIndex()
@@ -0,0 +1,178 @@
+from threading import Lock
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.catalogue.designations import (
+    CATALOGUES,
+    get_designations,
+    get_stellar_designations,
+)
+from app.catalogue.names import CATALOGUE_DISPLAY_PREFIXES
+from app.models.body import MAGNITUDE_FALLBACK, Body
+
+# The number of candidate entries ranked per requested suggestion, which bounds
+# the cost of an unselective prefix (e.g., "a") whilst leaving room for the
+# several forms of each body that share a prefix:
+CANDIDATES_PER_SUGGESTION = 16
+
+
+class Suggestion(NamedTuple):
+    # The matching form of the body's name, e.g., "α Ori":
+    text: str
+    uid: str
+    name: str
+    iau: str
+    m: Optional[float]
+
+
+class SuggestionIndex:
+    def __init__(self) -> None:
+        """
+        An in-memory sorted array of every searchable form of every body's name,
+        i.e., its name, IAU name, Bayer or Flamsteed designation forms and its
+        catalogue designations, for typeahead suggestions by binary search on
+        the (case-folded) prefix, weighted by brightness.
+
+        The index is tagged with the catalogue version it was built from, and is
+        rebuilt whenever the catalogue version changes.
+        """
+        self.version: Optional[int] = None
+
+        self.keys = np.array([], dtype=np.str_)
+
+        self.texts: List[str] = []
+
+        self.ids = np.array([], dtype=np.int32)
+
+        self.m = np.array([], dtype=np.float64)
+
+        self.bodies: List[Dict[str, Any]] = []
+
+        self._lock = Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.version is not None
+
+    def refresh(self, db: Session, version: int) -> None:
+        """
+        (Re)build the index from the body table.
+        """
+        columns = [getattr(Body, c) for c in CATALOGUES]
+
+        rows = db.query(
+            Body.uid, Body.name, Body.iau, Body.m, Body.constellation, *columns
+        ).all()
+
+        bodies: List[Dict[str, Any]] = []
+
+        texts: List[str] = []
+
+        ids: List[int] = []
+
+        for i, row in enumerate(rows):
+            bodies.append(
+                {
+                    "uid": str(row.uid),
+                    "name": row.name or "",
+                    "iau": row.iau or "",
+                    "m": None if row.m is None else float(row.m),
+                }
+            )
+
+            forms = [row.name, row.iau]
+
+            forms += get_stellar_designations(row.name, row.constellation)
+
+            for catalogue, number in get_designations(row._mapping):
+                prefix = CATALOGUE_DISPLAY_PREFIXES[catalogue]
+
+                forms += ["{}{}".format(prefix, number), "{} {}".format(prefix, number)]
+
+            for form in dict.fromkeys(f.strip() for f in forms if f and f.strip()):
+                texts.append(form)
+                ids.append(i)
+
+        keys = np.array([text.casefold() for text in texts], dtype=np.str_)
+
+        order = np.argsort(keys, kind="stable")
+
+        ids = np.array(ids, dtype=np.int32)[order]
+
+        m = np.array(
+            [MAGNITUDE_FALLBACK if body["m"] is None else body["m"] for body in bodies],
+            dtype=np.float64,
+        )
+
+        with self._lock:
+            self.keys = keys[order]
+            self.texts = [texts[i] for i in order]
+            self.ids = ids
+            self.m = m[ids]
+            self.bodies = bodies
+            self.version = version
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Suggestion]:
+        """
+        Suggest the bodies with any name form starting with the given prefix
+        (case-insensitively), exact matches first, then brightest first.
+
+        :param prefix: The prefix typed so far, e.g., "Bet"
+        :param limit: The maximum number of suggestions
+        :return: At most one suggestion per body, with its matching name form
+        """
+        query = prefix.strip().casefold()
+
+        if not query:
+            return []
+
+        with self._lock:
+            keys, texts, ids, m, bodies = (
+                self.keys,
+                self.texts,
+                self.ids,
+                self.m,
+                self.bodies,
+            )
+
+        # Every key starting with the query sorts within [query, query + U+10FFFF):
+        start = np.searchsorted(keys, query, side="left")
+
+        end = np.searchsorted(keys, query + "\U0010ffff", side="left")
+
+        if start >= end:
+            return []
+
+        # Exact matches outrank any prefix match, then the brightest bodies:
+        score = m[start:end] + np.where(keys[start:end] == query, -1e6, 0)
+
+        candidates = np.arange(start, end)
+
+        k = limit * CANDIDATES_PER_SUGGESTION
+
+        if len(candidates) > k:
+            partition = np.argpartition(score, k)[:k]
+
+            candidates, score = candidates[partition], score[partition]
+
+        suggestions: List[Suggestion] = []
+
+        seen = set()
+
+        for i in candidates[np.argsort(score, kind="stable")]:
+            if ids[i] in seen:
+                continue
+
+            seen.add(ids[i])
+
+            suggestions.append(Suggestion(text=texts[i], **bodies[ids[i]]))
+
+            if len(suggestions) >= limit:
+                break
+
+        return suggestions
+
+
+suggestion_index = SuggestionIndex()
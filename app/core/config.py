@@ -73,8 +73,40 @@ class Settings(BaseSettings):
             path=f"/{values.get('MYSQL_DATABASE') or ''}",
         )
 
+    # The async (aiomysql) DSN of the same database, used by the API endpoints so
+    # that database round trips do not block the event loop:
+    SQLALCHEMY_ASYNC_DATABASE_URI: Optional[str] = None
+
+    @validator("SQLALCHEMY_ASYNC_DATABASE_URI", pre=True)
+    def assemble_async_db_connection(
+        cls, v: Optional[str], values: Dict[str, Any]
+    ) -> Any:
+        if isinstance(v, str):
+            return v
+        return MySQLDsn.build(
+            scheme="mysql+aiomysql",
+            user=values.get("MYSQL_USER"),
+            password=values.get("MYSQL_PASSWORD"),
+            host=values.get("MYSQL_HOST"),
+            port=values.get("MYSQL_PORT"),
+            path=f"/{values.get('MYSQL_DATABASE') or ''}",
+        )
+
     USE_CLOUD_SQL: Optional[bool] = False
 
+    # The connection pool of each (sync and async) engine, sized to the Cloud Run
+    # concurrency, where connections are recycled before the server (or Cloud SQL
+    # proxy) closes them, and checked for liveness on checkout if pre-pinged:
+    DATABASE_POOL_SIZE: int = 5
+
+    DATABASE_MAX_OVERFLOW: int = 10
+
+    DATABASE_POOL_RECYCLE: int = 1800
+
+    DATABASE_POOL_TIMEOUT: int = 30
+
+    DATABASE_POOL_PRE_PING: bool = True
+
     CLOUDRUN_SERVICE_URL: Optional[str] = None
 
     @validator("CLOUDRUN_SERVICE_URL", pre=True)
@@ -91,6 +123,69 @@ class Settings(BaseSettings):
             return v
         return None
 
+    # Serve the bodies endpoints from an in-memory columnar copy of the catalogue,
+    # reloaded from the database whenever the catalogue version changes, and at
+    # least every COLUMNAR_CATALOGUE_TTL seconds:
+    USE_COLUMNAR_CATALOGUE: bool = False
+
+    COLUMNAR_CATALOGUE_TTL: int = 3600
+
+    # Serve name searches from an in-memory n-gram index of the body names,
+    # rebuilt whenever the catalogue version changes:
+    USE_NAME_INDEX: bool = True
+
+    # The maximum number of name index matches filtered by uid, beyond which
+    # the (unselective) name search falls back to a scan:
+    NAME_INDEX_MAX_MATCHES: int = 5000
+
+    # Build the typeahead suggestion index in the background on startup, rather
+    # than on the first autocomplete request:
+    PRELOAD_SUGGESTION_INDEX: bool = False
+
+    # The number of seconds for which the body catalogue version is memoized:
+    CATALOGUE_VERSION_TTL: int = 5
+
+    # The maximum number of total counts cached per worker:
+    COUNT_CACHE_SIZE: int = 1024
+
+    # Cache the bodies list responses (in Redis, when REDIS_DSN is set) keyed by
+    # the normalized query parameters and the catalogue version:
+    USE_RESPONSE_CACHE: bool = True
+
+    # The maximum number of responses cached in-process per worker, in front of
+    # Redis:
+    RESPONSE_CACHE_SIZE: int = 256
+
+    # The number of decimal places to which coordinates are rounded in cache keys:
+    RESPONSE_CACHE_COORDINATE_PRECISION: int = 6
+
+    # The number of seconds for which responses are kept in Redis, which is short,
+    # as the responses of a superseded catalogue version are never read again:
+    RESPONSE_CACHE_EXPIRE: int = 3600
+
+    # Collect request, database and cache metrics, exported for Prometheus at
+    # /metrics (opt-in, as the endpoint is public on the API port, so should only
+    # be enabled where it is not reachable from outside, e.g., behind a proxy):
+    USE_METRICS: bool = False
+
+    # Time the SQL statements of every request by CRUD stage (e.g., the count and
+    # the page fetch), returned in the Server-Timing header, for profiling:
+    USE_SQL_TIMING: bool = False
+
+    # The number of seconds above which a timed statement is logged with its
+    # EXPLAIN plan:
+    SQL_SLOW_STATEMENT_SECONDS: float = 0.5
+
+    # The number of rows fetched from the server-side cursor per batch on export:
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # The number of rows inserted per batch (and transaction) when seeding:
+    SEED_BATCH_SIZE: int = 1000
+
+    # The number of rows updated per batch (and transaction) when recomputing
+    # the constellations:
+    CONSTELLATION_BATCH_SIZE: int = 10000
+
     SENTRY_DSN: Optional[HttpUrl]
 
     @validator("SENTRY_DSN", pre=True)
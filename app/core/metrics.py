@@ -0,0 +1,188 @@
+import time
+from contextvars import ContextVar
+from typing import Iterable, Optional, Tuple
+
+from fastapi import FastAPI, Request, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+# The filter set of each bodies query parameter, i.e., the filter it activates
+# (where the observer's latitude and longitude alone filter nothing):
+FILTER_SETS = {
+    "ra": "cone",
+    "dec": "cone",
+    "radius": "cone",
+    "name": "name",
+    "iau": "name",
+    "constellation": "constellation",
+    "type": "type",
+    "catalogue": "catalogue",
+    "datetime": "altitude",
+    "start": "altitude",
+    "end": "altitude",
+}
+
+# The route label of requests that match no route, e.g., a 404, so that
+# arbitrary paths cannot inflate the number of labelled series:
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_LATENCY = Histogram(
+    "perseus_request_duration_seconds",
+    "The latency of each request, by route and active filter set.",
+    ["route", "filters"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+REQUEST_DATABASE_QUERIES = Histogram(
+    "perseus_request_database_queries",
+    "The number of database statements executed per request, by route.",
+    ["route"],
+    buckets=(0, 1, 2, 3, 4, 5, 8, 13, 21),
+)
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "perseus_database_pool_checkout_seconds",
+    "The time spent waiting to check out a connection from the pool.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1, 5, 30),
+)
+
+POOL_CONNECTIONS_IN_USE = Gauge(
+    "perseus_database_pool_connections_in_use",
+    "The number of pooled connections currently checked out.",
+)
+
+CACHE_REQUESTS = Counter(
+    "perseus_cache_requests",
+    "The number of cache lookups, by cache and result (hit or miss).",
+    ["cache", "result"],
+)
+
+# The cache lookup counters, bound to their labels once rather than on every
+# lookup in the hot path:
+CACHE_RESULTS = {
+    (cache, hit): CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss")
+    for cache in ("response", "count")
+    for hit in (True, False)
+}
+
+
+class RequestStats:
+    __slots__ = ("queries",)
+
+    def __init__(self) -> None:
+        """
+        The statistics of the current request, shared (by reference) with the
+        tasks and threads that handle it.
+        """
+        self.queries = 0
+
+
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def get_filter_set(params: Iterable[Tuple[str, str]]) -> str:
+    """
+    Get the label of the active filter set of the given query parameters, e.g.,
+    "altitude+cone", or "none" if no filter is active.
+    """
+    filters = {
+        FILTER_SETS[name] for name, value in params if value and name in FILTER_SETS
+    }
+
+    return "+".join(sorted(filters)) or "none"
+
+
+def observe_cache(cache: str, hit: bool) -> None:
+    CACHE_RESULTS[cache, hit].inc()
+
+
+def observe_request(
+    route: Optional[str], filters: str, seconds: float, stats: RequestStats
+) -> None:
+    route = route or UNMATCHED_ROUTE
+
+    REQUEST_LATENCY.labels(route=route, filters=filters).observe(seconds)
+
+    REQUEST_DATABASE_QUERIES.labels(route=route).observe(stats.queries)
+
+
+def add_metrics(app: FastAPI) -> None:
+    """
+    Observe every request of the app, and export the metrics at /metrics.
+    """
+
+    async def metrics():
+        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+    async def observe_request_metrics(request: Request, call_next):
+        stats = RequestStats()
+
+        token = request_stats.set(stats)
+
+        start = time.perf_counter()
+
+        try:
+            response = await call_next(request)
+        finally:
+            request_stats.reset(token)
+
+        # The route (path template) is set on the scope once the request is routed:
+        route = request.scope.get("route")
+
+        observe_request(
+            route.path if route else None,
+            get_filter_set(request.query_params.items()),
+            time.perf_counter() - start,
+            stats,
+        )
+
+        return response
+
+    app.add_api_route("/metrics", metrics, include_in_schema=False)
+
+    app.middleware("http")(observe_request_metrics)
+
+
+class MonitoredPoolMixin:
+    """
+    Times the checkout of every connection from the pool, i.e., the wait for a
+    free connection (or a new connection, up to the overflow) and its pre-ping.
+    """
+
+    def connect(self):
+        start = time.perf_counter()
+
+        try:
+            return super().connect()
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def receive_before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    stats = request_stats.get()
+
+    if stats is not None:
+        stats.queries += 1
+
+
+@event.listens_for(Pool, "checkout")
+def receive_checkout(dbapi_connection, connection_record, connection_proxy):
+    POOL_CONNECTIONS_IN_USE.inc()
+
+
+@event.listens_for(Pool, "checkin")
+def receive_checkin(dbapi_connection, connection_record):
+    POOL_CONNECTIONS_IN_USE.dec()
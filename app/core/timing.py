@@ -0,0 +1,167 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# The stage of statements executed outside of any CRUD stage, e.g., the lookup
+# of the catalogue version:
+DEFAULT_STAGE = "other"
+
+# The EXPLAIN prefix of each dialect, whose plans are logged for slow statements:
+EXPLAIN_PREFIXES = {
+    "mysql": "EXPLAIN ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+
+
+class RequestTiming:
+    __slots__ = ("stage", "durations", "statements")
+
+    def __init__(self) -> None:
+        """
+        The SQL statement time of the current request, attributed to the stage
+        (e.g., the count or the page fetch) that executed each statement.
+        """
+        self.stage = DEFAULT_STAGE
+
+        self.durations: Dict[str, float] = {}
+
+        self.statements: Dict[str, int] = {}
+
+    def add(self, seconds: float) -> None:
+        self.durations[self.stage] = self.durations.get(self.stage, 0) + seconds
+
+        self.statements[self.stage] = self.statements.get(self.stage, 0) + 1
+
+    def get_server_timing(self, total: Optional[float] = None) -> str:
+        """
+        Get the Server-Timing header value of the statement time of each stage
+        (in milliseconds), e.g., 'db-count;dur=12.1;desc="1 statement"', and of
+        the whole request, if given.
+        """
+        metrics = [
+            'db-{};dur={:.1f};desc="{} statement{}"'.format(
+                stage,
+                seconds * 1000,
+                self.statements[stage],
+                "" if self.statements[stage] == 1 else "s",
+            )
+            for stage, seconds in self.durations.items()
+        ]
+
+        if total is not None:
+            metrics.append("total;dur={:.1f}".format(total * 1000))
+
+        return ", ".join(metrics)
+
+
+request_timing: ContextVar[Optional[RequestTiming]] = ContextVar(
+    "request_timing", default=None
+)
+
+
+@contextmanager
+def sql_stage(name: str) -> Iterator[None]:
+    """
+    Attribute the statements executed within the block to the named stage of
+    the current request, if it is being timed.
+    """
+    timing = request_timing.get()
+
+    if timing is None:
+        yield
+        return
+
+    previous, timing.stage = timing.stage, name
+
+    try:
+        yield
+    finally:
+        timing.stage = previous
+
+
+def explain(conn, statement: str, parameters: Any) -> Optional[list]:
+    """
+    Get the query plan of the statement on a new cursor of the same DBAPI
+    connection, or None if the dialect has no (supported) EXPLAIN.
+    """
+    prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+
+    if prefix is None:
+        return None
+
+    cursor = conn.connection.cursor()
+
+    try:
+        cursor.execute(prefix + statement, parameters)
+
+        columns = [column[0] for column in cursor.description or []]
+
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def receive_before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    if request_timing.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def receive_after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    timing = request_timing.get()
+
+    if timing is None or not conn.info.get("query_start_time"):
+        return
+
+    seconds = time.perf_counter() - conn.info["query_start_time"].pop()
+
+    timing.add(seconds)
+
+    if seconds < settings.SQL_SLOW_STATEMENT_SECONDS:
+        return
+
+    # Only single SELECTs are explained, and not those streamed from a server-side
+    # cursor, whose rows are still pending on the connection:
+    if (
+        executemany
+        or not statement.lstrip().upper().startswith("SELECT")
+        or context.execution_options.get("stream_results")
+    ):
+        plan = None
+    else:
+        try:
+            plan = explain(conn, statement, parameters)
+        except Exception as e:
+            plan = "EXPLAIN failed: {}".format(e)
+
+    logger.warning(
+        "Slow SQL statement in the %s stage (%.1f ms): %s %r, plan: %s",
+        timing.stage,
+        seconds * 1000,
+        statement,
+        parameters,
+        plan,
+    )
+
+
+def enable_sql_timing() -> None:
+    """
+    Time every SQL statement executed (by any engine) within a timed request.
+    """
+    if not event.contains(
+        Engine, "before_cursor_execute", receive_before_cursor_execute
+    ):
+        event.listen(Engine, "before_cursor_execute", receive_before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", receive_after_cursor_execute)
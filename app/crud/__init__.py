@@ -1 +1,2 @@
 from .crud_body import body
+from .crud_catalogue import catalogue_version
@@ -1,7 +1,9 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar, Union
 
+from fastapi.concurrency import run_in_threadpool
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.db.base_class import Base
@@ -9,6 +11,23 @@ from app.db.base_class import Base
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+ResultType = TypeVar("ResultType")
+
+
+async def run_async(
+    db: Union[AsyncSession, Session],
+    fn: Callable[..., ResultType],
+    *args: Any,
+    **kwargs: Any
+) -> ResultType:
+    """
+    Run the sync function fn(session, *args, **kwargs) without blocking the
+    event loop, i.e., on the async driver for an AsyncSession, or otherwise in
+    the threadpool.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
 
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
@@ -21,6 +40,15 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
+    async def run_async(
+        self,
+        db: Union[AsyncSession, Session],
+        fn: Callable[..., ResultType],
+        *args: Any,
+        **kwargs: Any
+    ) -> ResultType:
+        return await run_async(db, fn, *args, **kwargs)
+
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
         return db.query(self.model).filter(self.model.id == id).first()
 
@@ -1,23 +1,95 @@
 import datetime
-from typing import List, Tuple, TypeVar
-
+import logging
+import math
+import time
+from itertools import islice
+from logging import Logger
+from threading import Thread
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import numpy as np
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import case, or_
-from sqlalchemy.orm import Query, Session
-from sqlalchemy.sql import func
-
+from sqlalchemy import bindparam, case, insert, or_, select, tuple_, update
+from sqlalchemy.engine import Dialect, Row
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session, aliased
+from sqlalchemy.sql import ColumnElement, Select, func
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from app.astrometry import healpix
+from app.astrometry.constellations import get_constellations
+from app.astrometry.transits import (
+    get_sidereal_span,
+    get_transit_offsets,
+    get_transiting_ra_ranges,
+)
+from app.astrometry.vectors import get_declination_band, radec_to_vector, zenith_vector
+from app.catalogue import catalogue, name_index, suggestion_index
+from app.catalogue.columnar import Cursor
+from app.catalogue.counts import CountMode, count_cache, get_filter_key
+from app.catalogue.designations import parse_designation
+from app.catalogue.names import LIKE_WILDCARDS
+from app.catalogue.suggestions import Suggestion
+from app.core.config import settings
+from app.core.timing import sql_stage
 from app.crud.base import CRUDBase
+from app.crud.crud_catalogue import catalogue_version
 from app.db.base_class import Base
-from app.models.body import Body
+from app.models.body import (
+    BODY_TYPE_ORDER,
+    HORIZON_ALTITUDE,
+    MAGNITUDE_FALLBACK,
+    Body,
+    generate_uuid,
+    get_position_columns,
+)
+from app.models.catalogue import CatalogueVersion
+from app.models.designation import BodyDesignation
 from app.schemas.body import BodyCreate, BodyUpdate
 
+logger = logging.getLogger(__name__)
+
 ModelType = TypeVar("ModelType", bound=Base)
 
 QueryParams = TypeVar("QueryParams", bound=BaseModel)
 
+# The fields from which the (type rank, magnitude, uid) cursor is built:
+CURSOR_FIELDS = ("uid", "type", "m")
+
+# The BodyCreate defaults, applied to pre-validated rows that omit fields, so that
+# every row of an executemany batch has the same parameters:
+BULK_ROW_DEFAULTS = {
+    name: field.default for name, field in BodyCreate.__fields__.items()
+}
+
+# The column key of each Body attribute, where they differ (e.g., "m" is stored
+# as "apparent_magnitude"), as Core inserts are keyed by column, not attribute:
+BULK_COLUMN_KEYS = {
+    prop.key: prop.columns[0].key for prop in Body.__mapper__.column_attrs
+}
+
 
 class CRUDBody(CRUDBase[Body, BodyCreate, BodyUpdate]):
+    # The session factory of the background name index builds, where None is the
+    # app's SessionLocal (e.g., the benchmark sets that of its own database):
+    session_factory: Optional[Callable[[], Session]] = None
+
     def get_or_create(
         self, db: Session, body: BodyCreate, **kwargs
     ) -> Tuple[Body, bool]:
@@ -54,6 +126,173 @@ class CRUDBody(CRUDBase[Body, BodyCreate, BodyUpdate]):
         db.refresh(db_obj)
         return db_obj
 
+    def get_bulk_row(self, body: Union[BodyCreate, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get the insert parameters of a body, which may be given as a BodyCreate,
+        or as a pre-validated dict of BodyCreate fields (skipping the cost of
+        constructing the model for every row).
+        """
+        if isinstance(body, BodyCreate):
+            body = body.dict()
+
+        row = {**BULK_ROW_DEFAULTS, **body}
+
+        row.setdefault("uid", generate_uuid())
+
+        # Bulk inserts bypass the ORM events, so derive the position columns here:
+        if row["ra"] is not None and row["dec"] is not None:
+            row.update(get_position_columns(float(row["ra"]), float(row["dec"])))
+
+        return row
+
+    def create_multi(
+        self,
+        db: Session,
+        bodies: Iterable[Union[BodyCreate, Dict[str, Any]]],
+        *,
+        batch_size: int = 1000,
+        logger: Optional[Logger] = None,
+    ) -> int:
+        """
+        Insert the bodies in batches of batch_size rows, each as a single
+        executemany INSERT within its own transaction.
+        """
+        count = 0
+
+        started = time.perf_counter()
+
+        rows = (self.get_bulk_row(body) for body in bodies)
+
+        while True:
+            batch = list(islice(rows, batch_size))
+
+            if not batch:
+                break
+
+            self.resolve_constellations(batch)
+
+            db.execute(
+                insert(Body.__table__),
+                [
+                    {
+                        BULK_COLUMN_KEYS.get(key, key): value
+                        for key, value in row.items()
+                    }
+                    for row in batch
+                ],
+            )
+
+            BodyDesignation.create_multi(db.connection(), batch)
+
+            # Core inserts do not flush through the session, so bump explicitly:
+            CatalogueVersion.bump(db.connection())
+
+            db.commit()
+
+            count += len(batch)
+
+            if logger:
+                elapsed = time.perf_counter() - started
+
+                logger.info(
+                    "Inserted {} Bodies ({:.0f} rows/s)".format(
+                        count, count / elapsed if elapsed else 0
+                    )
+                )
+
+        return count
+
+    def resolve_constellations(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Resolve the constellation of every row (with a position) that does not
+        already have one, in a single vectorized lookup.
+        """
+        missing = [
+            row
+            for row in rows
+            if not row.get("constellation")
+            and row["ra"] is not None
+            and row["dec"] is not None
+        ]
+
+        if not missing:
+            return
+
+        constellations = get_constellations(
+            [float(row["ra"]) for row in missing],
+            [float(row["dec"]) for row in missing],
+        )
+
+        for row, constellation in zip(missing, constellations):
+            row["constellation"] = str(constellation)
+
+    def update_constellations(
+        self,
+        db: Session,
+        *,
+        batch_size: int = 10000,
+        logger: Optional[Logger] = None,
+    ) -> int:
+        """
+        Recompute the constellation of every body from its { ra, dec }, in batches
+        of batch_size rows, each as a single executemany UPDATE within its own
+        transaction.
+
+        Batches are read by keyset (uid), so only one batch is held in memory,
+        and each read is an indexed range scan that survives the commits.
+        """
+        count = 0
+
+        started = time.perf_counter()
+
+        last_uid: Optional[str] = None
+
+        while True:
+            query = db.query(Body.uid, Body.ra, Body.dec).filter(
+                Body.ra.isnot(None), Body.dec.isnot(None)
+            )
+
+            if last_uid is not None:
+                query = query.filter(Body.uid > last_uid)
+
+            batch = query.order_by(Body.uid).limit(batch_size).all()
+
+            if not batch:
+                break
+
+            last_uid = batch[-1].uid
+
+            constellations = get_constellations(
+                [float(row.ra) for row in batch], [float(row.dec) for row in batch]
+            )
+
+            db.execute(
+                update(Body.__table__)
+                .where(Body.__table__.c.uid == bindparam("_uid"))
+                .values(constellation=bindparam("constellation")),
+                [
+                    {"_uid": row.uid, "constellation": str(constellation)}
+                    for row, constellation in zip(batch, constellations)
+                ],
+            )
+
+            CatalogueVersion.bump(db.connection())
+
+            db.commit()
+
+            count += len(batch)
+
+            if logger:
+                elapsed = time.perf_counter() - started
+
+                logger.info(
+                    "Updated {} Constellations ({:.0f} rows/s)".format(
+                        count, count / elapsed if elapsed else 0
+                    )
+                )
+
+        return count
+
     def get_filter_query(self, query: Query, query_params: QueryParams):
         query = self.perform_equatorial_radial_search_filter(query, query_params)
 
@@ -80,16 +319,22 @@ class CRUDBody(CRUDBase[Body, BodyCreate, BodyUpdate]):
         # Radius should be quoted in degrees:
         radius = getattr(query_params, "radius", None) or 10
 
-        # Performs a radial search for the given { ra, dec } point in the DB:
-        if ra and dec and radius:
-            query = query.filter(
-                func.sqrt(
-                    func.pow(self.model.ra - ra, 2) + func.pow(self.model.dec - dec, 2)
-                )
-                < radius
-            )
+        if ra is None or dec is None:
+            return query
 
-        return query
+        # Prefilter on the indexed HEALPix pixel ranges covering the cone:
+        ranges = healpix.query_disc(ra, dec, radius)
+
+        query = query.filter(
+            or_(*[self.model.healpix.between(start, end) for start, end in ranges])
+        )
+
+        # Performs an exact great-circle radial search for the given { ra, dec }
+        # point across the candidates from the prefilter, where the cosine of the
+        # separation is the dot product of the unit vectors:
+        return query.filter(
+            self.model.dot(radec_to_vector(ra, dec)) > math.cos(math.radians(radius))
+        )
 
     def perform_horizontal_altitude_search_filter(
         self, query: Query, query_params: QueryParams
@@ -128,24 +373,46 @@ class CRUDBody(CRUDBase[Body, BodyCreate, BodyUpdate]):
 
         longitude = getattr(query_params, "longitude", None)
 
+        if not (latitude and longitude and (d or (start and end))):
+            return query
+
+        # Restrict to the band of declinations that can ever reach the altitude,
+        # which can use the index on the unit vector z (i.e., sin(dec)) column:
+        lower, upper = get_declination_band(latitude, HORIZON_ALTITUDE)
+
+        query = query.filter(self.model.uz.between(lower, upper))
+
+        # The sine of the altitude is the dot product with the zenith unit vector:
+        horizon = math.sin(math.radians(HORIZON_ALTITUDE))
+
         # Performs a search for the give body above a local altitude of 15 degrees
         # (above horizon) in the DB:
-        if d and latitude and longitude:
+        if d:
             LST = self.model.get_LST(d, latitude, longitude)
 
-            query = query.filter(self.model.altitude(LST, latitude) > 15)
+            query = query.filter(self.model.dot(zenith_vector(LST, latitude)) > horizon)
 
         # Performs a search for the give body above a local altitude of 15 degrees
-        # (above horizon) between the given start and end datetime interval in the DB:
-        if start and end and latitude and longitude:
+        # (above horizon) at any instant between the given start and end datetime
+        # interval in the DB. Within the declination band, every body transits
+        # above the altitude, so its maximum altitude over the interval is above
+        # the altitude if it transits within the interval, or otherwise if it is
+        # above the altitude at either the start or end of the interval:
+        if start and end:
             LSTr = self.model.get_LST(start, latitude, longitude)
 
-            LSTs = self.model.get_LST(end, latitude, longitude)
+            span = get_sidereal_span(start, end)
+
+            LSTs = (LSTr + span) % 360
 
             query = query.filter(
                 or_(
-                    self.model.altitude(LSTr, latitude) > 15,
-                    self.model.altitude(LSTs, latitude) > 15,
+                    *[
+                        self.model.ra.between(lower, upper)
+                        for lower, upper in get_transiting_ra_ranges(LSTr, span)
+                    ],
+                    self.model.dot(zenith_vector(LSTr, latitude)) > horizon,
+                    self.model.dot(zenith_vector(LSTs, latitude)) > horizon,
                 )
             )
 
@@ -160,38 +427,32 @@ class CRUDBody(CRUDBase[Body, BodyCreate, BodyUpdate]):
         if not name:
             return query
 
-        # If the name starts with "M", then we need to
-        # filter by the Messier catalogue:
-        if (
-            name.lower().strip().startswith("m")
-            and len(name) >= 2
-            and name[1:].isdigit()
-        ):
-            return query.filter(
-                self.model.messier.op("LIKE")("%{0}%".format(name[1:])),
-            )
+        designation = parse_designation(name)
 
-        # If the name starts with "NGC", then we need to
-        # filter by the New General catalogue:
-        if (
-            name.lower().strip().startswith("ngc")
-            and len(name) >= 4
-            and name[3:].isdigit()
-        ):
+        # If the name is a catalogue designation, e.g., "M31", "NGC 224" or
+        # "HD358", then we need an exact (indexed) match on the catalogue number:
+        if designation:
             return query.filter(
-                self.model.ngc.op("LIKE")("%{0}%".format(name[3:])),
+                self.model.uid.in_(
+                    select(BodyDesignation.body_uid).where(
+                        BodyDesignation.catalogue == designation.catalogue,
+                        BodyDesignation.number == designation.number,
+                    )
+                )
             )
 
-        # If the name starts with "IC", then we need to
-        # filter by the Index catalogue:
+        # Filter by the uids of the name and IAU name matches in the name index
+        # (if built from the current catalogue), unless the name is a pattern, or
+        # too unselective for a uid filter to beat a scan:
         if (
-            name.lower().strip().startswith("ic")
-            and len(name) >= 3
-            and name[2:].isdigit()
+            settings.USE_NAME_INDEX
+            and name_index.is_current(catalogue_version.version)
+            and not any(c in name for c in LIKE_WILDCARDS)
         ):
-            return query.filter(
-                self.model.ic.op("LIKE")("%{0}%".format(name[2:])),
-            )
+            uids = name_index.filter(name)
+
+            if len(uids) <= settings.NAME_INDEX_MAX_MATCHES:
+                return query.filter(self.model.uid.in_(uids))
 
         query = query.filter(
             or_(
@@ -263,51 +524,449 @@ class CRUDBody(CRUDBase[Body, BodyCreate, BodyUpdate]):
 
         return query
 
-    def perform_order_by_type(self, query: Query) -> Query:
-        whens = {
-            "Other": 4,
-            "*": 3,
-            "**": 3,
-            "*Ass": 3,
-            "OCl": 2,
-            "GCl": 2,
-            "G": 1,
-            "Cl+N": 0,
-            "PN": 0,
-            "HII": 0,
-            "DrkN": 0,
-            "EmN": 0,
-            "Neb": 0,
-            "RfN": 0,
-            "SNR": 0,
-        }
+    def get_type_rank(self, model: Type[Body] = Body) -> ColumnElement:
+        # Unranked types are given a rank of -1, so that they sort first as the
+        # NULLs of the CASE expression would in MySQL:
+        return func.coalesce(case(value=model.type, whens=BODY_TYPE_ORDER), -1)
+
+    def get_magnitude(self, model: Type[Body] = Body) -> ColumnElement:
+        return func.coalesce(model.m, MAGNITUDE_FALLBACK)
+
+    def get_selected_fields(self, fields: Sequence[str]) -> List[str]:
+        """
+        Get the given fields, always including those of the sort key, from which
+        the cursor of the next page is built.
+        """
+        return [*fields, *(f for f in CURSOR_FIELDS if f not in fields)]
+
+    def get_columns(self, fields: Sequence[str]) -> List[ColumnElement]:
+        return [
+            getattr(self.model, field) for field in self.get_selected_fields(fields)
+        ]
+
+    def get_transits(
+        self,
+        bodies: Sequence[Any],
+        *,
+        date: datetime.datetime,
+        latitude: float,
+        longitude: float,
+    ) -> List[Dict[str, Optional[datetime.datetime]]]:
+        """
+        Get the rise, transit and set (UTC) datetimes of every body (or row with
+        an ra and dec) for the observer, nearest to the given datetime, from a
+        single sidereal time evaluation shared by the whole page.
+        """
+        LST = self.model.get_LST(date, latitude, longitude)
+
+        def floats(attr: str) -> np.ndarray:
+            values = [getattr(b, attr) for b in bodies]
+
+            return np.array(
+                [np.nan if v is None else float(v) for v in values], dtype=np.float64
+            )
+
+        offsets = get_transit_offsets(floats("ra"), floats("dec"), LST, latitude)
+
+        date = date.astimezone(datetime.timezone.utc)
+
+        def get_datetime(offset: float) -> Optional[datetime.datetime]:
+            if np.isnan(offset):
+                return None
+
+            return date + datetime.timedelta(days=float(offset))
+
+        return [
+            {
+                "rise": get_datetime(rise),
+                "transit": get_datetime(transit),
+                "set": get_datetime(set),
+            }
+            for rise, transit, set in zip(*offsets)
+        ]
+
+    def get_cursor(self, body: Body) -> Cursor:
+        """
+        Get the (type rank, magnitude, uid) sort key of the given body, from which
+        the next page can be sought.
+        """
+        return (
+            BODY_TYPE_ORDER.get(body.type, -1),
+            MAGNITUDE_FALLBACK if body.m is None else float(body.m),
+            str(body.uid),
+        )
 
-        sort = case(value=Body.type, whens=whens).label("type")
+    def perform_order_by_type(self, query: Query) -> Query:
+        sort = self.get_type_rank().label("type")
 
         return query.order_by(sort)
 
+    def perform_cursor_seek_filter(self, query: Query, cursor: Cursor) -> Query:
+        rank, magnitude, uid = cursor
+
+        # The sort key of the cursor row is read back from the DB, so that it is
+        # compared exactly, falling back to the encoded values if it has since been
+        # deleted:
+        anchor = aliased(Body)
+
+        def get_anchor_value(expression: ColumnElement, value: Any) -> ColumnElement:
+            return func.coalesce(
+                select(expression).where(anchor.uid == uid).scalar_subquery(), value
+            )
+
+        return query.filter(
+            tuple_(self.get_type_rank(), self.get_magnitude(), self.model.uid)
+            > tuple_(
+                get_anchor_value(self.get_type_rank(anchor), rank),
+                get_anchor_value(self.get_magnitude(anchor), magnitude),
+                uid,
+            )
+        )
+
+    def get_explain_statement(
+        self, query: Query, dialect: Dialect
+    ) -> Tuple[str, Union[Tuple[Any, ...], Dict[str, Any]]]:
+        """
+        Get the EXPLAIN statement of the query, with its expanding IN parameters
+        (e.g., of the name index uids) rendered, and its driver parameters.
+        """
+        compiled = query.statement.compile(
+            dialect=dialect, compile_kwargs={"render_postcompile": True}
+        )
+
+        params = compiled.params
+
+        if compiled.positional:
+            params = tuple(params[name] for name in compiled.positiontup)
+
+        return "EXPLAIN {0}".format(compiled), params
+
+    def get_estimated_count(self, db: Session, query: Query) -> int:
+        """
+        Get the optimizer's estimate of the number of rows the query would return,
+        from the rows and filtered columns of the MySQL EXPLAIN plan.
+        """
+        statement, params = self.get_explain_statement(query, db.bind.dialect)
+
+        plan = db.connection().exec_driver_sql(statement, params).mappings().first()
+
+        return int((plan["rows"] or 0) * (plan["filtered"] or 100) / 100)
+
+    def get_count(
+        self,
+        db: Session,
+        query: Query,
+        *,
+        query_params: QueryParams,
+        mode: CountMode = "exact",
+    ) -> Optional[int]:
+        """
+        Get the total count of bodies matching the query, where exact counts are
+        cached by the normalized filter set for the current catalogue version.
+        """
+        if mode == "none":
+            return None
+
+        version = catalogue_version.get(db)
+
+        key = get_filter_key(query_params)
+
+        count = count_cache.get(version, key)
+
+        if count is not None:
+            return count
+
+        if mode == "estimate":
+            try:
+                return self.get_estimated_count(db, query)
+            except (DBAPIError, KeyError, TypeError) as e:
+                logger.warning(
+                    "Estimated count failed, counting exactly instead: {}".format(e)
+                )
+
+        count = query.count()
+
+        count_cache.set(version, key, count)
+
+        return count
+
     def get_multi(
-        self, db: Session, *, query_params: QueryParams, skip: int = 0, limit: int = 100
-    ) -> Tuple[List[ModelType], int]:
-        query = db.query(self.model)
+        self,
+        db: Session,
+        *,
+        query_params: QueryParams,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        count: CountMode = "exact",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[ModelType], Optional[int]]:
+        self.refresh_name_index(db, query_params)
+
+        # Serve from the in-memory columnar catalogue, if enabled:
+        if settings.USE_COLUMNAR_CATALOGUE:
+            # Reload the copy once the catalogue has changed, so that (cached)
+            # responses tagged with the new version are never served from it:
+            version = catalogue_version.get(db)
+
+            if catalogue.is_stale(settings.COLUMNAR_CATALOGUE_TTL, version):
+                catalogue.refresh(db, version)
+
+            return catalogue.get_multi(
+                query_params=query_params,
+                skip=skip,
+                limit=limit,
+                cursor=cursor,
+                count=count,
+                fields=self.get_selected_fields(fields) if fields else None,
+            )
+
+        # Select only the requested fields (as rows rather than models), if given:
+        query = db.query(*self.get_columns(fields)) if fields else db.query(self.model)
         # Filter w/Query Params:
         query = self.get_filter_query(query, query_params)
 
-        query = self.perform_order_by_type(query)
+        with sql_stage("count"):
+            total = self.get_count(db, query, query_params=query_params, mode=count)
 
-        count = query.count()
+        # Seek directly past the last row of the previous page, rather than
+        # reading and discarding every row before the offset:
+        if cursor:
+            query = self.perform_cursor_seek_filter(query, cursor)
+
+            skip = 0
+
+        query = self.perform_order_by_type(query)
 
         # Here we are ordering by apparent magnitude (mag) in ascending order because
-        # negative magnitudes are actually "brighter" than positive magnitudes:
-        return (
-            query.order_by(func.coalesce(Body.m, 99999).asc())
-            .offset(skip)
-            .limit(limit)
-            .all(),
-            count,
+        # negative magnitudes are actually "brighter" than positive magnitudes, with
+        # the uid as a final tiebreaker so that the order is stable between pages:
+        with sql_stage("page"):
+            bodies = (
+                query.order_by(self.get_magnitude().asc(), self.model.uid.asc())
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
+
+        return bodies, total
+
+    def get_export_statement(
+        self, *, query_params: QueryParams, fields: Sequence[str]
+    ) -> Select:
+        """
+        Get the statement selecting the given fields of every body matching the
+        query parameters, in primary key order, so that rows can be streamed
+        from the index without sorting the whole result first.
+        """
+        statement = select(*(getattr(self.model, field) for field in fields))
+
+        return self.get_filter_query(statement, query_params).order_by(self.model.uid)
+
+    def stream(
+        self,
+        db: Session,
+        *,
+        query_params: QueryParams,
+        fields: Sequence[str],
+        batch_size: int = 1000,
+    ) -> Iterator[Sequence[Row]]:
+        """
+        Stream the rows matching the query parameters from a server-side cursor,
+        in batches of batch_size rows.
+        """
+        self.refresh_name_index(db, query_params)
+
+        result = db.execute(
+            self.get_export_statement(query_params=query_params, fields=fields),
+            execution_options={"stream_results": True},
         )
 
+        yield from result.partitions(batch_size)
+
+    async def stream_async(
+        self,
+        db: Union[AsyncSession, Session],
+        *,
+        query_params: QueryParams,
+        fields: Sequence[str],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        if not isinstance(db, AsyncSession):
+            async for partition in iterate_in_threadpool(
+                self.stream(
+                    db, query_params=query_params, fields=fields, batch_size=batch_size
+                )
+            ):
+                yield partition
+            return
+
+        await self.run_async(db, self.refresh_name_index, query_params)
+
+        result = await db.stream(
+            self.get_export_statement(query_params=query_params, fields=fields),
+            execution_options={"stream_results": True},
+        )
+
+        async for partition in result.partitions(batch_size):
+            yield partition
+
+    def refresh_name_index(
+        self, db: Session, query_params: Optional[QueryParams] = None
+    ) -> Optional[Thread]:
+        """
+        Rebuild the name index in the background if the catalogue has changed
+        since the index was built, where given query parameters must search by
+        name. The name filter falls back to LIKE until the rebuild is done.
+
+        :return: The thread of the rebuild, if any
+        """
+        if not settings.USE_NAME_INDEX or (
+            query_params is not None and not getattr(query_params, "name", None)
+        ):
+            return None
+
+        with sql_stage("index"):
+            version = catalogue_version.get(db)
+
+        if name_index.version == version:
+            return None
+
+        return name_index.schedule_refresh(self.get_session_factory(), version)
+
+    def build_name_index(self, db: Session) -> None:
+        """
+        Build the name index on the given session, in the foreground, if the
+        catalogue has changed since the index was built.
+        """
+        version = catalogue_version.get(db)
+
+        if name_index.version != version:
+            name_index.refresh(db, version)
+
+    def get_session_factory(self) -> Callable[[], Session]:
+        if self.session_factory is not None:
+            return self.session_factory
+
+        # Imported on use, so that the CRUD layer runs against any database
+        # without creating the app's (MySQL) engines:
+        from app.db.session import SessionLocal
+
+        return SessionLocal
+
+    def search(self, db: Session, *, name: str, limit: int = 20) -> List[Body]:
+        """
+        Search for the bodies whose name, IAU name or catalogue designation
+        contains the given name, ranked by exact, then prefix, then substring
+        matches, then by apparent magnitude.
+        """
+        builder = self.refresh_name_index(db)
+
+        # Search needs the index, so wait for (only) its first build:
+        if builder is not None and not name_index.is_loaded:
+            builder.join()
+
+        uids = name_index.search(name, limit=limit)
+
+        if not uids:
+            return []
+
+        bodies = {
+            body.uid: body
+            for body in db.query(self.model).filter(self.model.uid.in_(uids)).all()
+        }
+
+        return [bodies[uid] for uid in uids if uid in bodies]
+
+    async def search_async(
+        self, db: Union[AsyncSession, Session], *, name: str, limit: int = 20
+    ) -> List[Body]:
+        # Wait for the first build of the index off the event loop:
+        if not name_index.is_loaded:
+            builder = await self.run_async(db, self.refresh_name_index)
+
+            if builder is not None:
+                await run_in_threadpool(builder.join)
+
+        return await self.run_async(db, self.search, name=name, limit=limit)
+
+    def refresh_suggestion_index(self, db: Session) -> None:
+        """
+        Rebuild the suggestion index if the catalogue has changed since the index
+        was built.
+        """
+        version = catalogue_version.get(db)
+
+        if suggestion_index.version != version:
+            suggestion_index.refresh(db, version)
+
+    async def suggest_async(
+        self, db: Union[AsyncSession, Session], *, prefix: str, limit: int = 10
+    ) -> List[Suggestion]:
+        """
+        Suggest the bodies with a name, IAU name, Bayer or Flamsteed designation
+        or catalogue designation starting with the given prefix, brightest first.
+        """
+        # Avoid the hop to the driver (or threadpool) for an up-to-date index:
+        version = await catalogue_version.get_async(db)
+
+        if suggestion_index.version != version:
+            await self.run_async(db, self.refresh_suggestion_index)
+
+        return suggestion_index.suggest(prefix, limit=limit)
+
+    def resolve_designations(
+        self, db: Session, designations: Sequence[str]
+    ) -> Dict[str, List[Body]]:
+        """
+        Resolve the catalogue designations, e.g., "M31", "NGC 224" or "HD358", to
+        the bodies they identify, keyed by the given designation, with a single
+        indexed IN (...) query per catalogue.
+        """
+        resolved: Dict[str, List[Body]] = {
+            designation: [] for designation in designations
+        }
+
+        # Group the (distinct) designations by catalogue, then by catalogue number:
+        groups: Dict[str, Dict[int, List[str]]] = {}
+
+        for designation in resolved:
+            parsed = parse_designation(designation)
+
+            if parsed:
+                groups.setdefault(parsed.catalogue, {}).setdefault(
+                    parsed.number, []
+                ).append(designation)
+
+        for column, numbers in groups.items():
+            rows = (
+                db.query(self.model, BodyDesignation.number)
+                .join(BodyDesignation, BodyDesignation.body_uid == self.model.uid)
+                .filter(
+                    BodyDesignation.catalogue == column,
+                    BodyDesignation.number.in_(list(numbers)),
+                )
+                .all()
+            )
+
+            for body, number in rows:
+                for designation in numbers[number]:
+                    resolved[designation].append(body)
+
+        return resolved
+
+    async def resolve_designations_async(
+        self, db: Union[AsyncSession, Session], designations: Sequence[str]
+    ) -> Dict[str, List[Body]]:
+        return await self.run_async(db, self.resolve_designations, designations)
+
+    async def get_multi_async(
+        self, db: Union[AsyncSession, Session], **kwargs: Any
+    ) -> Tuple[List[ModelType], Optional[int]]:
+        return await self.run_async(db, self.get_multi, **kwargs)
+
     def delete_multi(self, db: Session) -> None:
+        db.query(BodyDesignation).delete()
         db.query(self.model).delete()
         db.commit()
 
@@ -0,0 +1,58 @@
+import time
+from typing import Optional, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.base import run_async
+from app.models.catalogue import CatalogueVersion
+
+
+class CRUDCatalogueVersion:
+    def __init__(self) -> None:
+        """
+        Read access to the body catalogue version, memoized for
+        CATALOGUE_VERSION_TTL seconds so that it costs at most one primary key
+        lookup per worker per interval.
+        """
+        self.version: Optional[int] = None
+
+        self.checked_at: float = 0
+
+    @property
+    def is_fresh(self) -> bool:
+        return (
+            self.version is not None
+            and time.monotonic() - self.checked_at < settings.CATALOGUE_VERSION_TTL
+        )
+
+    def get(self, db: Session) -> int:
+        if self.is_fresh:
+            return self.version
+
+        version = db.query(CatalogueVersion.version).filter_by(id=1).scalar()
+
+        self.version = version or 0
+
+        self.checked_at = time.monotonic()
+
+        return self.version
+
+    async def get_async(self, db: Union[AsyncSession, Session]) -> int:
+        # Avoid the hop to the driver (or threadpool) for a memoized version:
+        if self.is_fresh:
+            return self.version
+
+        return await run_async(db, self.get)
+
+    def bump(self, db: Session) -> None:
+        CatalogueVersion.bump(db.connection())
+
+        db.commit()
+
+        # Force a re-read of the version on the next call:
+        self.version = None
+
+
+catalogue_version = CRUDCatalogueVersion()
@@ -2,3 +2,5 @@
 # imported by Alembic
 from app.db.base_class import Base  # noqa
 from app.models.body import Body  # noqa
+from app.models.catalogue import CatalogueVersion  # noqa
+from app.models.designation import BodyDesignation  # noqa
@@ -1,26 +1,100 @@
+from threading import Lock
+from typing import Any, Dict, Optional
+
 import pymysql
-from google.cloud.sql.connector import Connector, IPTypes
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import settings
+from app.core.metrics import MonitoredPoolMixin
+
+# The Cloud SQL Python Connector of the process, created on the first connection:
+connector: Optional[Any] = None
+
+connector_lock = Lock()
+
+
+def get_connector() -> Any:
+    """
+    Get the Cloud SQL Python Connector of the process, which is long-lived so that
+    its certificates and instance metadata are set up once, and refreshed in the
+    background, rather than for every new pooled connection.
+    """
+    global connector
+
+    with connector_lock:
+        if connector is None:
+            # The connector (and its aiohttp client) is only imported when
+            # connecting to Cloud SQL, rather than on every worker boot:
+            from google.cloud.sql.connector import Connector, IPTypes
+
+            # if env var PRIVATE_IP is set to True, use private IP Cloud SQL connections
+            ip_type = (
+                IPTypes.PRIVATE if settings.MYSQL_PRIVATE_IP is True else IPTypes.PUBLIC
+            )
+
+            connector = Connector(ip_type=ip_type)
+
+        return connector
+
+
+def close_connector() -> None:
+    global connector
+
+    with connector_lock:
+        if connector is not None:
+            connector.close()
+
+        connector = None
 
 
 # Python Connector database connection function
 def getconn() -> pymysql.connections.Connection:
-    # if env var PRIVATE_IP is set to True, use private IP Cloud SQL connections
-    ip_type = IPTypes.PRIVATE if settings.MYSQL_PRIVATE_IP is True else IPTypes.PUBLIC
-
-    # Initialize the Connector object:
-    with Connector(ip_type=ip_type) as connector:
-        conn: pymysql.connections.Connection = connector.connect(
-            settings.MYSQL_INSTANCE_CONNECTION_NAME,
-            "pymysql",
-            user=settings.MYSQL_USER,
-            password=settings.MYSQL_PASSWORD,
-            db=settings.MYSQL_DATABASE,
+    conn: pymysql.connections.Connection = get_connector().connect(
+        settings.MYSQL_INSTANCE_CONNECTION_NAME,
+        "pymysql",
+        user=settings.MYSQL_USER,
+        password=settings.MYSQL_PASSWORD,
+        db=settings.MYSQL_DATABASE,
+    )
+    return conn
+
+
+class MonitoredQueuePool(MonitoredPoolMixin, QueuePool):
+    pass
+
+
+class MonitoredAsyncAdaptedQueuePool(MonitoredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def get_pool_options(url: str) -> Dict[str, Any]:
+    """
+    Get the connection pool options of an engine from the settings, where SQLite
+    (e.g., the benchmark stand-in) has no connection pool to size. The queue pools
+    time every connection checkout for the metrics.
+    """
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+    }
+
+    if not url.startswith("sqlite"):
+        options.update(
+            poolclass=(
+                MonitoredAsyncAdaptedQueuePool
+                if make_url(url).get_dialect().is_async
+                else MonitoredQueuePool
+            ),
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
         )
-        return conn
+
+    return options
 
 
 SQL_ALCHEMY_DATABASE_URL = "mysql+pymysql://"
@@ -34,11 +108,39 @@ if settings.USE_CLOUD_SQL:
         raise ValueError("MYSQL_PASSWORD is not set")
     if settings.MYSQL_DATABASE is None:
         raise ValueError("MYSQL_DATABASE is not set")
-    engine = create_engine(SQL_ALCHEMY_DATABASE_URL, creator=getconn)
+    engine = create_engine(
+        SQL_ALCHEMY_DATABASE_URL,
+        creator=getconn,
+        **get_pool_options(SQL_ALCHEMY_DATABASE_URL),
+    )
+
+    # The Cloud SQL Python Connector has no async MySQL driver, so the async
+    # session is unavailable, and the sync session is used in a threadpool:
+    async_engine = None
 else:
     if settings.SQLALCHEMY_DATABASE_URI is None:
         raise ValueError("SQLALCHEMY_DATABASE_URI is not set")
 
-    engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+    engine = create_engine(
+        settings.SQLALCHEMY_DATABASE_URI,
+        **get_pool_options(settings.SQLALCHEMY_DATABASE_URI),
+    )
+
+    async_engine = create_async_engine(
+        settings.SQLALCHEMY_ASYNC_DATABASE_URI,
+        **get_pool_options(settings.SQLALCHEMY_ASYNC_DATABASE_URI),
+    )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+AsyncSessionLocal = (
+    sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=async_engine,
+        class_=AsyncSession,
+    )
+    if async_engine
+    else None
+)
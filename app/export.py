@@ -0,0 +1,62 @@
+import argparse
+import logging
+
+from app import crud, schemas
+from app.api.api_v1.params.bodies import BodyQueryParams
+from app.api.exports import write_arrow
+from app.core.config import settings
+from app.db.session import SessionLocal
+
+logging.basicConfig(level=logging.INFO)
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Export the bodies, optionally filtered by the bodies query "
+        "parameters, as an Arrow IPC file or as Parquet."
+    )
+
+    parser.add_argument("--format", choices=["arrow", "parquet"], default="parquet")
+
+    parser.add_argument(
+        "--filter",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="A bodies query parameter, e.g., --filter constellation=orion",
+    )
+
+    parser.add_argument("--output", required=True)
+
+    args = parser.parse_args()
+
+    query = BodyQueryParams(**dict(f.split("=", 1) for f in args.filter))
+
+    fields = query.get_fields() or tuple(schemas.Body.__fields__)
+
+    db = SessionLocal()
+
+    logger.info("Exporting Bodies Started")
+
+    try:
+        count = write_arrow(
+            crud.body.stream(
+                db,
+                query_params=query,
+                fields=fields,
+                batch_size=settings.EXPORT_BATCH_SIZE,
+            ),
+            fields,
+            args.format,
+            args.output,
+        )
+    finally:
+        db.close()
+
+    logger.info("Exported {} Bodies to {}".format(count, args.output))
+
+
+if __name__ == "__main__":
+    main()
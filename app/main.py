@@ -1,3 +1,8 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable
+
 import sentry_sdk
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,9 +14,18 @@ from fastapi_cache.backends.redis import RedisBackend
 from fastapi_cache.coder import PickleCoder
 from redis import asyncio as aioredis
 from sentry_sdk.integrations.asgi import SentryAsgiMiddleware
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 
+from app import crud
 from app.api.api_v1.api import api_router
+from app.catalogue import catalogue
 from app.core.config import settings
+from app.core.metrics import add_metrics
+from app.core.timing import RequestTiming, enable_sql_timing, request_timing
+from app.db.session import SessionLocal, close_connector
+
+logger = logging.getLogger(__name__)
 
 API_DESCRIPTION = "\
 Perseus Billion Stars API is observerly's Fast API \
@@ -102,6 +116,48 @@ async def add_helmet_headers(request: Request, call_next):
     return response
 
 
+# Metrics are opt-in, as /metrics is served (without auth) on the API port:
+if settings.USE_METRICS:
+    add_metrics(app)
+
+
+if settings.USE_SQL_TIMING:
+    enable_sql_timing()
+
+    @app.middleware("http")
+    async def add_server_timing_header(request: Request, call_next):
+        timing = RequestTiming()
+
+        token = request_timing.set(timing)
+
+        start = time.perf_counter()
+
+        try:
+            response = await call_next(request)
+        finally:
+            request_timing.reset(token)
+
+        response.headers["Server-Timing"] = timing.get_server_timing(
+            time.perf_counter() - start
+        )
+
+        return response
+
+
+def preload_index(refresh: Callable[[Session], Any]) -> None:
+    """
+    Build an in-memory index with its own session, where a failure (e.g., an
+    unreachable database) is logged, and the index is built on first use.
+    """
+    db = SessionLocal()
+    try:
+        refresh(db)
+    except SQLAlchemyError as e:
+        logger.warning("Preloading {} failed: {}".format(refresh.__name__, e))
+    finally:
+        db.close()
+
+
 @app.on_event("startup")
 async def startup():
     if settings.REDIS_DSN:
@@ -114,3 +170,29 @@ async def startup():
             expire=31556952,
             coder=PickleCoder,
         )
+
+    if settings.USE_COLUMNAR_CATALOGUE:
+        db = SessionLocal()
+        try:
+            catalogue.refresh(db, crud.catalogue_version.get(db))
+        finally:
+            db.close()
+
+    # Build the name index in the background, off the request path (where name
+    # filters fall back to LIKE until it is built):
+    if settings.USE_NAME_INDEX:
+        asyncio.get_running_loop().run_in_executor(
+            None, preload_index, crud.body.refresh_name_index
+        )
+
+    # Build the index in the background, so that the worker starts serving
+    # without waiting for the whole body table to load:
+    if settings.PRELOAD_SUGGESTION_INDEX:
+        asyncio.get_running_loop().run_in_executor(
+            None, preload_index, crud.body.refresh_suggestion_index
+        )
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    close_connector()
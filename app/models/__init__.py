@@ -1 +1,3 @@
 from .body import Body
+from .catalogue import CatalogueVersion
+from .designation import BodyDesignation
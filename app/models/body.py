@@ -1,23 +1,62 @@
 import datetime
 import math
 import uuid
+from typing import Any, Dict
 
-from astropy import units as u
-from astropy.coordinates import EarthLocation, SkyCoord
-from astropy.time import Time
-from sqlalchemy import Column, Float, String, event
+from sqlalchemy import BigInteger, Column, Float, String, event
 from sqlalchemy.ext.hybrid import hybrid_method
 from sqlalchemy.sql import func
 
+from app.astrometry import healpix
+from app.astrometry.constellations import get_constellation
+from app.astrometry.sidereal import get_local_sidereal_time
+from app.astrometry.vectors import Vector, radec_to_vector
 from app.db.base_class import Base
 
 FRAME = "icrs"
 
+# The apparent magnitude given to bodies without one, so that they sort last:
+MAGNITUDE_FALLBACK = 99999
+
+# The altitude (in degrees) above which a body is considered above the horizon:
+HORIZON_ALTITUDE = 15
+
+# The sort rank of each body type, where the rarer deep sky objects are listed
+# ahead of the stars (a change to the ranks, or to the magnitude fallback, needs
+# a migration recreating the ix_body_keyset functional index):
+BODY_TYPE_ORDER = {
+    "Other": 4,
+    "*": 3,
+    "**": 3,
+    "*Ass": 3,
+    "OCl": 2,
+    "GCl": 2,
+    "G": 1,
+    "Cl+N": 0,
+    "PN": 0,
+    "HII": 0,
+    "DrkN": 0,
+    "EmN": 0,
+    "Neb": 0,
+    "RfN": 0,
+    "SNR": 0,
+}
+
 
 def generate_uuid():
     return str(uuid.uuid4())
 
 
+def get_position_columns(ra: float, dec: float) -> Dict[str, Any]:
+    """
+    Get the columns derived from the { ra, dec } of a Body, i.e., its HEALPix
+    pixel and ICRS unit vector.
+    """
+    ux, uy, uz = radec_to_vector(ra, dec)
+
+    return {"healpix": healpix.ang2pix(ra, dec), "ux": ux, "uy": uy, "uz": uz}
+
+
 class Body(Base):
     # UID as primary key
     uid = Column(
@@ -55,23 +94,50 @@ class Body(Base):
     # Sun at the March equinox to the (hour circle of the) point in question
     # above the earth.
     ra = Column(
-        Float(
-            precision=10,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=10),
         index=False,
         name="ra",
         comment="Right Ascension of the central point of the Body",
     )
 
+    # HEALPix Pixel Index:
+    # The NESTED HEALPix pixel (at order healpix.HEALPIX_ORDER) containing the
+    # { ra, dec } of the Body, used as an indexed prefilter for cone searches.
+    healpix = Column(
+        BigInteger,
+        index=True,
+        name="healpix",
+        comment="NESTED HEALPix Pixel Index",
+    )
+
+    # ICRS Unit Vector:
+    # The direction cosines (x, y, z) of the { ra, dec } of the Body, so that
+    # angular conditions, e.g., altitude or separation, become linear inequalities
+    # (dot products) rather than per-row trigonometry.
+    ux = Column(
+        Float(precision=53),
+        index=False,
+        name="ux",
+        comment="ICRS Unit Vector (x) i.e., cos(dec)cos(ra)",
+    )
+
+    uy = Column(
+        Float(precision=53),
+        index=False,
+        name="uy",
+        comment="ICRS Unit Vector (y) i.e., cos(dec)sin(ra)",
+    )
+
+    uz = Column(
+        Float(precision=53),
+        index=True,
+        name="uz",
+        comment="ICRS Unit Vector (z) i.e., sin(dec)",
+    )
+
     # Proper Motion in Right Ascension (mas/yr)
     μra = Column(
-        Float(
-            precision=10,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=10),
         index=False,
         name="μra",
         comment="Proper Motion in Right Ascension (mas/yr)",
@@ -83,11 +149,7 @@ class Body(Base):
     # of the celestial equator, along the hour circle passing through the point
     # in question
     dec = Column(
-        Float(
-            precision=10,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=10),
         name="dec",
         index=False,
         comment="Declination of the central point of the Body",
@@ -95,11 +157,7 @@ class Body(Base):
 
     # Proper Motion in Declination (mas/yr)
     μdec = Column(
-        Float(
-            precision=10,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=10),
         index=False,
         name="μdec",
         comment="Proper Motion in Declination (mas/yr)",
@@ -135,11 +193,7 @@ class Body(Base):
     # object's light caused by interstellar dust along the line of sight to
     # the observer.
     m = Column(
-        Float(
-            precision=5,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=5),
         index=False,
         name="apparent_magnitude",
         comment="Apparent Magnitude (m)",
@@ -153,11 +207,7 @@ class Body(Base):
     # dimming) of its light due to absorption by interstellar matter and
     # cosmic dust.
     M = Column(
-        Float(
-            precision=5,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=5),
         index=False,
         name="absolute_magnitude",
         comment="Absolute Magnitude (M)",
@@ -165,11 +215,7 @@ class Body(Base):
 
     # Distance to the star (in parsecs).
     d = Column(
-        Float(
-            precision=5,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=5),
         index=False,
         name="distance",
         comment="Distance (in parsecs, pc)",
@@ -299,11 +345,7 @@ class Body(Base):
 
     # The Body's eccentricity (unitless):
     e = Column(
-        Float(
-            precision=5,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=5),
         index=False,
         name="eccentricity",
         comment="Eccentricity (e)",
@@ -311,11 +353,7 @@ class Body(Base):
 
     # The Body's Semi-major axis (arcminutes):
     a = Column(
-        Float(
-            precision=5,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=5),
         index=False,
         name="semi_major_axis",
         comment="Semi-major axis (a)",
@@ -323,11 +361,7 @@ class Body(Base):
 
     # The Body's Semi-minor axis (arcminutes):
     b = Column(
-        Float(
-            precision=5,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=5),
         index=False,
         name="semi_minor_axis",
         comment="Semi-minor axis (b)",
@@ -335,11 +369,7 @@ class Body(Base):
 
     # The Body's inclination (degrees):
     i = Column(
-        Float(
-            precision=5,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=5),
         index=False,
         name="inclination",
         comment="Inclination (i)",
@@ -347,11 +377,7 @@ class Body(Base):
 
     # The body's redshift (unitless):
     z = Column(
-        Float(
-            precision=5,
-            asdecimal=True,
-            decimal_return_scale=10,
-        ),
+        Float(precision=5),
         index=False,
         name="redshift",
         comment="Redshift (z)",
@@ -371,15 +397,13 @@ class Body(Base):
 
     @classmethod
     def get_LST(cls, date: datetime, latitude: float, longitude: float) -> float:
-        observer = EarthLocation(lat=latitude * u.deg, lon=longitude * u.deg)
-
-        ut = Time(
-            date.astimezone(datetime.timezone.utc),
-            scale="utc",
-            location=observer,
-        )
+        """
+        Get the Local Mean Sidereal Time of the observer, in closed form (without
+        astropy or its IERS tables).
 
-        return ut.sidereal_time("mean").degree
+        :return: Local Mean Sidereal Time (in degrees)
+        """
+        return get_local_sidereal_time(date, longitude)
 
     # Altitude position angle (degrees):
 
@@ -428,11 +452,81 @@ class Body(Base):
             )
         )
 
+    # Angular separation (degrees):
+
+    def get_separation(self, ra: float, dec: float) -> float:
+        """
+        Get the great-circle distance between the body and the point { ra, dec }.
+
+        :return: Angular separation (in degrees)
+        """
+        return healpix.separation(float(self.ra), float(self.dec), ra, dec)
+
+    @hybrid_method
+    def separation(self, ra: float, dec: float) -> float:
+        return self.get_separation(ra, dec)
+
+    @separation.expression
+    def separation(cls, ra, dec):
+        """
+        Get the great-circle distance between the body and the point { ra, dec }
+        as a raw SQL expression
+        """
+        return func.degrees(
+            func.acos(
+                func.least(
+                    1,
+                    func.sin(func.radians(cls.dec)) * func.sin(func.radians(dec))
+                    + func.cos(func.radians(cls.dec))
+                    * func.cos(func.radians(dec))
+                    * func.cos(func.radians(cls.ra - ra)),
+                )
+            )
+        )
+
+    # Dot product with the ICRS unit vector (unitless):
+
+    def get_dot(self, vector: Vector) -> float:
+        """
+        Get the dot product of the body's unit vector with the given unit vector,
+        i.e., the cosine of the angle between them.
+        """
+        return self.ux * vector[0] + self.uy * vector[1] + self.uz * vector[2]
+
+    @hybrid_method
+    def dot(self, vector: Vector) -> float:
+        return self.get_dot(vector)
+
+    @dot.expression
+    def dot(cls, vector):
+        """
+        Get the dot product of the body's unit vector with the given unit vector
+        as a raw SQL expression
+        """
+        return cls.ux * vector[0] + cls.uy * vector[1] + cls.uz * vector[2]
+
+
+@event.listens_for(Body, "before_insert")
+@event.listens_for(Body, "before_update")
+def receive_before_upsert_position(mapper, connection, target):
+    if target.ra is None or target.dec is None:
+        return
+
+    for column, value in get_position_columns(
+        float(target.ra), float(target.dec)
+    ).items():
+        setattr(target, column, value)
+
+
+@event.listens_for(Body, "before_insert")
+def receive_before_insert(mapper, connection, target):
+    # Resolve the constellation of new bodies only where it is not given:
+    if target.constellation or target.ra is None or target.dec is None:
+        return
+
+    target.constellation = get_constellation(float(target.ra), float(target.dec))
+
 
 @event.listens_for(Body, "before_update")
 def receive_before_update(mapper, conenction, target):
-    target.constellation = SkyCoord(
-        ra=target.ra * u.degree,
-        dec=target.dec * u.degree,
-        frame=FRAME,
-    ).get_constellation()
+    target.constellation = get_constellation(float(target.ra), float(target.dec))
@@ -0,0 +1,65 @@
+from itertools import chain
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, event, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.db.base_class import Base
+from app.models.body import Body
+
+
+class CatalogueVersion(Base):
+    # Singleton row ID as primary key
+    id = Column(
+        Integer,
+        primary_key=True,
+        default=1,
+    )
+
+    # The version of the body catalogue, which is incremented on every change to
+    # the body table, so that any derived state (e.g., cached counts or responses)
+    # can be invalidated:
+    version = Column(
+        BigInteger,
+        nullable=False,
+        default=1,
+        name="version",
+        comment="Body Catalogue Version",
+    )
+
+    # The datetime of the last change to the body table:
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        name="updated_at",
+        comment="Body Catalogue Last Updated At",
+    )
+
+    @classmethod
+    def bump(cls, connection: Connection) -> None:
+        """
+        Increment the catalogue version, creating the singleton row if needed.
+        """
+        result = connection.execute(
+            update(cls.__table__).values(version=cls.version + 1, updated_at=func.now())
+        )
+
+        if result.rowcount == 0:
+            connection.execute(cls.__table__.insert().values(id=1, version=1))
+
+
+@event.listens_for(Session, "after_flush")
+def receive_after_flush(session, flush_context):
+    objects = chain(session.new, session.dirty, session.deleted)
+
+    if any(isinstance(obj, Body) for obj in objects):
+        CatalogueVersion.bump(session.connection())
+
+
+@event.listens_for(Session, "after_bulk_delete")
+@event.listens_for(Session, "after_bulk_update")
+def receive_after_bulk(context):
+    if context.mapper.class_ is Body:
+        CatalogueVersion.bump(context.session.connection())
@@ -0,0 +1,97 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, delete, event, insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import attributes
+
+from app.catalogue.designations import CATALOGUES, get_designations
+from app.db.base_class import Base
+from app.models.body import Body
+
+
+class BodyDesignation(Base):
+    __table_args__ = (
+        # Exact (catalogue, number) lookups, e.g., for "M31" or "NGC 224":
+        Index("ix_bodydesignation_catalogue_number", "catalogue", "number"),
+    )
+
+    # Surrogate ID as primary key
+    id = Column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+    )
+
+    # The UID of the designated Body:
+    body_uid = Column(
+        String(36),
+        ForeignKey("body.uid", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        name="body_uid",
+        comment="Body UID",
+    )
+
+    # The catalogue, i.e., one of messier, ngc, ic, hd, hr or hip:
+    catalogue = Column(
+        String(
+            length=8,
+            convert_unicode=False,
+            unicode_error=None,
+        ),
+        nullable=False,
+        name="catalogue",
+        comment="Catalogue",
+    )
+
+    # The normalized (integer) catalogue number:
+    number = Column(
+        Integer,
+        nullable=False,
+        name="number",
+        comment="Catalogue Number",
+    )
+
+    @classmethod
+    def get_rows(cls, uid: str, values: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Get the designation rows of the body with the given uid, from its
+        catalogue column values.
+        """
+        return [
+            {"body_uid": uid, "catalogue": catalogue, "number": number}
+            for catalogue, number in get_designations(values)
+        ]
+
+    @classmethod
+    def create_multi(cls, connection: Connection, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert the designation rows of the given Body rows, as a single
+        executemany INSERT.
+        """
+        designations = [
+            designation for row in rows for designation in cls.get_rows(row["uid"], row)
+        ]
+
+        if designations:
+            connection.execute(insert(cls.__table__), designations)
+
+
+@event.listens_for(Body, "after_insert")
+def receive_after_insert(mapper, connection, target):
+    BodyDesignation.create_multi(
+        connection,
+        [{"uid": target.uid, **{c: getattr(target, c) for c in CATALOGUES}}],
+    )
+
+
+@event.listens_for(Body, "after_update")
+def receive_after_update(mapper, connection, target):
+    if not any(attributes.get_history(target, c).has_changes() for c in CATALOGUES):
+        return
+
+    connection.execute(
+        delete(BodyDesignation.__table__).where(BodyDesignation.body_uid == target.uid)
+    )
+
+    receive_after_insert(mapper, connection, target)
@@ -1 +1,10 @@
-from .body import Body, BodyCreate, BodyInDB
+from .body import (
+    Body,
+    BodyCreate,
+    BodyInDB,
+    BodyResolve,
+    BodyResolved,
+    BodySuggestion,
+    get_body_fields_model,
+    get_body_transits_model,
+)
@@ -1,7 +1,9 @@
-from typing import Optional
+import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 
 
 # Shared properties from Perseus API:
@@ -198,6 +200,127 @@ class BodyInDB(BodyInDBBase):
     pass
 
 
+# Properties to receive on batch designation resolution
+class BodyResolve(BaseModel):
+    designations: List[str] = Field(
+        ...,
+        title="Designations",
+        description=(
+            "The catalogue designations to resolve, e.g., M31, NGC 224, "
+            "IC434, HD358, HR15 or HIP 677"
+        ),
+        min_items=1,
+        max_items=1000,
+    )
+
+
+# Properties to return to client on batch designation resolution
+class BodyResolved(BaseModel):
+    results: Dict[str, List[Body]] = Field(
+        ...,
+        title="Results",
+        description=(
+            "The bodies identified by each designation, keyed by the "
+            "designation as given"
+        ),
+    )
+    unresolved: List[str] = Field(
+        ...,
+        title="Unresolved",
+        description="The designations that did not identify any body",
+    )
+
+
+# Properties to return to client on typeahead suggestion
+class BodySuggestion(BaseModel):
+    text: str = Field(
+        ...,
+        title="Text",
+        description=(
+            "The form of the body's name matching the prefix, e.g., the "
+            "Bayer designation α Ori for the prefix α"
+        ),
+    )
+    uid: UUID = Field(
+        ...,
+        title="Unique ID",
+        description="Unique ID for the astronomical object.",
+    )
+    name: str = Field(
+        "",
+        title="Common Name",
+        description="The common name of the astronomical object",
+    )
+    iau: str = Field(
+        "",
+        title="International Astronomical Union Name",
+        description="The IAU name of the astronomical object",
+    )
+    m: Optional[float] = Field(
+        None,
+        title="Apparent Magnitude",
+        description="The apparent magnitude of the astronomical object",
+    )
+
+
+# Properties to return to client, restricted to a sparse fieldset
+@lru_cache(maxsize=256)
+def get_body_fields_model(fields: Tuple[str, ...]) -> Type[BaseModel]:
+    return create_model(
+        "Body[{}]".format(",".join(fields)),
+        __config__=Body.__config__,
+        **{
+            field: (
+                Body.__fields__[field].outer_type_,
+                Body.__fields__[field].field_info,
+            )
+            for field in fields
+        },
+    )
+
+
+# Properties to return to client, with the rise, transit and set times
+@lru_cache(maxsize=256)
+def get_body_transits_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    return create_model(
+        "{}+Transits".format(model.__name__),
+        __base__=model,
+        rise=(
+            Optional[datetime.datetime],
+            Field(
+                None,
+                title="Rise",
+                description=(
+                    "The (UTC) datetime of the rise of the astronomical "
+                    "object before its transit, if it rises and sets"
+                ),
+            ),
+        ),
+        transit=(
+            Optional[datetime.datetime],
+            Field(
+                None,
+                title="Transit",
+                description=(
+                    "The (UTC) datetime of the transit of the astronomical "
+                    "object nearest to the given datetime"
+                ),
+            ),
+        ),
+        set=(
+            Optional[datetime.datetime],
+            Field(
+                None,
+                title="Set",
+                description=(
+                    "The (UTC) datetime of the set of the astronomical "
+                    "object after its transit, if it rises and sets"
+                ),
+            ),
+        ),
+    )
+
+
 class BodyCreate(BaseModel):
     # Common Name:
     name: str
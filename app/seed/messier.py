@@ -4,6 +4,7 @@ from logging import Logger
 from sqlalchemy.orm import Session
 
 from app import crud, schemas
+from app.core.config import settings
 from app.utils import ROOT_DIR
 
 
@@ -12,8 +13,6 @@ def seed_messier(db: Session, logger: Logger) -> None:
     This function call seeds the Body model with a known set of Messier
     objects in data directory
     """
-    count = 0
-
     logger.info("ROOT_DIR: {}".format(ROOT_DIR))
 
     objects = []
@@ -44,14 +43,12 @@ def seed_messier(db: Session, logger: Logger) -> None:
 
         m["d"] = (lambda body: None if body["d"] is None else float(body["d"]))(body)
 
-        object_in = schemas.BodyCreate(**m)
-        objects.append(object_in)
-
-    for object_in in objects:
-        crud.body.create(db, body=object_in)  # noqa: F841
-        count += 1
-        logger.info("Successfully Populated Object {}".format(object_in.name))
+        objects.append(schemas.BodyCreate(**m))
 
-    # Read the stars incrementally into the db:
+    # Each of the objects is validated (and coerced, e.g., float catalogue numbers
+    # to strings) by BodyCreate, then inserted in bulk:
+    count = crud.body.create_multi(
+        db, objects, batch_size=settings.SEED_BATCH_SIZE, logger=logger
+    )
 
     logger.info("Populated Initial API w/{} Objects".format(count))
@@ -4,6 +4,7 @@ from logging import Logger
 from sqlalchemy.orm import Session
 
 from app import crud, schemas
+from app.core.config import settings
 from app.utils import ROOT_DIR
 
 
@@ -11,8 +12,6 @@ def seed_stars(db: Session, logger: Logger) -> None:
     """
     This function call seeds the Body model with a known set of stars in data directory
     """
-    count = 0
-
     logger.info("ROOT_DIR: {}".format(ROOT_DIR))
 
     data = None
@@ -62,14 +61,12 @@ def seed_stars(db: Session, logger: Logger) -> None:
 
         s["d"] = (lambda star: None if star["d"] is None else float(star["d"]))(star)
 
-        star_in = schemas.BodyCreate(**s)
-        stars.append(star_in)
-
-    for star_in in stars:
-        crud.body.create(db, body=star_in)  # noqa: F841
-        count += 1
-        logger.info("Successfully Populated Star {}".format(star_in.name))
+        stars.append(schemas.BodyCreate(**s))
 
-    # Read the stars incrementally into the db:
+    # Each of the stars is validated (and coerced to the column types) by
+    # BodyCreate, then inserted in bulk:
+    count = crud.body.create_multi(
+        db, stars, batch_size=settings.SEED_BATCH_SIZE, logger=logger
+    )
 
     logger.info("Populated Initial API w/{} Stars".format(count))
@@ -1,6 +1,9 @@
+import datetime
+
 import pytest
 from httpx import AsyncClient
 
+from app.api.paginator import PaginatedResponse
 from app.core.config import settings
 
 
@@ -48,13 +51,14 @@ async def test_list_bodies_with_default_radial_search(client: AsyncClient) -> No
 
     body = response.json()
 
-    assert body["count"] == 11
-    assert body["next_page"] is None
+    assert body["count"] == 34
+    assert "/api/v1/bodies/2?limit=20&ra=2.294522&dec=59.14978" in body["next_page"]
     assert body["previous_page"] is None
 
-    assert body["results"][0]["name"] == "α Cassiopeiae"
-    assert body["results"][1]["name"] == "β Cassiopeiae"
-    assert body["results"][2]["name"] == "ζ Cassiopeiae"
+    assert body["results"][0]["name"] == "Scorpion Cluster"
+    assert body["results"][1]["name"] == "α Cassiopeiae"
+    assert body["results"][2]["name"] == "β Cassiopeiae"
+    assert body["results"][3]["name"] == "γ Cassiopeiae"
 
 
 @pytest.mark.asyncio
@@ -120,6 +124,104 @@ async def test_list_bodies_with_the_name_M45(client: AsyncClient) -> None:
     assert body["results"][0]["iau"] == "Messier 45"
 
 
+@pytest.mark.asyncio
+async def test_list_bodies_with_the_name_M1(client: AsyncClient) -> None:
+    page = 1
+
+    # M1 is an exact designation, so should not match M10-M19 or M100-M110:
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/{page}?name=M1",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    body = response.json()
+
+    assert body["count"] == 1
+
+    assert body["results"][0]["name"] == "The Crab Nebula"
+    assert body["results"][0]["iau"] == "Messier 1"
+
+
+@pytest.mark.asyncio
+async def test_search_bodies_by_partial_name(client: AsyncClient) -> None:
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/search?name=orion&limit=3",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    bodies = response.json()
+
+    assert len(bodies) == 3
+
+    # Ranked by apparent magnitude, as every match is a substring match:
+    assert [b["iau"] for b in bodies] == ["Rigel", "Betelgeuse", "Bellatrix"]
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_bodies(client: AsyncClient) -> None:
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/autocomplete?prefix=Bet&limit=2",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    suggestions = response.json()
+
+    assert [(s["text"], s["iau"]) for s in suggestions] == [
+        ("Beta Orionis", "Rigel"),
+        ("Betelgeuse", "Betelgeuse"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_bodies_with_transits(client: AsyncClient) -> None:
+    page = 1
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/{page}?name=betelgeuse&fields=name,ra,dec"
+        "&latitude=19.8968&longitude=155.8912&datetime=2021-05-14T00:00:00.000Z"
+        "&transits=true",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    result = response.json()["results"][0]
+
+    assert set(result) == {"name", "ra", "dec", "rise", "transit", "set"}
+
+    rise, transit, set_ = (
+        datetime.datetime.fromisoformat(result[key])
+        for key in ("rise", "transit", "set")
+    )
+
+    assert rise < transit < set_
+
+    # The nearest transit is within half a day of the given datetime:
+    assert abs(
+        transit - datetime.datetime(2021, 5, 14, tzinfo=datetime.timezone.utc)
+    ) <= datetime.timedelta(hours=12)
+
+
+@pytest.mark.asyncio
+async def test_list_bodies_with_transits_requires_the_observer(
+    client: AsyncClient,
+) -> None:
+    page = 1
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/{page}?name=betelgeuse&transits=true",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_list_bodies_with_specific_radial_search(client: AsyncClient) -> None:
     page = 1
@@ -154,13 +256,14 @@ async def test_list_bodies_with_slightly_less_specific_radial_search(
 
     body = response.json()
 
-    assert body["count"] == 11
-    assert body["next_page"] is None
+    assert body["count"] == 34
+    assert "/api/v1/bodies/2?limit=20&ra=2.294522&dec=59.14978" in body["next_page"]
     assert body["previous_page"] is None
 
-    assert body["results"][0]["name"] == "α Cassiopeiae"
-    assert body["results"][1]["name"] == "β Cassiopeiae"
-    assert body["results"][2]["name"] == "ζ Cassiopeiae"
+    assert body["results"][0]["name"] == "Scorpion Cluster"
+    assert body["results"][1]["name"] == "α Cassiopeiae"
+    assert body["results"][2]["name"] == "β Cassiopeiae"
+    assert body["results"][3]["name"] == "γ Cassiopeiae"
 
 
 @pytest.mark.asyncio
@@ -182,6 +285,49 @@ async def test_list_bodies_with_too_specific_radial_search(client: AsyncClient)
     assert len(body["results"]) == 0
 
 
+@pytest.mark.asyncio
+async def test_list_bodies_with_radial_search_across_the_ra_wrap(
+    client: AsyncClient,
+) -> None:
+    page = 1
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/{page}?ra=359.5&dec=29.09&radius=3.0",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    body = response.json()
+
+    assert body["count"] == 3
+    assert body["next_page"] is None
+    assert body["previous_page"] is None
+    assert body["results"][0]["name"] == "α Andromedae"
+
+
+@pytest.mark.asyncio
+async def test_list_bodies_with_radial_search_near_the_celestial_pole(
+    client: AsyncClient,
+) -> None:
+    page = 1
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/{page}?ra=123&dec=89.5&radius=3.0",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    body = response.json()
+
+    assert body["count"] == 2
+    assert body["next_page"] is None
+    assert body["previous_page"] is None
+    assert body["results"][0]["name"] == "α Ursae Minoris"
+    assert body["results"][1]["name"] == "λ Ursae Minoris"
+
+
 @pytest.mark.asyncio
 async def test_list_bodies_within_the_constellation_orion(client: AsyncClient) -> None:
     page = 1
@@ -385,7 +531,9 @@ async def test_list_bodies_above_local_observers_horizon_between_interval_for_20
 
     body = response.json()
 
-    assert body["count"] == 2842
+    # Every body above the horizon at any instant of the interval, including
+    # those that rise and set within it:
+    assert body["count"] == 3100
     assert (
         "/api/v1/bodies/2?limit=20&latitude=19.8968&longitude=-155.8912&start=2021-05-14T18%3A46%3A50.000-10%3A00&end=2021-05-15T05%3A49%3A30.000-10%3A00"  # noqa: E501,
         in body["next_page"]
@@ -409,7 +557,7 @@ async def test_list_bodies_above_local_observers_horizon_between_interval_for_20
 
     body = response.json()
 
-    assert body["count"] == 2799
+    assert body["count"] == 3311
     assert (
         "/api/v1/bodies/2?limit=20&latitude=19.8968&longitude=-155.8912&start=2022-01-01T17%3A58%3A56.000-10%3A00&end=2022-01-02T06%3A52%3A13.000-10%3A00"  # noqa: E501,
         in body["next_page"]
@@ -461,3 +609,159 @@ async def test_list_bodies_constellation_not_visible_in_summer_at_northern_hemis
     assert body["next_page"] is None
     assert body["previous_page"] is None
     assert len(body["results"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_list_bodies_with_cursor_matches_the_next_page(
+    client: AsyncClient,
+) -> None:
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/1?constellation=orion",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    body = response.json()
+
+    assert body["next_cursor"] is not None
+
+    cursor = body["next_cursor"]
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/?constellation=orion&cursor={cursor}",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    seek = response.json()
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/2?constellation=orion",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    page = response.json()
+
+    assert seek["count"] == 87
+    assert seek["previous_page"] is None
+    assert "cursor=" in seek["next_page"]
+    assert [r["uid"] for r in seek["results"]] == [r["uid"] for r in page["results"]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "invalid",
+        "WyJhIiwxLCJ4Il0",
+        PaginatedResponse.encode_cursor(["a", 1, "x"]),
+        PaginatedResponse.encode_cursor([1, "m", "x"]),
+        PaginatedResponse.encode_cursor([1, 2.5, 3]),
+        PaginatedResponse.encode_cursor([True, 2.5, "x"]),
+        PaginatedResponse.encode_cursor([1, float("nan"), "x"]),
+        PaginatedResponse.encode_cursor([1, 2.5]),
+    ],
+)
+async def test_list_bodies_with_an_invalid_cursor(
+    client: AsyncClient, cursor: str
+) -> None:
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/?cursor={cursor}",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_bodies_without_a_total_count(client: AsyncClient) -> None:
+    page = 1
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/{page}?type=G&count=none",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    body = response.json()
+
+    assert body["count"] is None
+    assert "/api/v1/bodies/2?limit=20&type=G&count=none" in body["next_page"]
+    assert body["previous_page"] is None
+    assert len(body["results"]) == 20
+
+
+@pytest.mark.asyncio
+async def test_list_bodies_is_served_from_the_response_cache(
+    client: AsyncClient,
+) -> None:
+    page = 1
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/{page}?constellation=Cygnus&limit=5",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    # The cache key is case-folded, so the same filter in any case is a hit:
+    cached = await client.get(
+        f"{settings.API_V1_STR}/bodies/{page}?constellation=CYGNUS&limit=5",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert cached.status_code == 200
+    assert cached.headers["x-perseus-cache"] == "HIT"
+    assert cached.json() == response.json()
+
+
+@pytest.mark.asyncio
+async def test_list_bodies_with_a_sparse_fieldset(client: AsyncClient) -> None:
+    page = 1
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/{page}?constellation=orion&fields=name,ra,dec",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    body = response.json()
+
+    assert body["count"] == 87
+    assert body["next_cursor"] is not None
+    assert all(set(r) == {"name", "ra", "dec"} for r in body["results"])
+
+
+@pytest.mark.asyncio
+async def test_list_bodies_with_an_invalid_field(client: AsyncClient) -> None:
+    response = await client.get(
+        f"{settings.API_V1_STR}/bodies/?fields=name,simbad_url",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_resolve_bodies(client: AsyncClient) -> None:
+    response = await client.post(
+        f"{settings.API_V1_STR}/bodies/resolve",
+        json={"designations": ["M31", "NGC 1952", "HD358", "HIP 677", "M 999"]},
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    body = response.json()
+
+    assert [b["iau"] for b in body["results"]["M31"]] == ["Messier 31"]
+    assert [b["iau"] for b in body["results"]["NGC 1952"]] == ["Messier 1"]
+    assert [b["name"] for b in body["results"]["HD358"]] == ["α Andromedae"]
+    assert body["results"]["HIP 677"] == body["results"]["HD358"]
+    assert body["unresolved"] == ["M 999"]
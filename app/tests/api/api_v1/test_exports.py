@@ -0,0 +1,57 @@
+import json
+
+import pyarrow as pa
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+
+
+@pytest.mark.asyncio
+async def test_export_bodies_as_ndjson(client: AsyncClient) -> None:
+    response = await client.get(
+        f"{settings.API_V1_STR}/export/bodies?constellation=orion",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    bodies = [json.loads(line) for line in response.text.splitlines()]
+
+    assert len(bodies) == 87
+    assert all(body["constellation"] == "Orion" for body in bodies)
+
+
+@pytest.mark.asyncio
+async def test_export_bodies_as_csv(client: AsyncClient) -> None:
+    response = await client.get(
+        f"{settings.API_V1_STR}/export/bodies?constellation=orion&format=csv"
+        "&fields=name,ra,dec",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    lines = response.text.splitlines()
+
+    assert lines[0] == "name,ra,dec"
+    assert len(lines) == 88
+
+
+@pytest.mark.asyncio
+async def test_export_bodies_as_arrow(client: AsyncClient) -> None:
+    response = await client.get(
+        f"{settings.API_V1_STR}/export/bodies?constellation=orion&format=arrow"
+        "&fields=uid,name,ra,dec,m",
+        headers={"Host": "perseus.docker.localhost"},
+    )
+
+    assert response.status_code == 200
+
+    table = pa.ipc.open_file(pa.BufferReader(response.content)).read_all()
+
+    assert table.num_rows == 87
+    assert table.schema.names == ["uid", "name", "ra", "dec", "m"]
+    assert table.schema.field("ra").type == pa.float64()
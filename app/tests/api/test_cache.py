@@ -0,0 +1,57 @@
+import pytest
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from app.api.api_v1.params.bodies import BodyQueryParams
+from app.api.cache import ResponseCache, get_normalized_params
+
+
+def test_get_normalized_params():
+    params = get_normalized_params(
+        BodyQueryParams(name=" Andromeda ", ra=10.68470833333, dec=41.26875)
+    )
+
+    assert list(params) == sorted(params)
+
+    assert params["name"] == "andromeda"
+
+    assert params["ra"] == 10.684708
+
+    assert "constellation" not in params
+
+
+@pytest.mark.asyncio
+async def test_response_cache_is_least_recently_used():
+    cache = ResponseCache(maxsize=2)
+
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+
+    assert await cache.get("a") == "1"
+
+    await cache.set("c", "3")
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "1"
+    assert await cache.get("c") == "3"
+
+
+@pytest.mark.asyncio
+async def test_response_cache_expires_entries_in_the_backend(monkeypatch):
+    cache = ResponseCache(maxsize=0, expire=60)
+
+    backend = InMemoryBackend()
+
+    monkeypatch.setattr(FastAPICache, "_init", True)
+    monkeypatch.setattr(FastAPICache, "get_backend", lambda: backend)
+
+    await cache.set("expiring", "1")
+
+    # The entry expires after the response cache expiry, not the global expiry:
+    ttl, response = await backend.get_with_ttl("expiring")
+
+    await backend.clear(key="expiring")
+
+    assert response == "1"
+
+    assert 0 < ttl <= 60
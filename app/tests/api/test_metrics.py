@@ -0,0 +1,98 @@
+from typing import Generator
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+from app.api.api_v1.api import api_router
+from app.core.config import settings
+from app.core.metrics import add_metrics, get_filter_set
+
+ROUTE = "{}/bodies/{{page}}".format(settings.API_V1_STR)
+
+
+@pytest.fixture(scope="module")
+async def metrics_client() -> Generator:
+    # Metrics are opt-in, so are enabled on an app of their own:
+    app = FastAPI()
+
+    app.include_router(api_router, prefix=settings.API_V1_STR)
+
+    add_metrics(app)
+
+    async with AsyncClient(app=app, base_url="https://test") as client:
+        yield client
+
+
+def get_sample_value(name, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_get_filter_set():
+    assert get_filter_set([]) == "none"
+
+    assert get_filter_set([("limit", "20"), ("latitude", "51.4")]) == "none"
+
+    assert (
+        get_filter_set(
+            [("ra", "88.8"), ("dec", "7.4"), ("name", "ori"), ("datetime", "x")]
+        )
+        == "altitude+cone+name"
+    )
+
+    # Empty parameters are not active filters:
+    assert get_filter_set([("name", ""), ("type", "Star")]) == "type"
+
+
+@pytest.mark.asyncio
+async def test_metrics_observes_requests(metrics_client: AsyncClient) -> None:
+    labels = {"route": ROUTE, "filters": "constellation+name"}
+
+    requests = get_sample_value("perseus_request_duration_seconds_count", **labels)
+
+    queries = get_sample_value("perseus_request_database_queries_sum", route=ROUTE)
+
+    lookups = sum(
+        get_sample_value("perseus_cache_requests_total", cache="response", result=r)
+        for r in ("hit", "miss")
+    )
+
+    response = await metrics_client.get(
+        f"{settings.API_V1_STR}/bodies/1",
+        params={"name": "betel", "constellation": "orion"},
+    )
+
+    assert response.status_code == 200
+
+    assert (
+        get_sample_value("perseus_request_duration_seconds_count", **labels)
+        == requests + 1
+    )
+
+    # The page (and its total count, unless cached) is queried from the database:
+    assert (
+        get_sample_value("perseus_request_database_queries_sum", route=ROUTE) > queries
+    )
+
+    assert (
+        sum(
+            get_sample_value("perseus_cache_requests_total", cache="response", result=r)
+            for r in ("hit", "miss")
+        )
+        == lookups + 1
+    )
+
+    response = await metrics_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "perseus_request_duration_seconds_bucket" in response.text
+    assert "perseus_database_pool_connections_in_use" in response.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_disabled_by_default(client: AsyncClient) -> None:
+    response = await client.get("/metrics")
+
+    assert response.status_code == 404
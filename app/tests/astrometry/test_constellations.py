@@ -0,0 +1,34 @@
+import numpy as np
+from astropy import units as u
+from astropy.coordinates import SkyCoord
+
+from app.astrometry.constellations import get_constellation, get_constellations
+
+
+def test_get_constellation():
+    # The Andromeda Galaxy:
+    assert get_constellation(10.684708, 41.26875) == "Andromeda"
+    # The Great Orion Nebula:
+    assert get_constellation(83.82208, -5.39111) == "Orion"
+    # Polaris:
+    assert get_constellation(37.95456, 89.26411) == "Ursa Minor"
+    # ρ Ophiuchi:
+    assert get_constellation(246.39597, -23.44719) == "Ophiuchus"
+    # The celestial poles:
+    assert get_constellation(0, 90) == "Ursa Minor"
+    assert get_constellation(0, -90) == "Octans"
+
+
+def test_get_constellations_matches_astropy():
+    rng = np.random.default_rng(42)
+
+    ra = rng.uniform(0, 360, 20000)
+
+    dec = np.degrees(np.arcsin(rng.uniform(-1, 1, 20000)))
+
+    expected = SkyCoord(ra=ra * u.degree, dec=dec * u.degree).get_constellation()
+
+    expected[expected == "Ophiucus"] = "Ophiuchus"
+
+    # Allow for points within arcseconds of a boundary:
+    assert np.mean(get_constellations(ra, dec) == expected) > 0.9999
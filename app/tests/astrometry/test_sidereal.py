@@ -0,0 +1,58 @@
+import datetime
+
+import numpy as np
+from astropy import units as u
+from astropy.time import Time
+from astropy.utils import iers
+
+from app.astrometry.sidereal import get_local_sidereal_time
+
+
+def get_astropy_local_sidereal_time(dates: np.ndarray, longitudes: np.ndarray):
+    # Never block on an IERS download, where the bundled IERS-B table covers the
+    # dates (and the UT1 scale sidesteps UT1 - UTC altogether):
+    with iers.conf.set_temp("auto_download", False):
+        return (
+            Time(dates, scale="ut1")
+            .sidereal_time("mean", longitude=longitudes * u.deg)
+            .degree
+        )
+
+
+def get_separation(a, b):
+    return np.abs((np.asarray(a) - b + 180) % 360 - 180) * 3600
+
+
+def test_local_sidereal_time_agrees_with_astropy():
+    rng = np.random.default_rng(42)
+
+    seconds = rng.uniform(0, 20 * 365.25 * 86400, 500)
+
+    dates = np.datetime64("2000-01-01T00:00:00", "us") + (seconds * 1e6).astype(
+        "timedelta64[us]"
+    )
+
+    longitudes = rng.uniform(-180, 180, 500)
+
+    expected = get_astropy_local_sidereal_time(dates, longitudes)
+
+    # Vectorized over arrays of datetimes and longitudes, to sub-arcsecond:
+    assert (
+        get_separation(get_local_sidereal_time(dates, longitudes), expected).max() < 1
+    )
+
+    # Memoized per minute for a single datetime, to sub-arcsecond:
+    for date, longitude, lst in zip(dates[:50], longitudes[:50], expected[:50]):
+        date = date.astype(datetime.datetime).replace(tzinfo=datetime.timezone.utc)
+
+        assert get_separation(get_local_sidereal_time(date, longitude), lst) < 1
+
+
+def test_local_sidereal_time_of_aware_datetimes():
+    utc = datetime.datetime(2021, 5, 14, 10, tzinfo=datetime.timezone.utc)
+
+    hst = utc.astimezone(datetime.timezone(datetime.timedelta(hours=-10)))
+
+    assert get_local_sidereal_time(hst, -155.8912) == get_local_sidereal_time(
+        utc, -155.8912
+    )
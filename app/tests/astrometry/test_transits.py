@@ -0,0 +1,71 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from app.astrometry.transits import (
+    RISE_SET_ALTITUDE,
+    SIDEREAL_RATE,
+    get_sidereal_span,
+    get_transit_offsets,
+    get_transiting_ra_ranges,
+)
+
+
+def get_altitude(ra, dec, LST, latitude):
+    ha, dec, lat = np.radians(LST - ra), np.radians(dec), np.radians(latitude)
+
+    return np.degrees(
+        np.arcsin(np.sin(dec) * np.sin(lat) + np.cos(dec) * np.cos(lat) * np.cos(ha))
+    )
+
+
+def test_transit_offsets_are_at_the_meridian_and_horizon():
+    ra = np.array([88.7929, 101.2875, 201.2983, 10.0])
+
+    dec = np.array([7.4071, -16.7161, -11.1613, -20.0])
+
+    LST, latitude = 120.0, 51.4769
+
+    rise, transit, set = get_transit_offsets(ra, dec, LST, latitude)
+
+    # The nearest transit is within half a (sidereal) day:
+    assert np.all(np.abs(transit) <= 0.5)
+
+    np.testing.assert_allclose((LST + transit * SIDEREAL_RATE - ra) % 360, 0, atol=1e-9)
+
+    for offset in (rise, set):
+        np.testing.assert_allclose(
+            get_altitude(ra, dec, LST + offset * SIDEREAL_RATE, latitude),
+            RISE_SET_ALTITUDE,
+            atol=1e-9,
+        )
+
+    np.testing.assert_allclose(set - transit, transit - rise)
+
+
+def test_transit_offsets_of_circumpolar_and_never_rising_bodies():
+    rise, transit, set = get_transit_offsets([37.95, 0.0], [89.26, -80.0], 0, 51.4769)
+
+    assert np.isnan(rise).all() and np.isnan(set).all()
+
+    assert not np.isnan(transit).any()
+
+
+def test_transiting_ra_ranges():
+    assert get_transiting_ra_ranges(10, 20) == [(10, 30)]
+
+    # The interval wraps through an LST of 0 degrees:
+    assert get_transiting_ra_ranges(350, 20) == [(350, 360), (0, 10)]
+
+    assert get_transiting_ra_ranges(725, 400) == [(0, 360)]
+
+    assert get_transiting_ra_ranges(10, -5) == []
+
+
+def test_sidereal_span():
+    start = datetime.datetime(2021, 5, 14, tzinfo=datetime.timezone.utc)
+
+    span = get_sidereal_span(start, start + datetime.timedelta(hours=12))
+
+    assert span == pytest.approx(SIDEREAL_RATE / 2)
@@ -0,0 +1,29 @@
+from app import crud
+from app.benchmark import get_session
+from app.benchmarks import get_cases
+from app.benchmarks.runner import get_statistics
+
+
+def test_get_statistics():
+    statistics = get_statistics([0.001] * 98 + [0.002, 0.010], rows=20)
+
+    assert statistics["iterations"] == 100
+    assert statistics["p50"] == 1.0
+    assert statistics["p95"] == 1.0
+    assert 2.0 <= statistics["p99"] <= 10.0
+    assert round(statistics["throughput"]) == round(100 / 0.11)
+
+
+def test_get_cases_are_unique():
+    names = [case.name for case in get_cases()]
+
+    assert len(names) == len(set(names))
+
+
+def test_get_session_builds_the_name_index_from_its_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(crud.body, "session_factory", None)
+
+    db = get_session("sqlite:///{}".format(tmp_path / "benchmark.db"), seeded=False)
+
+    # The background builds of the name index read the benchmarked database:
+    assert crud.body.get_session_factory()().get_bind() is db.get_bind()
@@ -0,0 +1,16 @@
+from app.benchmarks import measure_import_time
+
+# The budget (in seconds) for a cold import of the app, i.e., the start up cost
+# of every worker (and Cloud Run cold start) before it can serve a request:
+IMPORT_TIME_BUDGET = 2.5
+
+# The modules that only some code paths need, so must be imported lazily:
+LAZY_MODULES = {"astropy", "google.cloud.sql.connector", "pyarrow"}
+
+
+def test_import_app_main_within_budget():
+    timing = measure_import_time("app.main")
+
+    assert timing.seconds < IMPORT_TIME_BUDGET
+
+    assert not LAZY_MODULES & timing.modules
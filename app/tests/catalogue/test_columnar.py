@@ -0,0 +1,145 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app import crud, schemas
+from app.api.api_v1.params.bodies import BodyQueryParams
+from app.catalogue.columnar import ColumnarCatalogue
+from app.core.config import settings
+from app.crud import crud_body
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"ra": 2.294522, "dec": 59.14978},
+        {"name": "betelgeuse"},
+        {"name": "M45"},
+        {"name": "M1"},
+        {"name": "NGC 6530"},
+        {"constellation": "orion"},
+        {"type": "G"},
+        {"catalogue": "Messier"},
+        {
+            "latitude": 19.8968,
+            "longitude": 155.8912,
+            "datetime": "2021-05-14T00:00:00.000Z",
+        },
+        {
+            "latitude": 19.8968,
+            "longitude": -155.8912,
+            "start": "2021-05-14T18:46:50.000-10:00",
+            "end": "2021-05-15T05:49:30.000-10:00",
+        },
+    ],
+)
+def test_columnar_catalogue_matches_the_database(db: Session, params: dict) -> None:
+    catalogue = ColumnarCatalogue()
+
+    catalogue.refresh(db)
+
+    query = BodyQueryParams(**params)
+
+    bodies, count = crud.body.get_multi(db, query_params=query, skip=0, limit=20)
+
+    results, total = catalogue.get_multi(query_params=query, skip=0, limit=20)
+
+    assert total == count
+    assert [b.uid for b in results] == [b.uid for b in bodies]
+
+
+@pytest.mark.parametrize(
+    "params,kwargs",
+    [
+        # The type is matched with LIKE, i.e., case-insensitively and with
+        # wildcards:
+        ({"type": "g"}, {}),
+        ({"type": "_"}, {}),
+        ({"type": "%C%"}, {}),
+        ({"type": "Galaxy"}, {}),
+        ({"constellation": "orion"}, {"count": "none"}),
+        ({"name": "nebula"}, {"fields": ("name", "ra", "dec")}),
+        ({"type": "*"}, {"fields": ("m",), "count": "none"}),
+    ],
+)
+def test_columnar_catalogue_matches_crud_body(
+    db: Session, monkeypatch, params: dict, kwargs: dict
+) -> None:
+    query = BodyQueryParams(**params)
+
+    def get_multi(columnar: bool) -> tuple:
+        monkeypatch.setattr(settings, "USE_COLUMNAR_CATALOGUE", columnar)
+
+        return crud.body.get_multi(db, query_params=query, skip=0, limit=20, **kwargs)
+
+    monkeypatch.setattr(crud_body, "catalogue", ColumnarCatalogue())
+
+    bodies, count = get_multi(columnar=False)
+
+    results, total = get_multi(columnar=True)
+
+    assert total == count
+
+    def serialize(items: list) -> list:
+        fields = kwargs.get("fields")
+
+        model = schemas.get_body_fields_model(fields) if fields else schemas.Body
+
+        return [model.from_orm(item).dict() for item in items]
+
+    assert serialize(results) == serialize(bodies)
+
+    # Only the requested fields (and those of the cursor) are selected:
+    if "fields" in kwargs:
+        assert all(set(r._fields) == set(b._fields) for r, b in zip(results, bodies))
+
+
+def test_columnar_catalogue_reloads_on_a_new_catalogue_version(
+    db: Session, monkeypatch
+) -> None:
+    catalogue = ColumnarCatalogue()
+
+    version = crud.catalogue_version.get(db)
+
+    # A copy loaded before the latest write to the catalogue:
+    catalogue.refresh(db, version - 1)
+
+    monkeypatch.setattr(crud_body, "catalogue", catalogue)
+
+    monkeypatch.setattr(settings, "USE_COLUMNAR_CATALOGUE", True)
+
+    assert catalogue.is_stale(settings.COLUMNAR_CATALOGUE_TTL, version)
+
+    crud.body.get_multi(db, query_params=BodyQueryParams(), skip=0, limit=1)
+
+    assert catalogue.version == version
+
+    assert not catalogue.is_stale(settings.COLUMNAR_CATALOGUE_TTL, version)
+
+
+def test_columnar_catalogue_filters_outside_of_the_lock(
+    db: Session, monkeypatch
+) -> None:
+    catalogue = ColumnarCatalogue()
+
+    catalogue.refresh(db)
+
+    snapshot = catalogue.snapshot
+
+    get_filter_mask = snapshot.get_filter_mask
+
+    def get_unlocked_filter_mask(query_params):
+        # A reload may swap in a new snapshot while this one is being filtered:
+        assert not catalogue._lock.locked()
+
+        catalogue.refresh(db)
+
+        return get_filter_mask(query_params)
+
+    monkeypatch.setattr(snapshot, "get_filter_mask", get_unlocked_filter_mask)
+
+    bodies, total = catalogue.get_multi(query_params=BodyQueryParams(), limit=1)
+
+    assert total == len(snapshot.bodies)
+
+    assert catalogue.snapshot is not snapshot
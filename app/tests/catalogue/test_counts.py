@@ -0,0 +1,26 @@
+from app.api.api_v1.params.bodies import BodyQueryParams
+from app.catalogue.counts import CountCache, get_filter_key
+
+
+def test_filter_key_is_normalized() -> None:
+    a = get_filter_key(BodyQueryParams(constellation=" Orion", type="G", limit=20))
+
+    b = get_filter_key(BodyQueryParams(type="g", constellation="orion", limit=50))
+
+    assert a == b == (("constellation", "orion"), ("type", "g"))
+
+
+def test_count_cache_is_cleared_when_the_catalogue_version_changes() -> None:
+    cache = CountCache(maxsize=2)
+
+    cache.set(1, "a", 10)
+
+    assert cache.get(1, "a") == 10
+    assert cache.get(2, "a") is None
+
+    cache.set(2, "a", 11)
+    cache.set(2, "b", 12)
+    cache.set(2, "c", 13)
+
+    assert cache.get(2, "a") is None
+    assert cache.get(2, "c") == 13
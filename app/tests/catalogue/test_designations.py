@@ -0,0 +1,79 @@
+import pytest
+
+from app.catalogue.designations import (
+    Designation,
+    get_designations,
+    get_stellar_designations,
+    parse_catalogue_numbers,
+    parse_designation,
+)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("M31", Designation("messier", 31)),
+        ("m 31", Designation("messier", 31)),
+        ("Messier 31", Designation("messier", 31)),
+        ("NGC 0224", Designation("ngc", 224)),
+        ("ngc224", Designation("ngc", 224)),
+        ("IC434", Designation("ic", 434)),
+        ("HD358", Designation("hd", 358)),
+        ("HR 15", Designation("hr", 15)),
+        ("HIP 677", Designation("hip", 677)),
+    ],
+)
+def test_parse_designation(value, expected):
+    assert parse_designation(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "Andromeda", "M", "NGC", "M31a", "HD 3 58"])
+def test_parse_designation_unrecognised(value):
+    assert parse_designation(value) is None
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, []),
+        ("", []),
+        ("_", []),
+        ("224", [224]),
+        ("0224", [224]),
+        ("4715.0", [4715]),
+        ("6523, 6530", [6523, 6530]),
+        ("5194,5195", [5194, 5195]),
+    ],
+)
+def test_parse_catalogue_numbers(value, expected):
+    assert parse_catalogue_numbers(value) == expected
+
+
+def test_get_designations():
+    assert get_designations(
+        {"messier": "8", "ngc": "6523, 6530", "ic": None, "hd": "_"}
+    ) == [
+        Designation("messier", 8),
+        Designation("ngc", 6523),
+        Designation("ngc", 6530),
+    ]
+
+
+def test_get_stellar_designations():
+    assert get_stellar_designations("α Orionis", "Orion") == [
+        "α Ori",
+        "Alpha Orionis",
+        "Alpha Ori",
+    ]
+
+    assert get_stellar_designations("61 Cygni", "Cygnus") == ["61 Cyg"]
+
+    assert "Upsilon2 Cas" in get_stellar_designations("υ² Cassiopeiae", "Cassiopeia")
+
+
+@pytest.mark.parametrize(
+    "name,constellation",
+    [("The Crab Nebula", "Taurus"), ("Betelgeuse", "Orion"), ("α Orionis", None)],
+)
+def test_get_stellar_designations_unrecognised(name, constellation):
+    assert get_stellar_designations(name, constellation) == []
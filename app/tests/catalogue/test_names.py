@@ -0,0 +1,84 @@
+from sqlalchemy.orm import Session
+
+from app.catalogue.names import NameIndex, fold, get_ngrams
+from app.db.session import SessionLocal
+from app.models.body import Body
+
+
+def test_get_ngrams() -> None:
+    assert get_ngrams("vega", 3) == {"veg", "ega"}
+
+    assert get_ngrams("ve", 3) == set()
+
+
+def test_fold() -> None:
+    assert fold("Mérope") == "merope"
+
+    assert fold("Ångström") == "angstrom"
+
+
+def test_name_index_matches_substrings_case_insensitively(db: Session) -> None:
+    index = NameIndex()
+
+    index.refresh(db, version=1)
+
+    uids = index.search("BETE")
+
+    assert [db.get(Body, uid).iau for uid in uids] == ["Betelgeuse"]
+
+    assert index.search("xyzzy") == []
+
+
+def test_name_index_ranks_exact_then_prefix_then_substring(db: Session) -> None:
+    index = NameIndex()
+
+    index.refresh(db, version=1)
+
+    bodies = [db.get(Body, uid) for uid in index.search("messier 3")]
+
+    # The exact match first, then the prefix matches, i.e., Messier 30 to 39:
+    assert bodies[0].iau == "Messier 3"
+
+    assert {b.iau for b in bodies[1:]} == {
+        "Messier {}".format(n) for n in range(30, 40)
+    }
+
+
+def test_name_index_matches_accents_insensitively(db: Session) -> None:
+    index = NameIndex()
+
+    index.refresh(db, version=1)
+
+    uids = index.search("Bételgeuse")
+
+    assert [db.get(Body, uid).iau for uid in uids] == ["Betelgeuse"]
+
+    assert index.filter("Bételgeuse") == uids
+
+
+def test_name_index_filter_matches_names_not_designations(db: Session) -> None:
+    index = NameIndex()
+
+    index.refresh(db, version=1)
+
+    # The list name filter has the LIKE semantics, i.e., the name or IAU name
+    # contains the name, whereas "M31" is only a catalogue designation:
+    assert index.search("m31") != []
+
+    assert index.filter("m31") == []
+
+    assert {db.get(Body, uid).iau for uid in index.filter("messier 31")} == {
+        "Messier 31"
+    }
+
+
+def test_name_index_schedule_refresh_builds_in_the_background() -> None:
+    index = NameIndex()
+
+    builder = index.schedule_refresh(SessionLocal, version=1)
+
+    builder.join()
+
+    assert index.is_current(1)
+
+    assert not index.is_current(2)
@@ -0,0 +1,49 @@
+import logging
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.catalogue.suggestions import SuggestionIndex
+from app.main import preload_index
+
+
+def test_suggestion_index_matches_prefixes_brightest_first(db: Session) -> None:
+    index = SuggestionIndex()
+
+    index.refresh(db, version=1)
+
+    suggestions = index.suggest("bet", limit=3)
+
+    assert [s.iau for s in suggestions] == ["Rigel", "Betelgeuse", "Hadar"]
+
+    magnitudes = [s.m for s in suggestions]
+
+    assert magnitudes == sorted(magnitudes)
+
+
+def test_suggestion_index_matches_designation_forms(db: Session) -> None:
+    index = SuggestionIndex()
+
+    index.refresh(db, version=1)
+
+    assert [(s.text, s.iau) for s in index.suggest("α Ori")] == [
+        ("α Ori", "Betelgeuse")
+    ]
+
+    # The exact match is suggested ahead of any (brighter) prefix match:
+    assert [s.iau for s in index.suggest("M3", limit=2)] == [
+        "Messier 3",
+        "Messier 31",
+    ]
+
+    assert index.suggest("xyzzy") == []
+
+
+def test_preload_index_survives_an_unreachable_database(caplog) -> None:
+    def refresh_suggestion_index(db: Session) -> None:
+        raise OperationalError("SELECT 1", {}, Exception("Connection refused"))
+
+    with caplog.at_level(logging.WARNING, logger="app.main"):
+        preload_index(refresh_suggestion_index)
+
+    assert "Preloading refresh_suggestion_index failed" in caplog.text
@@ -0,0 +1,81 @@
+import logging
+
+from app import crud
+from app.api.api_v1.params.bodies import BodyQueryParams
+from app.catalogue.counts import count_cache
+from app.core.config import settings
+from app.core.timing import RequestTiming, enable_sql_timing, request_timing, sql_stage
+
+
+def get_query_params(**kwargs) -> BodyQueryParams:
+    params = {name: None for name in BodyQueryParams.__fields__}
+
+    return BodyQueryParams(**{**params, **kwargs})
+
+
+def test_get_server_timing():
+    timing = RequestTiming()
+
+    with sql_stage("count"):
+        timing.add(0.0121)
+
+    # The stage is only set on the timing of the current request:
+    assert timing.stage == "other"
+
+    token = request_timing.set(timing)
+
+    try:
+        with sql_stage("count"):
+            timing.add(0.0121)
+
+            with sql_stage("page"):
+                timing.add(0.002)
+                timing.add(0.0025)
+
+            assert timing.stage == "count"
+    finally:
+        request_timing.reset(token)
+
+    assert timing.get_server_timing(0.05) == ", ".join(
+        [
+            'db-other;dur=12.1;desc="1 statement"',
+            'db-count;dur=12.1;desc="1 statement"',
+            'db-page;dur=4.5;desc="2 statements"',
+            "total;dur=50.0",
+        ]
+    )
+
+
+def test_sql_timing_attributes_statements_to_stages(db, monkeypatch, caplog):
+    enable_sql_timing()
+
+    count_cache.clear()
+
+    # Every statement is slow, so that each (SELECT) is logged with its plan:
+    monkeypatch.setattr(settings, "SQL_SLOW_STATEMENT_SECONDS", 0)
+
+    timing = RequestTiming()
+
+    token = request_timing.set(timing)
+
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.core.timing"):
+            bodies, total = crud.body.get_multi(
+                db,
+                query_params=get_query_params(name="orion", limit=5),
+                limit=5,
+            )
+    finally:
+        request_timing.reset(token)
+
+    assert len(bodies) <= total
+
+    assert timing.statements["count"] >= 1
+    assert timing.statements["page"] == 1
+
+    assert "db-page;dur=" in timing.get_server_timing()
+
+    assert any(
+        "in the page stage" in record.getMessage() and "plan: [" in record.getMessage()
+        for record in caplog.records
+    )
@@ -0,0 +1,180 @@
+import importlib.util
+import logging
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import mysql
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import crud, schemas
+from app.api.api_v1.params.bodies import BodyQueryParams
+from app.catalogue.counts import count_cache
+from app.db.base import Base
+from app.models.body import Body, get_position_columns
+from app.models.designation import BodyDesignation
+from app.update_constellations import main as update_constellations
+from app.utils import ROOT_DIR
+
+BODY = {
+    "name": "The Andromeda Galaxy",
+    "iau": "Messier 31",
+    "ra": 10.684708,
+    "dec": 41.26875,
+    "constellation": "Andromeda",
+    "type": "G",
+    "m": 3.44,
+    "messier": "31",
+    "ngc": "224",
+}
+
+
+def test_get_bulk_row_defaults():
+    row = crud.body.get_bulk_row(BODY)
+
+    assert row["hd"] is None
+
+    assert row["simbad"] is None
+
+    assert set(row) >= set(schemas.BodyCreate.__fields__)
+
+
+def test_get_bulk_row_position_columns():
+    row = crud.body.get_bulk_row(BODY)
+
+    for column, value in get_position_columns(BODY["ra"], BODY["dec"]).items():
+        assert row[column] == value
+
+
+def test_create_multi_round_trip(db):
+    name = "Round Trip Galaxy"
+
+    body = {**BODY, "name": name, "M": -21.5, "d": 765.0}
+
+    # Both pre-validated dicts and BodyCreate models are inserted:
+    assert crud.body.create_multi(db, [body, schemas.BodyCreate(**body)]) == 2
+
+    try:
+        created = db.query(Body).filter(Body.name == name).all()
+
+        assert len(created) == 2
+
+        for row in created:
+            # Attributes stored under a different column name are not dropped,
+            # e.g., "m" as "apparent_magnitude":
+            assert row.m == body["m"]
+            assert row.M == body["M"]
+            assert row.d == body["d"]
+
+            assert row.messier == body["messier"]
+            assert row.healpix is not None
+    finally:
+        uids = db.query(Body.uid).filter(Body.name == name)
+
+        db.query(BodyDesignation).filter(BodyDesignation.body_uid.in_(uids)).delete(
+            synchronize_session=False
+        )
+
+        db.query(Body).filter(Body.name == name).delete(synchronize_session=False)
+
+        db.commit()
+
+
+def test_keyset_index_matches_the_sort_key():
+    path = os.path.join(
+        ROOT_DIR,
+        "alembic",
+        "versions",
+        "3c8f1a7b5d20_feat_added_keyset_index_to_body_model.py",
+    )
+
+    spec = importlib.util.spec_from_file_location("keyset_index", path)
+
+    migration = importlib.util.module_from_spec(spec)
+
+    spec.loader.exec_module(migration)
+
+    def compile(expression) -> str:
+        return str(
+            expression.compile(
+                dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+
+    # MySQL only uses the functional index for an identical sort key expression:
+    assert compile(crud.body.get_type_rank()) == migration.TYPE_RANK
+    assert compile(crud.body.get_magnitude()) == migration.MAGNITUDE
+
+
+def test_get_explain_statement_renders_expanding_parameters(db):
+    query = db.query(Body).filter(
+        Body.uid.in_(["a", "b", "c"]), Body.name.like("%orion%")
+    )
+
+    statement, params = crud.body.get_explain_statement(query, mysql.pymysql.dialect())
+
+    assert statement.startswith("EXPLAIN SELECT")
+    assert "POSTCOMPILE" not in statement
+
+    # The (positional) parameters are in the order of their placeholders:
+    assert statement.count("%s") == len(params)
+    assert params == ("a", "b", "c", "%orion%")
+
+
+def test_get_count_logs_a_failed_estimate(db, caplog, monkeypatch):
+    count_cache.clear()
+
+    query = db.query(Body).filter(Body.constellation.like("%orion%"))
+
+    params = BodyQueryParams(constellation="orion")
+
+    def get_estimated_count(db, query):
+        raise DBAPIError("EXPLAIN", (), Exception("EXPLAIN is not supported"))
+
+    # Fail the estimate on any dialect, e.g., SQLite (no EXPLAIN) or MySQL:
+    monkeypatch.setattr(crud.body, "get_estimated_count", get_estimated_count)
+
+    with caplog.at_level(logging.WARNING, logger="app.crud.crud_body"):
+        count = crud.body.get_count(db, query, query_params=params, mode="estimate")
+
+    assert count == query.count()
+
+    assert "Estimated count failed" in caplog.text
+
+
+@pytest.fixture
+def scratch_db():
+    """
+    An empty in-memory catalogue, for tests that rewrite every body.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+
+    Base.metadata.create_all(engine)
+
+    db = sessionmaker(bind=engine)()
+
+    yield db
+
+    db.close()
+
+    engine.dispose()
+
+
+def test_update_constellations_in_batches(scratch_db, monkeypatch):
+    orion = {**BODY, "name": "Misplaced", "ra": 88.0, "dec": 5.0}
+
+    crud.body.create_multi(scratch_db, [BODY, {**orion, "constellation": "Lyra"}])
+
+    monkeypatch.setattr("app.update_constellations.SessionLocal", lambda: scratch_db)
+
+    monkeypatch.setattr("sys.argv", ["update_constellations", "--batch-size", "1"])
+
+    update_constellations()
+
+    constellations = dict(scratch_db.query(Body.name, Body.constellation).all())
+
+    assert constellations == {"The Andromeda Galaxy": "Andromeda", "Misplaced": "Orion"}
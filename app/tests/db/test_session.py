@@ -0,0 +1,91 @@
+import pytest
+from google.cloud.sql import connector as cloud_sql
+
+from app.core.config import settings
+from app.db import session
+
+
+class StandInConnector:
+    """
+    A local stand-in for the Cloud SQL Python Connector, which records its
+    instances and connections rather than connecting to Cloud SQL.
+    """
+
+    instances = []
+
+    def __init__(self, **kwargs) -> None:
+        self.connections = []
+
+        self.closed = False
+
+        StandInConnector.instances.append(self)
+
+    def connect(self, instance, driver, **kwargs):
+        connection = (instance, driver, kwargs)
+
+        self.connections.append(connection)
+
+        return connection
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def stand_in_connector(monkeypatch):
+    StandInConnector.instances = []
+
+    monkeypatch.setattr(cloud_sql, "Connector", StandInConnector)
+
+    monkeypatch.setattr(session, "connector", None)
+
+    yield StandInConnector
+
+    session.close_connector()
+
+
+def test_getconn_reuses_one_connector_per_process(stand_in_connector):
+    for _ in range(3):
+        instance, driver, kwargs = session.getconn()
+
+        assert instance == settings.MYSQL_INSTANCE_CONNECTION_NAME
+        assert driver == "pymysql"
+
+    assert len(stand_in_connector.instances) == 1
+
+    connector = stand_in_connector.instances[0]
+
+    assert len(connector.connections) == 3
+
+    session.close_connector()
+
+    assert connector.closed
+
+    # A new connector is only created on the next connection after closing:
+    session.getconn()
+
+    assert len(stand_in_connector.instances) == 2
+
+
+def test_get_pool_options(monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_POOL_SIZE", 20)
+
+    monkeypatch.setattr(settings, "DATABASE_POOL_PRE_PING", False)
+
+    options = session.get_pool_options("mysql+pymysql://")
+
+    assert options["pool_size"] == 20
+    assert options["pool_pre_ping"] is False
+    assert options["max_overflow"] == settings.DATABASE_MAX_OVERFLOW
+    assert options["pool_recycle"] == settings.DATABASE_POOL_RECYCLE
+    assert options["pool_timeout"] == settings.DATABASE_POOL_TIMEOUT
+
+    # The checkout of every connection is timed:
+    assert options["poolclass"] is session.MonitoredQueuePool
+
+    options = session.get_pool_options("mysql+aiomysql://")
+
+    assert options["poolclass"] is session.MonitoredAsyncAdaptedQueuePool
+
+    # SQLite has no connection pool to size:
+    assert "pool_size" not in session.get_pool_options("sqlite:///benchmark.db")
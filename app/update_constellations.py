@@ -0,0 +1,40 @@
+import argparse
+import logging
+
+from app import crud
+from app.core.config import settings
+from app.db.session import SessionLocal
+
+logging.basicConfig(level=logging.INFO)
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Recompute the constellation of every body from its right "
+        "ascension and declination, e.g., after a change to the boundary grid."
+    )
+
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.CONSTELLATION_BATCH_SIZE
+    )
+
+    args = parser.parse_args()
+
+    db = SessionLocal()
+
+    logger.info("Updating Constellations Started")
+
+    try:
+        count = crud.body.update_constellations(
+            db, batch_size=args.batch_size, logger=logger
+        )
+    finally:
+        db.close()
+
+    logger.info("Updated {} Constellations".format(count))
+
+
+if __name__ == "__main__":
+    main()
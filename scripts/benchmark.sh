@@ -0,0 +1,2 @@
+#!/bin/sh
+python app/benchmark.py "$@"
\ No newline at end of file
@@ -0,0 +1,2 @@
+#!/bin/sh
+python app/update_constellations.py "$@"
\ No newline at end of file